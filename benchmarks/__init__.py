@@ -0,0 +1 @@
+"""Micro-benchmarks (run as modules, e.g. `python -m benchmarks.bench_engagement`)."""
@@ -0,0 +1,42 @@
+"""Benchmark the vectorised engagement scorer on a synthetic corpus.
+
+Usage:
+    python -m benchmarks.bench_engagement [N]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.scoring.engagement import engagement_scores
+
+
+def main(n: int = 1_000_000) -> None:
+    rng = np.random.default_rng(0)
+    now = datetime.now(timezone.utc).timestamp()
+    columns = (
+        rng.integers(0, 50_000, n),
+        rng.integers(0, 10_000, n),
+        rng.integers(0, 2_000, n),
+        rng.integers(0, 5_000, n),
+        rng.integers(0, 10_000_000, n),
+        rng.integers(0, 100_000, n),
+        rng.random(n) < 0.3,
+        now - rng.integers(0, 6_000, n) * 86_400.0,
+    )
+
+    start = time.perf_counter()
+    scores, keep = engagement_scores(*columns, now=now)
+    order = np.argsort(-scores[keep], kind="stable")
+    elapsed = time.perf_counter() - start
+
+    print(f"engagement_scores: {n:,} tweets in {elapsed * 1000:.1f} ms "
+          f"({n / elapsed / 1e6:.1f} M tweets/s, {len(order):,} kept)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,83 @@
+"""Benchmark raw-JSON page parsing against the tweepy-object path.
+
+Usage:
+    python -m benchmarks.bench_parse [PAGES]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import tweepy
+
+from src.nodes.fetch_tweets import _page_tweets, _parse_tweet
+
+
+def synthetic_page(page: int, size: int = 100, authors: int = 60) -> dict:
+    """Return a realistic v2 recent-search page with ``size`` tweets."""
+    users = [
+        {
+            "id": str(10_000 + page * authors + j),
+            "name": f"Author {j}",
+            "username": f"author_{page}_{j}",
+            "created_at": "2016-05-04T10:00:00.000Z",
+            "description": "Covering the NFL. Former beat reporter. Opinions my own.",
+            "verified": j % 4 == 0,
+            "public_metrics": {
+                "followers_count": 1_000 * (j + 1), "following_count": 300,
+                "tweet_count": 25_000, "listed_count": 40,
+            },
+        }
+        for j in range(authors)
+    ]
+    text = "What a finish in Kansas City tonight. That fourth-quarter drive was unreal. "
+    quoted = [{"type": "quoted", "id": "1799999999999999999"}]
+    data = [
+        {
+            "id": str(1_800_000_000_000_000_000 + page * size + i),
+            "text": text * 2,
+            "author_id": users[i % authors]["id"],
+            "created_at": "2026-01-05T02:15:00.000Z",
+            "conversation_id": str(1_800_000_000_000_000_000 + page * size + i),
+            "edit_history_tweet_ids": [str(1_800_000_000_000_000_000 + page * size + i)],
+            "public_metrics": {
+                "like_count": 120 + i, "retweet_count": 30, "reply_count": 12,
+                "quote_count": 4, "bookmark_count": 2, "impression_count": 9_000,
+            },
+            "referenced_tweets": quoted if i % 5 == 0 else [],
+            "context_annotations": [
+                {"domain": {"id": "11", "name": "Sport"}, "entity": {"id": "1", "name": "NFL"}},
+                {"domain": {"id": "12", "name": "Team"}, "entity": {"id": "2", "name": "Chiefs"}},
+            ],
+        }
+        for i in range(size)
+    ]
+    return {"data": data, "includes": {"users": users}, "meta": {"result_count": size}}
+
+
+def tweepy_path(payload: dict) -> list:
+    """The pre-fast-path parse: tweepy objects, then validated pydantic models."""
+    users_map = {}
+    for u in payload["includes"]["users"]:
+        user = tweepy.User(u)
+        users_map[user.id] = user
+    return [_parse_tweet(tweepy.Tweet(d), users_map) for d in payload["data"]]
+
+
+def _throughput(fn, pages: list[dict]) -> float:
+    start = time.perf_counter()
+    count = sum(len(fn(p)) for p in pages)
+    return count / (time.perf_counter() - start)
+
+
+def main(n_pages: int = 200) -> None:
+    pages = [synthetic_page(p) for p in range(n_pages)]
+    slow = _throughput(tweepy_path, pages)
+    fast = _throughput(_page_tweets, pages)
+    print(f"tweepy objects + validation : {slow:>10,.0f} tweets/s")
+    print(f"raw JSON fast path          : {fast:>10,.0f} tweets/s  ({fast / slow:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
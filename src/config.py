@@ -21,12 +21,59 @@ class Settings(BaseSettings):
     # ── Output ────────────────────────────────────────────
     output_dir: str = "output"
 
+    # ── Fetching ──────────────────────────────────────────
+    fetch_concurrency: int = 4
+    fetch_window_hours: int = 12
+    incremental_fetch: bool = False
+    ingest_state_dir: str = ".cache/ingest"
+    rate_limit_default_per_window: int = 180
+    rate_limit_max_wait_seconds: float = 900.0
+    search_cache_mode: str = "off"         # off / readwrite / replay
+    search_cache_dir: str = ".cache/search"
+    search_cache_ttl_seconds: float = 3600.0
+    search_cache_max_mb: int = 256
+
+    # ── LLM stages ────────────────────────────────────────
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+    llm_keepalive_expiry_seconds: float = 60.0
+    llm_timeout_seconds: float = 120.0
+    llm_connect_timeout_seconds: float = 10.0
+    llm_prewarm: bool = True
+    llm_prewarm_connections: int = 4        # capped at llm_max_keepalive_connections
+    llm_cache_mode: str = "off"            # off / readwrite / readonly
+    llm_cache_path: str = ".cache/llm.sqlite"
+    llm_cache_ttl_seconds: float = 7 * 24 * 3600.0
+    llm_cache_max_entries: int = 10_000
+    sentiment_mode: str = "cascade"         # lexicon / cascade / llm
+    sentiment_lexicon_min_confidence: float = 0.6
+    sentiment_max_concurrency: int = 4
+    sentiment_batch_input_tokens: int = 8000
+    sentiment_batch_output_tokens: int = 4096
+    sentiment_store_path: str = ""          # empty = don't reuse results across runs
+    sentiment_store_ttl_hours: float = 48.0
+
     # ── Tuning ────────────────────────────────────────────
     min_engagement_score: float = 15.0
     min_credibility_score: float = 25.0
+    credibility_cache_size: int = 50_000
+    credibility_cache_path: str = ""
+    dedup_enabled: bool = True
+    dedup_threshold: float = 0.8            # estimated Jaccard similarity of 5-gram shingles
     max_tweets_per_query: int = 200
+    max_tweets_total: int = 5000
     num_narratives: int = 5
+    narrative_cluster_count: int = 0        # 0 = pick from the number of tweets
+    cluster_representatives: int = 3
     script_target_minutes: int = 10
+    script_streaming: bool = False
+    script_generation_mode: str = "single"  # single / sections
+    script_section_concurrency: int = 9
+    script_candidates: int = 1              # >1: write and check N scripts at once, keep the best
+    script_targeted_retry: bool = True      # on retry, rewrite only the sections the check flagged
+    checkpoint_path: str = ".cache/checkpoints.sqlite"  # empty = no checkpoints / --resume
+    quality_local_fail_score: float = 50.0  # below: fail without the LLM review
+    quality_local_pass_score: float = 90.0  # at/above with no issues: skip the LLM
 
 
 settings = Settings()  # type: ignore[call-arg]
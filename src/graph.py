@@ -1,28 +1,35 @@
 """LangGraph agent — the compiled pipeline graph.
 
 Graph flow:
-  Fetch → Score → Filter → Cluster → Extract → Outline → Generate → Validate
-                                                                       ↓
-                                                              (retry if failed)
+          ┌→ Engagement ─┐                             ┌→ Outline ─┐
+  Fetch ──┤              ├→ Filter → Cluster → Extract ┤           ├→ Generate → Validate
+          └→ Credibility ┘                             └→ Samples ─┘              ↓
+                                                                         (retry if failed)
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Sequence
 
-from langgraph.graph import END, StateGraph
+from langgraph.graph import END, START, StateGraph
 
+from src.config import settings
 from src.models.state import AgentState
 from src.nodes import (
     credibility_filter_node,
+    credibility_scoring_node,
     engagement_scoring_node,
     fetch_tweets_node,
     narrative_extraction_node,
     quality_check_node,
+    script_candidates_node,
     script_generation_node,
     script_outline_node,
+    select_samples_node,
     sentiment_clustering_node,
 )
+from src.utils.timing import timed
 
 logger = logging.getLogger(__name__)
 
@@ -55,42 +62,143 @@ def _increment_retry(state: AgentState) -> dict:
     return {"retry_count": state.get("retry_count", 0) + 1}
 
 
+# ── Parallel branches ─────────────────────────────────────────
+
+# Independent stages that run side by side, and the node that joins them
+SCORING_BRANCHES = ("engagement_scoring", "credibility_scoring")
+SCORING_JOIN = "credibility_filter"
+DRAFTING_BRANCHES = ("script_outline", "select_samples")
+DRAFTING_JOIN = "script_generation"
+
+
+def add_parallel(
+    graph: StateGraph, branches: Sequence[str], join: str, *, after: str | None = None,
+) -> None:
+    """Run ``branches`` concurrently (after ``after``, if given) and wait for all at ``join``.
+
+    Branches write disjoint state keys, or keys whose reducer combines
+    concurrent writes (e.g. ``node_timings``).
+    """
+    if after is not None:
+        for branch in branches:
+            graph.add_edge(after, branch)
+    graph.add_edge(list(branches), join)
+
+
+def _route_after_fetch(state: AgentState) -> list[str] | str:
+    """Fan out to both scoring branches, or stop if nothing was fetched."""
+    return list(SCORING_BRANCHES) if _has_tweets(state) == "continue" else END
+
+
+# ── Resume ────────────────────────────────────────────────────
+
+_LINEAR = {
+    "credibility_filter": "sentiment_clustering",
+    "sentiment_clustering": "narrative_extraction",
+    "increment_retry": "script_generation",
+}
+
+
+def resume_entry(completed: list[str], state: AgentState) -> list[str] | None:
+    """Return the node(s) a run should restart from, or None if it already finished.
+
+    ``completed`` lists the run's finished nodes in order; routing after the
+    last one follows the same conditional edges as the graph. A parallel
+    group restarts as a whole unless every branch finished, since its join
+    waits for all of them.
+    """
+    if not completed:
+        return ["fetch_tweets"]
+    last = completed[-1]
+    for branches, join in ((SCORING_BRANCHES, SCORING_JOIN), (DRAFTING_BRANCHES, DRAFTING_JOIN)):
+        if last in branches:
+            return [join] if set(branches) <= set(completed) else list(branches)
+    if last == "fetch_tweets":
+        return list(SCORING_BRANCHES) if _has_tweets(state) == "continue" else None
+    if last == "narrative_extraction":
+        return list(DRAFTING_BRANCHES)
+    if last == "quality_check" or (
+        last == "script_generation" and settings.script_candidates > 1
+    ):
+        return ["increment_retry"] if _should_retry_or_end(state) == "retry" else None
+    if last == "script_generation":
+        return ["quality_check"]
+    nxt = _LINEAR.get(last)
+    return [nxt] if nxt else None
+
+
+def _recorded(
+    name: str, node: Callable[[AgentState], dict], on_node: Callable[[str, dict], None],
+) -> Callable[[AgentState], dict]:
+    """Wrap a node so its update is handed to ``on_node`` once it completes."""
+
+    def run(state: AgentState) -> dict:
+        update = node(state)
+        on_node(name, update)
+        return update
+
+    run.__name__ = getattr(node, "__name__", name)
+    return run
+
+
 # ── Graph construction ────────────────────────────────────────
 
-def build_graph() -> StateGraph:
-    """Construct and return the compiled LangGraph pipeline."""
+def build_graph(
+    *,
+    entry: str | Sequence[str] = "fetch_tweets",
+    on_node: Callable[[str, dict], None] | None = None,
+) -> StateGraph:
+    """Construct and return the compiled LangGraph pipeline.
+
+    ``entry`` starts the run at later node(s) (used to resume from a
+    checkpoint); ``on_node`` is called with each node's name and update as
+    it completes. Every node's update carries its ``node_timings``.
+    """
     graph = StateGraph(AgentState)
 
+    def add(name: str, node: Callable[[AgentState], dict]) -> None:
+        node = timed(name, node)
+        graph.add_node(name, node if on_node is None else _recorded(name, node, on_node))
+
     # Register nodes
-    graph.add_node("fetch_tweets", fetch_tweets_node)
-    graph.add_node("engagement_scoring", engagement_scoring_node)
-    graph.add_node("credibility_filter", credibility_filter_node)
-    graph.add_node("sentiment_clustering", sentiment_clustering_node)
-    graph.add_node("narrative_extraction", narrative_extraction_node)
-    graph.add_node("script_outline", script_outline_node)
-    graph.add_node("script_generation", script_generation_node)
-    graph.add_node("quality_check", quality_check_node)
-    graph.add_node("increment_retry", _increment_retry)
+    add("fetch_tweets", fetch_tweets_node)
+    add("engagement_scoring", engagement_scoring_node)
+    add("credibility_scoring", credibility_scoring_node)
+    add("credibility_filter", credibility_filter_node)
+    add("sentiment_clustering", sentiment_clustering_node)
+    add("narrative_extraction", narrative_extraction_node)
+    add("script_outline", script_outline_node)
+    add("select_samples", select_samples_node)
+    add("increment_retry", _increment_retry)
+    if settings.script_candidates > 1:
+        # Candidates are written and checked inside one node
+        add("script_generation", script_candidates_node)
+        checked = "script_generation"
+    else:
+        add("script_generation", script_generation_node)
+        add("quality_check", quality_check_node)
+        checked = "quality_check"
 
     # Set entry point
-    graph.set_entry_point("fetch_tweets")
-
-    # Linear flow with early-abort after fetch
-    graph.add_conditional_edges(
-        "fetch_tweets",
-        _has_tweets,
-        {"continue": "engagement_scoring", "abort": END},
-    )
-    graph.add_edge("engagement_scoring", "credibility_filter")
+    entries = [entry] if isinstance(entry, str) else list(entry)
+    if len(entries) == 1:
+        graph.set_entry_point(entries[0])
+    else:
+        graph.add_conditional_edges(START, lambda _state: entries, entries)
+
+    # Fetch, then score engagement and author credibility side by side
+    graph.add_conditional_edges("fetch_tweets", _route_after_fetch, [*SCORING_BRANCHES, END])
+    add_parallel(graph, SCORING_BRANCHES, SCORING_JOIN)
     graph.add_edge("credibility_filter", "sentiment_clustering")
     graph.add_edge("sentiment_clustering", "narrative_extraction")
-    graph.add_edge("narrative_extraction", "script_outline")
-    graph.add_edge("script_outline", "script_generation")
-    graph.add_edge("script_generation", "quality_check")
+    # Draft the outline while sample tweets are picked
+    add_parallel(graph, DRAFTING_BRANCHES, DRAFTING_JOIN, after="narrative_extraction")
+    if checked != "script_generation":
+        graph.add_edge("script_generation", checked)
 
     # Retry loop
     graph.add_conditional_edges(
-        "quality_check",
+        checked,
         _should_retry_or_end,
         {"end": END, "retry": "increment_retry"},
     )
@@ -3,6 +3,7 @@
 Usage:
     python -m src.main
     python -m src.main --dry-run   (uses mock data instead of live API)
+    python -m src.main --resume <run_id>   (continue a failed run from its checkpoints)
 """
 
 from __future__ import annotations
@@ -15,11 +16,22 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from src.config import settings
-from src.graph import build_graph
+from src.graph import build_graph, resume_entry
+from src.models.batch import TweetBatch
 from src.models.state import AgentState
 from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.nodes import (
+    narrative_extraction,
+    quality_check,
+    script_generation,
+    script_outline,
+    sentiment_clustering,
+)
+from src.utils.checkpoint import CheckpointStore, new_run_id
+from src.utils.llm import close_llm_clients, get_llm_cache, prewarm_llm
 from src.utils.logging import setup_logging
 from src.utils.output import save_script
+from src.utils.timing import timing_report
 
 logger = logging.getLogger(__name__)
 
@@ -161,30 +173,71 @@ def _mock_tweets() -> list[Tweet]:
     return tweets
 
 
-def run(*, dry_run: bool = False) -> None:
-    """Execute the full pipeline."""
+def run(*, dry_run: bool = False, resume: str | None = None) -> None:
+    """Execute the full pipeline, or continue run ``resume`` from its checkpoints."""
     setup_logging(settings.log_level)
     logger.info("🏈 NFL Script Generator — starting pipeline")
 
-    graph = build_graph()
+    store = CheckpointStore(settings.checkpoint_path) if settings.checkpoint_path else None
+    if resume and store is None:
+        logger.error("❌ --resume needs CHECKPOINT_PATH to be set")
+        sys.exit(1)
+
+    if settings.llm_prewarm:
+        prewarm_llm(
+            [
+                sentiment_clustering._build_llm,
+                narrative_extraction._build_llm,
+                script_outline._build_llm,
+                script_generation._build_llm,
+                script_generation._build_section_llm,
+                script_generation._build_stitch_llm,
+                quality_check._build_llm,
+            ],
+            # Connections past the keep-alive limit would be closed straight away
+            connections=min(
+                settings.llm_prewarm_connections, settings.llm_max_keepalive_connections,
+            ),
+        )
 
     # Build initial state
     initial_state: dict = {
-        "tweets_raw": _mock_tweets() if dry_run else [],
-        "tweets_scored": [],
+        "tweets_raw": TweetBatch.from_tweets(_mock_tweets()) if dry_run else TweetBatch.empty(),
+        "tweets_scored": TweetBatch.empty(),
+        "credibility_scores": {},
         "tweets_filtered": [],
         "sentiment_clusters": [],
+        "tweet_clusters": [],
         "dominant_narratives": [],
         "script_outline": None,
+        "sample_tweets": "",
         "final_script": None,
         "quality_passed": False,
         "quality_feedback": "",
         "messages": [],
         "error": "",
         "retry_count": 0,
+        "node_timings": {},
     }
 
-    if dry_run:
+    entry: list[str] | None = ["fetch_tweets"]
+    run_id = resume or new_run_id()
+    if resume:
+        try:
+            initial_state, completed = store.load(resume, initial_state)
+        except KeyError:
+            logger.error("❌ No checkpoints found for run %s", resume)
+            sys.exit(1)
+        entry = resume_entry(completed, initial_state)
+        logger.info(
+            "⏯️  Resuming run %s after %s (%d nodes restored) → %s",
+            run_id, completed[-1], len(completed),
+            ", ".join(entry) if entry else "already complete",
+        )
+    elif store is not None:
+        logger.info("Run id %s — resume with `python -m src.main --resume %s`", run_id, run_id)
+
+    if dry_run and not resume:
         logger.info("🧪 DRY RUN — using mock tweet data (skipping X API)")
         # In dry-run, we skip the fetch node by pre-populating tweets_raw.
         # The graph still starts at fetch, but fetch will see tweets_raw
@@ -192,7 +245,31 @@ def run(*, dry_run: bool = False) -> None:
         # override the fetch node entirely.
 
     # Run the graph
-    final_state = graph.invoke(initial_state)
+    final_state = initial_state
+    try:
+        if entry is not None:
+            graph = build_graph(
+                entry=entry, on_node=store.recorder(run_id) if store is not None else None,
+            )
+            final_state = graph.invoke(initial_state)
+    except Exception:
+        if store is not None:
+            logger.error("   Resume with `python -m src.main --resume %s`", run_id)
+        raise
+    finally:
+        close_llm_clients()
+        if store is not None:
+            store.close()
+
+    if final_state.get("node_timings"):
+        logger.info("⏱️  %s", timing_report(final_state["node_timings"]))
+
+    llm_cache = get_llm_cache()
+    if llm_cache.enabled:
+        logger.info(
+            "LLM cache (%s): %d hits, %d misses (%.0f%% hit rate)",
+            llm_cache.mode, llm_cache.hits, llm_cache.misses, llm_cache.hit_rate * 100,
+        )
 
     # Output
     script = final_state.get("final_script")
@@ -205,6 +282,8 @@ def run(*, dry_run: bool = False) -> None:
     else:
         error = final_state.get("error", "Unknown error")
         logger.error("❌ Pipeline failed: %s", error)
+        if store is not None:
+            logger.error("   Resume with `python -m src.main --resume %s`", run_id)
         sys.exit(1)
 
 
@@ -216,8 +295,13 @@ def main() -> None:
         action="store_true",
         help="Use mock tweet data instead of live X API",
     )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Continue a previous run from its last completed node",
+    )
     args = parser.parse_args()
-    run(dry_run=args.dry_run)
+    run(dry_run=args.dry_run, resume=args.resume)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Data models for the NFL Script Generator."""
 
 from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.models.batch import TweetBatch
 from src.models.narratives import Narrative, SentimentCluster
 from src.models.script import FinalScript, QualityReport, ScriptOutline, ScriptSection
 from src.models.state import AgentState
@@ -15,5 +16,6 @@ __all__ = [
     "SentimentCluster",
     "Tweet",
     "TweetAuthor",
+    "TweetBatch",
     "TweetMetrics",
 ]
\ No newline at end of file
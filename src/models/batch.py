@@ -0,0 +1,249 @@
+"""Columnar (struct-of-arrays) tweet container.
+
+A ``TweetBatch`` holds a corpus as one NumPy array per field instead of three
+pydantic objects per tweet. Tweet texts live in a single shared string buffer
+addressed by start/end offsets, so views and filtered subsets never copy text.
+
+Indexing follows NumPy: an integer returns a materialised ``Tweet``; a slice
+returns a view sharing the columns; a boolean mask or index array returns a new
+batch with copied columns (the text buffer is still shared). ``Tweet`` objects
+are only built on demand via ``tweet``, iteration or ``to_tweets``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+
+# Column name → dtype. Object columns hold Python str / list / None values.
+COLUMNS: dict[str, type | str] = {
+    "id": object,
+    "text_start": np.int64,
+    "text_end": np.int64,
+    "created_at": np.float64,           # epoch seconds
+    "conversation_id": object,
+    "referenced_tweet_ids": object,
+    "context_annotations": object,
+    # ── Metrics ──────────────────────────────────────────
+    "likes": np.int64,
+    "retweets": np.int64,
+    "quote_tweets": np.int64,
+    "replies": np.int64,
+    # ── Author ───────────────────────────────────────────
+    "author_id": object,
+    "username": object,
+    "name": object,
+    "followers_count": np.int64,
+    "following_count": np.int64,
+    "tweet_count": np.int64,
+    "verified": bool,
+    "description": object,
+    "author_created_at": np.float64,    # epoch seconds, NaN when unknown
+    # ── Scores (computed downstream) ─────────────────────
+    "engagement_score": np.float64,
+    "credibility_score": np.float64,
+    "sentiment_label": object,
+    "sentiment_intensity": np.float64,
+    "narrative_cluster": np.int64,
+}
+
+
+def _epoch(value: datetime | None) -> float:
+    if value is None:
+        return float("nan")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _datetime(value: float) -> datetime | None:
+    if np.isnan(value):
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+class TweetBatch:
+    """Struct-of-arrays tweet corpus with cheap views and filter masks."""
+
+    __slots__ = ("text_buffer", *COLUMNS)
+
+    def __init__(self, text_buffer: str, columns: dict[str, np.ndarray]) -> None:
+        missing = COLUMNS.keys() - columns.keys()
+        if missing:
+            raise ValueError(f"TweetBatch missing columns: {sorted(missing)}")
+        self.text_buffer = text_buffer
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+
+    # ── Construction ──────────────────────────────────────────
+
+    @classmethod
+    def empty(cls) -> TweetBatch:
+        return cls("", {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()})
+
+    @classmethod
+    def from_tweets(cls, tweets: Sequence[Tweet]) -> TweetBatch:
+        """Build a batch from ``Tweet`` objects in a single pass."""
+        n = len(tweets)
+        cols = {name: np.empty(n, dtype=dtype) for name, dtype in COLUMNS.items()}
+        texts: list[str] = []
+        offset = 0
+        for i, tw in enumerate(tweets):
+            a, m = tw.author, tw.metrics
+            texts.append(tw.text)
+            cols["text_start"][i] = offset
+            offset += len(tw.text)
+            cols["text_end"][i] = offset
+
+            cols["id"][i] = tw.id
+            cols["created_at"][i] = _epoch(tw.created_at)
+            cols["conversation_id"][i] = tw.conversation_id
+            cols["referenced_tweet_ids"][i] = tw.referenced_tweet_ids
+            cols["context_annotations"][i] = tw.context_annotations
+
+            cols["likes"][i] = m.likes
+            cols["retweets"][i] = m.retweets
+            cols["quote_tweets"][i] = m.quote_tweets
+            cols["replies"][i] = m.replies
+
+            cols["author_id"][i] = a.id
+            cols["username"][i] = a.username
+            cols["name"][i] = a.name
+            cols["followers_count"][i] = a.followers_count
+            cols["following_count"][i] = a.following_count
+            cols["tweet_count"][i] = a.tweet_count
+            cols["verified"][i] = a.verified
+            cols["description"][i] = a.description
+            cols["author_created_at"][i] = _epoch(a.created_at)
+
+            cols["engagement_score"][i] = tw.engagement_score
+            cols["credibility_score"][i] = tw.credibility_score
+            cols["sentiment_label"][i] = tw.sentiment_label
+            cols["sentiment_intensity"][i] = tw.sentiment_intensity
+            cols["narrative_cluster"][i] = tw.narrative_cluster
+        return cls("".join(texts), cols)
+
+    @classmethod
+    def coerce(cls, tweets: TweetBatch | Iterable[Tweet] | None) -> TweetBatch:
+        """Return ``tweets`` as a batch, converting a list of ``Tweet`` if needed."""
+        if isinstance(tweets, TweetBatch):
+            return tweets
+        if not tweets:
+            return cls.empty()
+        return cls.from_tweets(list(tweets))
+
+    @classmethod
+    def concat(cls, batches: Sequence[TweetBatch]) -> TweetBatch:
+        """Concatenate batches into one with a fresh, compact text buffer."""
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+        texts: list[str] = []
+        starts: list[np.ndarray] = []
+        ends: list[np.ndarray] = []
+        offset = 0
+        for b in batches:
+            lengths = b.text_end - b.text_start
+            texts.extend(b.texts())
+            end = offset + np.cumsum(lengths)
+            starts.append(end - lengths)
+            ends.append(end)
+            offset = int(end[-1])
+        cols = {
+            name: np.concatenate([getattr(b, name) for b in batches])
+            for name in COLUMNS if name not in ("text_start", "text_end")
+        }
+        cols["text_start"] = np.concatenate(starts)
+        cols["text_end"] = np.concatenate(ends)
+        return cls("".join(texts), cols)
+
+    # ── Views ─────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        return f"TweetBatch({len(self)} tweets)"
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.tweet(int(index))
+        return TweetBatch(self.text_buffer, {name: getattr(self, name)[index] for name in COLUMNS})
+
+    def filter(self, mask: np.ndarray) -> TweetBatch:
+        """Return the rows where the boolean ``mask`` is True."""
+        return self[np.asarray(mask, dtype=bool)]
+
+    def take(self, indices: np.ndarray | Sequence[int]) -> TweetBatch:
+        """Return the rows at ``indices``, in that order."""
+        return self[np.asarray(indices, dtype=np.int64)]
+
+    def replace(self, **columns: np.ndarray) -> TweetBatch:
+        """Return a batch sharing every column except the ones given."""
+        shared = {name: getattr(self, name) for name in COLUMNS}
+        return TweetBatch(self.text_buffer, shared | columns)
+
+    def __iter__(self) -> Iterator[Tweet]:
+        for i in range(len(self)):
+            yield self.tweet(i)
+
+    # ── Materialisation ───────────────────────────────────────
+
+    def text(self, i: int) -> str:
+        return self.text_buffer[self.text_start[i]:self.text_end[i]]
+
+    def texts(self) -> list[str]:
+        buf = self.text_buffer
+        return [buf[s:e] for s, e in zip(self.text_start.tolist(), self.text_end.tolist())]
+
+    def account_age_days(self, now: float | None = None) -> np.ndarray:
+        """Vectorised ``TweetAuthor.account_age_days`` against one reference time."""
+        if now is None:
+            now = datetime.now(timezone.utc).timestamp()
+        days = np.floor((now - self.author_created_at) / 86_400.0)
+        return np.where(np.isnan(days), 0, np.maximum(days, 1)).astype(np.int64)
+
+    def tweet(self, i: int) -> Tweet:
+        """Materialise row ``i`` as a ``Tweet`` (fields are trusted, not re-validated)."""
+        author = TweetAuthor.model_construct(
+            id=self.author_id[i],
+            username=self.username[i],
+            name=self.name[i],
+            followers_count=int(self.followers_count[i]),
+            following_count=int(self.following_count[i]),
+            tweet_count=int(self.tweet_count[i]),
+            verified=bool(self.verified[i]),
+            description=self.description[i],
+            created_at=_datetime(self.author_created_at[i]),
+        )
+        metrics = TweetMetrics.model_construct(
+            likes=int(self.likes[i]),
+            retweets=int(self.retweets[i]),
+            quote_tweets=int(self.quote_tweets[i]),
+            replies=int(self.replies[i]),
+        )
+        return Tweet.model_construct(
+            id=self.id[i],
+            text=self.text(i),
+            created_at=_datetime(self.created_at[i]),
+            author=author,
+            metrics=metrics,
+            conversation_id=self.conversation_id[i],
+            referenced_tweet_ids=list(self.referenced_tweet_ids[i]),
+            context_annotations=list(self.context_annotations[i]),
+            engagement_score=float(self.engagement_score[i]),
+            credibility_score=float(self.credibility_score[i]),
+            sentiment_label=self.sentiment_label[i],
+            sentiment_intensity=float(self.sentiment_intensity[i]),
+            narrative_cluster=int(self.narrative_cluster[i]),
+        )
+
+    def to_tweets(self) -> list[Tweet]:
+        """Materialise every row as a ``Tweet``."""
+        return [self.tweet(i) for i in range(len(self))]
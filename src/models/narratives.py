@@ -15,6 +15,7 @@ class SentimentCluster(BaseModel):
     tweet_ids: list[str] = Field(default_factory=list)
     representative_texts: list[str] = Field(default_factory=list)
     size: int = 0
+    total_engagement: float = 0.0
 
 
 class Narrative(BaseModel):
@@ -13,6 +13,16 @@ class ScriptSection(BaseModel):
     content: str               # Spoken word content
     stage_direction: str = ""  # Visual / tone cues for the creator
 
+    def render(self) -> str:
+        """Return the section as it appears in the rendered script."""
+        lines = [f"\n## {self.section_name}  [{self.timestamp}]"]
+        if self.stage_direction:
+            lines.append(f"   🎬 {self.stage_direction}")
+        lines.append("")
+        lines.append(self.content)
+        lines.append("")
+        return "\n".join(lines)
+
 
 class ScriptOutline(BaseModel):
     """High-level outline produced before full script generation."""
@@ -29,9 +39,10 @@ class QualityReport(BaseModel):
 
     passed: bool
     overall_score: float              # 0-100
-    retention_estimate: float         # 0-1
+    retention_estimate: float | None  # 0-1, None when only the local check ran
     feedback: str
     issues: list[str] = Field(default_factory=list)
+    source: str = "llm"               # llm / local
 
 
 class FinalScript(BaseModel):
@@ -55,12 +66,7 @@ class FinalScript(BaseModel):
         lines.append("")
         lines.append("=" * 72)
         for sec in self.sections:
-            lines.append(f"\n## {sec.section_name}  [{sec.timestamp}]")
-            if sec.stage_direction:
-                lines.append(f"   🎬 {sec.stage_direction}")
-            lines.append("")
-            lines.append(sec.content)
-            lines.append("")
+            lines.append(sec.render())
         lines.append("=" * 72)
         lines.append(f"\nDESCRIPTION:\n{self.description}")
         lines.append(f"\nTAGS: {', '.join(self.tags)}")
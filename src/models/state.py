@@ -7,8 +7,9 @@ from typing import Annotated, TypedDict
 from langgraph.graph.message import add_messages
 from langchain_core.messages import BaseMessage
 
+from src.models.batch import TweetBatch
 from src.models.tweets import Tweet
-from src.models.narratives import Narrative
+from src.models.narratives import Narrative, SentimentCluster
 from src.models.script import ScriptOutline, FinalScript
 
 
@@ -17,26 +18,41 @@ def _replace(old: list, new: list) -> list:  # noqa: ARG001
     return new
 
 
+def _merge_timings(
+    old: dict[str, list[list[float]]], new: dict[str, list[list[float]]],
+) -> dict[str, list[list[float]]]:
+    """Join reducer: combine per-node ``[start, end]`` runs from parallel branches."""
+    merged = {name: list(runs) for name, runs in (old or {}).items()}
+    for name, runs in (new or {}).items():
+        merged.setdefault(name, []).extend(runs)
+    return merged
+
+
 class AgentState(TypedDict):
     """Full state flowing through the LangGraph pipeline."""
 
-    # ── Raw data ──────────────────────────────────────────
-    tweets_raw: Annotated[list[Tweet], _replace]
+    # ── Raw data (columnar) ───────────────────────────────
+    tweets_raw: Annotated[TweetBatch, _replace]
+
+    # ── After engagement scoring (columnar) ───────────────
+    tweets_scored: Annotated[TweetBatch, _replace]
 
-    # ── After engagement scoring ──────────────────────────
-    tweets_scored: Annotated[list[Tweet], _replace]
+    # ── Author credibility by tweet id (parallel branch) ──
+    credibility_scores: Annotated[dict[str, float], _replace]
 
-    # ── After credibility filtering ───────────────────────
+    # ── After credibility filtering (materialised) ───────
     tweets_filtered: Annotated[list[Tweet], _replace]
 
     # ── Sentiment + clustering ────────────────────────────
     sentiment_clusters: Annotated[list[dict], _replace]
+    tweet_clusters: Annotated[list[SentimentCluster], _replace]
 
     # ── Narrative extraction ──────────────────────────────
     dominant_narratives: Annotated[list[Narrative], _replace]
 
     # ── Script stages ─────────────────────────────────────
     script_outline: Annotated[ScriptOutline | None, lambda _o, n: n]
+    sample_tweets: Annotated[str, lambda _o, n: n]
     final_script: Annotated[FinalScript | None, lambda _o, n: n]
 
     # ── Quality gate ──────────────────────────────────────
@@ -49,3 +65,4 @@ class AgentState(TypedDict):
     # ── Metadata ──────────────────────────────────────────
     error: Annotated[str, lambda _o, n: n]
     retry_count: Annotated[int, lambda _o, n: n]
+    node_timings: Annotated[dict[str, list[list[float]]], _merge_timings]
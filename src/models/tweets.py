@@ -66,3 +66,4 @@ class Tweet(BaseModel):
     sentiment_label: str = ""           # positive / negative / neutral / mixed
     sentiment_intensity: float = 0.0    # 0‑1
     narrative_cluster: int = -1
+    duplicate_ids: list[str] = Field(default_factory=list)  # near-copies collapsed into this one
@@ -2,20 +2,25 @@
 
 from src.nodes.fetch_tweets import fetch_tweets_node
 from src.nodes.engagement_scoring import engagement_scoring_node
-from src.nodes.credibility_filter import credibility_filter_node
+from src.nodes.credibility_filter import credibility_filter_node, credibility_scoring_node
 from src.nodes.sentiment_clustering import sentiment_clustering_node
 from src.nodes.narrative_extraction import narrative_extraction_node
 from src.nodes.script_outline import script_outline_node
+from src.nodes.select_samples import select_samples_node
 from src.nodes.script_generation import script_generation_node
+from src.nodes.script_candidates import script_candidates_node
 from src.nodes.quality_check import quality_check_node
 
 __all__ = [
     "credibility_filter_node",
+    "credibility_scoring_node",
     "engagement_scoring_node",
     "fetch_tweets_node",
     "narrative_extraction_node",
     "quality_check_node",
+    "script_candidates_node",
     "script_generation_node",
     "script_outline_node",
+    "select_samples_node",
     "sentiment_clustering_node",
 ]
\ No newline at end of file
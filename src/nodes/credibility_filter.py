@@ -4,28 +4,90 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 from src.config import settings
+from src.models.batch import TweetBatch
 from src.models.state import AgentState
-from src.scoring.credibility import score_credibility
+from src.scoring.credibility import score_credibility_batch
+from src.scoring.credibility_cache import CredibilityCache
+from src.scoring.dedup import collapse_duplicates
 
 logger = logging.getLogger(__name__)
 
+_cache: CredibilityCache | None = None
+
+
+def get_credibility_cache() -> CredibilityCache:
+    """Return the process-wide author credibility cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = CredibilityCache(
+            max_size=settings.credibility_cache_size,
+            path=settings.credibility_cache_path or None,
+        )
+    return _cache
+
+
+def _score_authors(batch: TweetBatch) -> TweetBatch:
+    """Score ``batch`` through the author cache; return its rows best first."""
+    cache = get_credibility_cache()
+    ranked = score_credibility_batch(batch, min_score=0, cache=cache)
+    cache.save()
+    logger.info(
+        "  Author cache: %d hits, %d misses (%.0f%% hit rate, %d authors)",
+        cache.hits, cache.misses, cache.hit_rate * 100, len(cache),
+    )
+    return ranked
+
+
+def credibility_scoring_node(state: AgentState) -> dict:
+    """LangGraph node: score every raw tweet's author, alongside engagement scoring."""
+    raw = TweetBatch.coerce(state.get("tweets_raw"))
+    logger.info("🛡️  CredibilityScoringNode — scoring %d authors …", len(raw))
+    if not len(raw):
+        return {"credibility_scores": {}}
+    # Score into a private column: engagement scoring reads tweets_raw concurrently
+    ranked = _score_authors(raw.replace(credibility_score=raw.credibility_score.copy()))
+    return {"credibility_scores": dict(zip(ranked.id.tolist(), ranked.credibility_score.tolist()))}
+
 
 def credibility_filter_node(state: AgentState) -> dict:
-    """LangGraph node: filter tweets by credibility score."""
-    scored = state.get("tweets_scored", [])
+    """LangGraph node: filter tweets by credibility score.
+
+    Joins the engagement and credibility branches: scores from
+    ``credibility_scores`` are applied to the engagement survivors, and any
+    tweet without one is scored here.
+    """
+    scored = TweetBatch.coerce(state.get("tweets_scored"))
     logger.info("🛡️  CredibilityFilterNode — filtering %d tweets …", len(scored))
 
-    if not scored:
+    if not len(scored):
         return {"tweets_filtered": [], "error": "No scored tweets to filter."}
 
-    filtered = score_credibility(scored, min_score=settings.min_credibility_score)
+    known = state.get("credibility_scores") or {}
+    if known and all(tweet_id in known for tweet_id in scored.id.tolist()):
+        scores = np.array([known[tweet_id] for tweet_id in scored.id.tolist()], dtype=np.float64)
+        ranked = scored.replace(credibility_score=scores).take(np.argsort(-scores, kind="stable"))
+    else:
+        ranked = _score_authors(scored)
+    filtered = ranked.filter(ranked.credibility_score >= settings.min_credibility_score)
 
-    if not filtered:
+    if not len(filtered):
         # Fallback: keep top 30 by credibility regardless of threshold
-        all_scored = score_credibility(scored, min_score=0)
-        filtered = all_scored[:30]
+        filtered = ranked[:30]
         logger.warning("⚠️  Low-credibility fallback: keeping top %d tweets", len(filtered))
 
     logger.info("✅ %d tweets passed credibility filter", len(filtered))
-    return {"tweets_filtered": filtered, "error": ""}
+    # Downstream LLM stages work on Tweet objects; only the survivors are materialised
+    tweets = filtered.to_tweets()
+
+    if settings.dedup_enabled and len(tweets) > 1:
+        collapsed = collapse_duplicates(tweets, threshold=settings.dedup_threshold)
+        logger.info(
+            "  Near-duplicates: %d → %d tweets (%.2fx compression)",
+            len(tweets), len(collapsed), len(tweets) / len(collapsed),
+        )
+        tweets = collapsed
+
+    return {"tweets_filtered": tweets, "error": ""}
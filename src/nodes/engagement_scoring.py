@@ -5,32 +5,35 @@ from __future__ import annotations
 import logging
 
 from src.config import settings
+from src.models.batch import TweetBatch
 from src.models.state import AgentState
-from src.scoring.engagement import score_tweets
+from src.scoring.engagement import score_batch
 
 logger = logging.getLogger(__name__)
 
 
 def engagement_scoring_node(state: AgentState) -> dict:
     """LangGraph node: score tweets by engagement."""
-    raw = state.get("tweets_raw", [])
+    raw = TweetBatch.coerce(state.get("tweets_raw"))
     logger.info("📊 EngagementScoringNode — scoring %d tweets …", len(raw))
 
-    if not raw:
-        return {"tweets_scored": [], "error": "No raw tweets to score."}
+    if not len(raw):
+        return {"tweets_scored": TweetBatch.empty(), "error": "No raw tweets to score."}
 
-    scored = score_tweets(raw)
+    scored = score_batch(raw)
 
     # Apply minimum threshold
-    filtered = [t for t in scored if t.engagement_score >= settings.min_engagement_score]
+    filtered = scored.filter(scored.engagement_score >= settings.min_engagement_score)
     logger.info(
         "✅ %d tweets passed engagement threshold (%.1f)",
         len(filtered), settings.min_engagement_score,
     )
 
-    if not filtered:
+    if not len(filtered):
         # Fallback: keep top 50 even if below threshold
         filtered = scored[:50]
         logger.warning("⚠️  Low-signal fallback: keeping top %d tweets", len(filtered))
 
-    return {"tweets_scored": filtered, "error": ""}
+    # No "error" on success: this runs alongside credibility scoring, and a
+    # blank value here could overwrite a failure reported by that branch
+    return {"tweets_scored": filtered}
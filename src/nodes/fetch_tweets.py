@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+import requests
 import tweepy
 
 from src.config import settings
+from src.models.batch import TweetBatch
 from src.models.state import AgentState
 from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.utils.ingest_state import IngestState
 from src.utils.nfl import build_search_queries
+from src.utils.rate_limit import RateLimiter, RateLimitExceeded
+from src.utils.search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +32,52 @@ USER_FIELDS = [
 ]
 EXPANSIONS = ["author_id", "referenced_tweets.id"]
 
+# Page size bounds for the recent search endpoint
+PAGE_MIN_RESULTS = 10
+PAGE_MAX_RESULTS = 100
+
+SEARCH_ENDPOINT = "search_recent"
+RATE_LIMIT_RETRIES = 2
+
+# Shared across runs in the same process so concurrent pipelines pace together
+rate_limiter = RateLimiter(
+    default_limit=settings.rate_limit_default_per_window,
+    max_wait_seconds=settings.rate_limit_max_wait_seconds,
+)
+
 
 def _build_client() -> tweepy.Client:
-    """Create an authenticated X API v2 client."""
+    """Create an authenticated X API v2 client.
+
+    Responses are returned as raw ``requests.Response`` objects so the JSON
+    body can be cached before it is parsed and the rate-limit headers read.
+    Rate limiting is handled by ``rate_limiter`` rather than tweepy's
+    process-blocking ``wait_on_rate_limit``.
+    """
     return tweepy.Client(
         bearer_token=settings.x_bearer_token,
-        wait_on_rate_limit=True,
+        return_type=requests.Response,
+        wait_on_rate_limit=False,
+    )
+
+
+def _build_cache() -> SearchCache:
+    """Create the on-disk search response cache from settings."""
+    return SearchCache(
+        settings.search_cache_dir,
+        mode=settings.search_cache_mode,
+        ttl_seconds=settings.search_cache_ttl_seconds,
+        max_bytes=settings.search_cache_max_mb * 1024 * 1024,
     )
 
 
 def _parse_tweet(tweet_data, users_map: dict) -> Tweet:
-    """Convert a tweepy tweet + user lookup into our internal Tweet model."""
+    """Convert a tweepy tweet + user lookup into our internal Tweet model.
+
+    Reference path over tweepy objects with full pydantic validation. Fetching
+    uses the raw-JSON fast path (``_page_tweets``); this is kept as the
+    equivalence baseline for tests and ``benchmarks/bench_parse.py``.
+    """
     author_data = users_map.get(tweet_data.author_id)
     pm = tweet_data.public_metrics or {}
     author_pm = getattr(author_data, "public_metrics", {}) or {}
@@ -79,72 +122,345 @@ def _parse_tweet(tweet_data, users_map: dict) -> Tweet:
     )
 
 
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse an X API ISO-8601 timestamp (e.g. ``2026-01-01T12:00:00.000Z``)."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _parse_author_json(u: dict) -> TweetAuthor:
+    """Build a ``TweetAuthor`` from a raw v2 user object without validation."""
+    pm = u.get("public_metrics") or {}
+    return TweetAuthor.model_construct(
+        id=u["id"],
+        username=u.get("username", "unknown"),
+        name=u.get("name", "Unknown"),
+        followers_count=pm.get("followers_count", 0),
+        following_count=pm.get("following_count", 0),
+        tweet_count=pm.get("tweet_count", 0),
+        verified=bool(u.get("verified", False)),
+        description=u.get("description") or "",
+        created_at=_parse_time(u.get("created_at")),
+    )
+
+
+def _unknown_author(author_id: str) -> TweetAuthor:
+    return TweetAuthor.model_construct(
+        id=author_id, username="unknown", name="Unknown", followers_count=0,
+        following_count=0, tweet_count=0, verified=False, description="", created_at=None,
+    )
+
+
+def _parse_tweet_json(d: dict, authors: dict[str, TweetAuthor]) -> Tweet:
+    """Build a ``Tweet`` from a raw v2 tweet object without validation.
+
+    The X API types these fields, so pydantic validation is skipped; only the
+    shape differences (nested metrics, annotation entities, ISO timestamps) are
+    handled here. Every field is passed explicitly: ``model_construct`` fills
+    omitted ones from their defaults, which is slow for ``default_factory``.
+    """
+    pm = d.get("public_metrics") or {}
+    author_id = str(d.get("author_id"))
+    author = authors.get(author_id) or _unknown_author(author_id)
+    conversation_id = d.get("conversation_id")
+    return Tweet.model_construct(
+        id=d["id"],
+        text=d["text"],
+        created_at=_parse_time(d.get("created_at")) or datetime.now(timezone.utc),
+        author=author,
+        metrics=TweetMetrics.model_construct(
+            likes=pm.get("like_count", 0),
+            retweets=pm.get("retweet_count", 0),
+            quote_tweets=pm.get("quote_count", 0),
+            replies=pm.get("reply_count", 0),
+        ),
+        conversation_id=str(conversation_id) if conversation_id else None,
+        referenced_tweet_ids=[str(r["id"]) for r in d.get("referenced_tweets") or ()],
+        context_annotations=[
+            ann["entity"]["name"]
+            for ann in d.get("context_annotations") or ()
+            if (ann.get("entity") or {}).get("name")
+        ],
+        engagement_score=0.0,
+        credibility_score=0.0,
+        sentiment_label="",
+        sentiment_intensity=0.0,
+        narrative_cluster=-1,
+        duplicate_ids=[],
+    )
+
+
+def _page_tweets(payload: dict, authors: dict[str, TweetAuthor] | None = None) -> list[Tweet]:
+    """Parse one raw v2 search page (``data`` + ``includes.users``).
+
+    Decodes the JSON straight into our models, skipping tweepy object
+    construction. ``authors`` carries parsed users across pages of the same
+    query, so each author is built once and shared by all of their tweets.
+    """
+    if authors is None:
+        authors = {}
+    for u in (payload.get("includes") or {}).get("users", ()):
+        if u["id"] not in authors:
+            authors[u["id"]] = _parse_author_json(u)
+    return [_parse_tweet_json(d, authors) for d in payload.get("data") or ()]
+
+
+def _fetch_page(
+    client: tweepy.Client | None,
+    params: dict,
+    cache: SearchCache | None,
+) -> dict | None:
+    """Return one raw search page, served from the cache when possible."""
+    if cache is not None:
+        payload = cache.get(params)
+        if payload is not None:
+            return payload
+        if cache.replay:
+            logger.warning("  Replay cache miss, ending query: %s", params["query"])
+            return None
+
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        rate_limiter.acquire(SEARCH_ENDPOINT)
+        try:
+            response = client.search_recent_tweets(**params)
+        except tweepy.TooManyRequests as exc:
+            rate_limiter.update(SEARCH_ENDPOINT, exc.response.headers, exhausted=True)
+            if attempt == RATE_LIMIT_RETRIES:
+                raise
+            logger.warning(
+                "  429 on query, retrying after reset (~%.0fs): %s",
+                rate_limiter.expected_wait(SEARCH_ENDPOINT), params["query"],
+            )
+            continue
+        rate_limiter.update(SEARCH_ENDPOINT, response.headers)
+        break
+
+    payload = response.json()
+    if cache is not None:
+        cache.put(params, payload)
+    return payload
+
+
+def iter_query_tweets(
+    client: tweepy.Client | None,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    *,
+    max_tweets: int,
+    should_stop: Callable[[], bool] | None = None,
+    cache: SearchCache | None = None,
+    since_id: str | None = None,
+) -> Generator[Tweet, None, bool]:
+    """Yield parsed tweets for one query, following ``next_token`` page by page.
+
+    At most ``max_tweets`` tweets are yielded. ``should_stop`` is polled before
+    every page request so callers can end pagination early once downstream has
+    enough signal; the consumer may also simply stop iterating. Only the current
+    page is held in memory. With a replay ``cache`` the client is never used
+    and may be None. When ``since_id`` is given only tweets newer than it are
+    requested and ``start_time`` is not sent.
+
+    Returns True if the query's results were exhausted, False if pagination
+    stopped early (``max_tweets``, ``should_stop`` or rate limiting).
+    """
+    remaining = max_tweets
+    next_token: str | None = None
+    authors: dict[str, TweetAuthor] = {}
+
+    while remaining > 0:
+        if should_stop is not None and should_stop():
+            logger.info("  Early stop for query: %s", query)
+            return False
+        params = {
+            "query": query,
+            # The endpoint accepts 10–100 results per page
+            "max_results": max(PAGE_MIN_RESULTS, min(remaining, PAGE_MAX_RESULTS)),
+            "start_time": None if since_id else start_time,
+            "end_time": end_time,
+            "since_id": since_id,
+            "next_token": next_token,
+            "tweet_fields": TWEET_FIELDS,
+            "user_fields": USER_FIELDS,
+            "expansions": EXPANSIONS,
+        }
+        try:
+            payload = _fetch_page(client, params, cache)
+        except tweepy.TooManyRequests:
+            logger.warning("  Still rate-limited after retries, stopping pagination: %s", query)
+            return False
+        except RateLimitExceeded as exc:
+            logger.warning(
+                "  Rate limit would block for %.0fs (max %.0fs), stopping pagination: %s",
+                exc.wait_seconds, rate_limiter.max_wait_seconds, query,
+            )
+            return False
+
+        if not payload or not payload.get("data"):
+            return True
+
+        page = _page_tweets(payload, authors)
+        for tw in page[:remaining]:
+            yield tw
+        truncated = len(page) > remaining
+        remaining -= min(len(page), remaining)
+
+        next_token = (payload.get("meta") or {}).get("next_token")
+        if not next_token:
+            return not truncated
+    return False
+
+
+class _FetchBudget:
+    """Thread-safe tally of tweets fetched so far against the global limit."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self, n: int = 1) -> None:
+        with self._lock:
+            self.count += n
+
+    def exhausted(self) -> bool:
+        return self.count >= self.limit
+
+
+def _search_query(
+    client: tweepy.Client | None,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    budget: _FetchBudget,
+    cache: SearchCache | None = None,
+    since_id: str | None = None,
+) -> tuple[list[Tweet], bool]:
+    """Run a single recent-search query.
+
+    Returns its parsed tweets and whether pagination reached the end of the
+    results (see ``iter_query_tweets``).
+    """
+    if since_id:
+        logger.info("  Query (since %s): %s", since_id, query)
+    else:
+        logger.info("  Query: %s", query)
+    tweets: list[Tweet] = []
+    pages = iter_query_tweets(
+        client, query, start_time, end_time,
+        max_tweets=settings.max_tweets_per_query,
+        should_stop=budget.exhausted,
+        cache=cache,
+        since_id=since_id,
+    )
+    while True:
+        try:
+            tw = next(pages)
+        except StopIteration as stop:
+            complete = bool(stop.value)
+            break
+        tweets.append(tw)
+        budget.add()
+
+    if not tweets:
+        logger.info("  No results for query: %s", query)
+    return tweets, complete
+
+
 def fetch_tweets_node(state: AgentState) -> dict:
     """LangGraph node: fetch recent NFL tweets from X API."""
     # If tweets are pre-populated (e.g. dry-run mode), skip API call
-    existing = state.get("tweets_raw", [])
+    existing = state.get("tweets_raw")
     if existing:
         logger.info("🔍 FetchTweetsNode — using %d pre-loaded tweets (dry-run)", len(existing))
-        return {"tweets_raw": existing, "error": ""}
+        return {"tweets_raw": TweetBatch.coerce(existing), "error": ""}
 
     logger.info("🔍 FetchTweetsNode — querying X API v2 …")
 
-    if not settings.x_bearer_token:
-        return {"tweets_raw": [], "error": "X_BEARER_TOKEN not set. Use --dry-run or add to .env."}
+    cache = _build_cache()
+    if not settings.x_bearer_token and not cache.replay:
+        return {
+            "tweets_raw": TweetBatch.empty(),
+            "error": "X_BEARER_TOKEN not set. Use --dry-run or add to .env.",
+        }
 
     try:
-        client = _build_client()
+        # Replay serves recorded pages only — never build a tweepy client
+        client = None if cache.replay else _build_client()
         queries = build_search_queries()
 
-        # Post-game window: last 12 hours (end_time must be ≥30s in the past for X API)
-        end_time = datetime.now(timezone.utc) - timedelta(seconds=30)
-        start_time = end_time - timedelta(hours=12)
+        ingest = IngestState.load(settings.ingest_state_dir) if settings.incremental_fetch else None
+        # An incremental refresh wants whatever is new since the last run, so
+        # only replay pins the recorded window; readwrite slides it forward
+        window = cache.recorded_window() if cache.replay or ingest is None else None
+        if window is not None:
+            start_time, end_time = window
+            logger.info("  Using cached search window %s → %s", start_time, end_time)
+        elif cache.replay:
+            return {
+                "tweets_raw": TweetBatch.empty(),
+                "error": "Search cache replay: no recorded window found.",
+            }
+        else:
+            # Post-game window (end_time must be ≥30s in the past for X API)
+            end_time = datetime.now(timezone.utc) - timedelta(seconds=30)
+            start_time = end_time - timedelta(hours=settings.fetch_window_hours)
+            cache.save_window(start_time, end_time)
 
         all_tweets: list[Tweet] = []
         seen_ids: set[str] = set()
+        budget = _FetchBudget(settings.max_tweets_total)
 
-        for query in queries:
-            logger.info("  Query: %s", query)
-            try:
-                response = client.search_recent_tweets(
-                    query=query,
-                    max_results=min(settings.max_tweets_per_query, 100),
-                    start_time=start_time,
-                    end_time=end_time,
-                    tweet_fields=TWEET_FIELDS,
-                    user_fields=USER_FIELDS,
-                    expansions=EXPANSIONS,
+        # Issue queries concurrently; results are merged in query order so the
+        # output is identical to a sequential run.
+        workers = max(1, min(settings.fetch_concurrency, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+            futures = [
+                pool.submit(
+                    _search_query, client, query, start_time, end_time, budget, cache,
+                    ingest.since_id(query, start_time) if ingest else None,
                 )
-            except tweepy.TooManyRequests:
-                logger.warning("  Rate-limited on query, skipping: %s", query)
-                continue
-
-            if not response or not response.data:
-                logger.info("  No results for query: %s", query)
-                continue
-
-            # Build user lookup
-            users_map: dict = {}
-            if response.includes and "users" in response.includes:
-                for u in response.includes["users"]:
-                    users_map[u.id] = u
-
-            for tw in response.data:
-                tid = str(tw.id)
-                if tid not in seen_ids:
-                    seen_ids.add(tid)
-                    all_tweets.append(_parse_tweet(tw, users_map))
+                for query in queries
+            ]
+            for query, future in zip(queries, futures):
+                fetched, complete = future.result()
+                kept = 0
+                for tw in fetched:
+                    if tw.id in seen_ids:
+                        kept += 1
+                        continue
+                    if len(all_tweets) >= settings.max_tweets_total:
+                        break
+                    seen_ids.add(tw.id)
+                    all_tweets.append(tw)
+                    kept += 1
+                # A query that stopped early, or lost tweets to max_tweets_total,
+                # keeps its old watermark so the next run fetches what was missed
+                if ingest is not None and complete and kept == len(fetched):
+                    ingest.advance(query, fetched)
+
+        if ingest is not None:
+            fresh = len(all_tweets)
+            all_tweets = ingest.merge(all_tweets, start_time)[: settings.max_tweets_total]
+            ingest.save()
+            logger.info(
+                "  Incremental fetch: %d new, %d retained from earlier runs",
+                fresh, len(all_tweets) - fresh,
+            )
 
+        if cache.enabled:
+            logger.info(
+                "  Search cache (%s): %d hits, %d misses", cache.mode, cache.hits, cache.misses,
+            )
         logger.info("✅ Fetched %d unique tweets", len(all_tweets))
 
         if len(all_tweets) == 0:
             return {
-                "tweets_raw": [],
+                "tweets_raw": TweetBatch.empty(),
                 "error": "No tweets found in post-game window. Check timing or API access.",
             }
 
-        return {"tweets_raw": all_tweets, "error": ""}
+        return {"tweets_raw": TweetBatch.from_tweets(all_tweets), "error": ""}
 
     except Exception as exc:
         logger.exception("FetchTweetsNode failed")
-        return {"tweets_raw": [], "error": f"FetchTweetsNode error: {exc}"}
+        return {"tweets_raw": TweetBatch.empty(), "error": f"FetchTweetsNode error: {exc}"}
@@ -4,46 +4,74 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import Counter
 
 from langchain_openai import ChatOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import settings
-from src.models.narratives import Narrative
+from src.models.narratives import Narrative, SentimentCluster
 from src.models.state import AgentState
 from src.prompts.sentiment import CLUSTERING_SYSTEM, CLUSTERING_USER
+from src.scoring.clustering import cluster_tweets
+from src.utils.llm import cached_invoke, get_llm
 
 logger = logging.getLogger(__name__)
 
 
 def _build_llm() -> ChatOpenAI:
-    return ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.4,
-        max_tokens=4096,
-    )
+    return get_llm(temperature=0.4, max_tokens=4096)
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
-def _extract_narratives(llm: ChatOpenAI, tweets_data: list[dict], num_clusters: int) -> list[dict]:
-    """Ask the LLM to cluster tweets into dominant narratives."""
+def _extract_narratives(
+    llm: ChatOpenAI, clusters_data: list[dict], num_clusters: int,
+) -> list[dict]:
+    """Ask the LLM to turn topic cluster summaries into dominant narratives."""
     system = CLUSTERING_SYSTEM.format(num_clusters=num_clusters)
     user = CLUSTERING_USER.format(
-        count=len(tweets_data),
-        tweets_json=json.dumps(tweets_data, indent=2),
+        count=len(clusters_data),
+        clusters_json=json.dumps(clusters_data, separators=(",", ":"), ensure_ascii=False),
         num_clusters=num_clusters,
     )
-    response = llm.invoke([
+    return cached_invoke(llm, [
         {"role": "system", "content": system},
         {"role": "user", "content": user},
     ])
-    raw = response.content.strip()
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-    return json.loads(raw)
+
+
+def _summarise_clusters(
+    clusters: list[SentimentCluster], sentiment_data: list[dict], max_phrases: int = 5,
+) -> list[dict]:
+    """Build the compact per-cluster view sent to the LLM."""
+    phrases = {s["tweet_id"]: s.get("key_phrases", []) for s in sentiment_data if "tweet_id" in s}
+    summaries = []
+    for c in clusters:
+        counts = Counter(p for tid in c.tweet_ids for p in phrases.get(tid, []))
+        summaries.append({
+            "cluster_id": c.cluster_id,
+            "topic_terms": c.label,
+            "size": c.size,
+            "total_engagement": round(c.total_engagement),
+            "sentiment": c.sentiment,
+            "intensity": round(c.intensity, 2),
+            "key_phrases": [p for p, _ in counts.most_common(max_phrases)],
+            "representative_tweets": c.representative_texts,
+        })
+    return summaries
+
+
+def _expand_clusters(raw: dict, cluster_map: dict[int, SentimentCluster]) -> list[str]:
+    """Map the cluster ids the LLM cited back to their tweet ids."""
+    tweet_ids: list[str] = []
+    for cid in raw.get("cluster_ids", []):
+        try:
+            cluster = cluster_map.get(int(cid))
+        except (TypeError, ValueError):
+            continue
+        if cluster is not None:
+            tweet_ids.extend(cluster.tweet_ids)
+    return list(dict.fromkeys(tweet_ids)) or raw.get("tweet_ids", [])
 
 
 def narrative_extraction_node(state: AgentState) -> dict:
@@ -57,30 +85,22 @@ def narrative_extraction_node(state: AgentState) -> dict:
 
     llm = _build_llm()
 
-    # Build enriched tweet data for the LLM
-    sentiment_map = {s["tweet_id"]: s for s in sentiment_data if "tweet_id" in s}
-    tweets_enriched = []
-    for tw in tweets:
-        entry = {
-            "tweet_id": tw.id,
-            "text": tw.text,
-            "engagement_score": tw.engagement_score,
-            "credibility_score": tw.credibility_score,
-            "author": tw.author.username,
-            "verified": tw.author.verified,
-        }
-        if tw.id in sentiment_map:
-            entry.update(sentiment_map[tw.id])
-        tweets_enriched.append(entry)
+    # Summarise each topic cluster; the prompt grows with clusters, not tweets
+    clusters = state.get("tweet_clusters") or cluster_tweets(
+        tweets, settings.narrative_cluster_count,
+        max_representatives=settings.cluster_representatives,
+    )
+    clusters_data = _summarise_clusters(clusters, sentiment_data)
 
     try:
         raw_narratives = _extract_narratives(
-            llm, tweets_enriched, settings.num_narratives
+            llm, clusters_data, settings.num_narratives
         )
     except Exception as exc:
         logger.exception("Narrative extraction failed")
         return {"dominant_narratives": [], "error": f"Narrative extraction error: {exc}"}
 
+    cluster_map = {c.cluster_id: c for c in clusters}
     narratives: list[Narrative] = []
     for i, raw in enumerate(raw_narratives):
         narratives.append(Narrative(
@@ -89,7 +109,7 @@ def narrative_extraction_node(state: AgentState) -> dict:
             emotion=raw.get("emotion", "neutral"),
             intensity=float(raw.get("intensity", 0.5)),
             stance=raw.get("stance", "divided"),
-            supporting_tweet_ids=raw.get("tweet_ids", []),
+            supporting_tweet_ids=_expand_clusters(raw, cluster_map),
             key_phrases=raw.get("key_phrases", []),
             counter_arguments=raw.get("counter_arguments", []),
             relevance_score=float(raw.get("relevance_score", 50.0)) if "relevance_score" in raw else float(100 - i * 15),
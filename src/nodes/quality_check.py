@@ -9,36 +9,27 @@ from langchain_openai import ChatOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import settings
-from src.models.script import QualityReport
+from src.models.script import FinalScript, QualityReport
 from src.models.state import AgentState
 from src.prompts.script import QUALITY_SYSTEM, QUALITY_USER
+from src.scoring.script_quality import check_script
+from src.utils.llm import cached_invoke, get_llm
 
 logger = logging.getLogger(__name__)
 
 
 def _build_llm() -> ChatOpenAI:
-    return ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.2,
-        max_tokens=2048,
-    )
+    return get_llm(temperature=0.2, max_tokens=2048)
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
 def _evaluate_script(llm: ChatOpenAI, script_json: str) -> dict:
     """Ask the LLM to evaluate the script quality."""
     user = QUALITY_USER.format(script_json=script_json)
-    response = llm.invoke([
+    return cached_invoke(llm, [
         {"role": "system", "content": QUALITY_SYSTEM},
         {"role": "user", "content": user},
     ])
-    raw = response.content.strip()
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-    return json.loads(raw)
 
 
 def quality_check_node(state: AgentState) -> dict:
@@ -53,6 +44,38 @@ def quality_check_node(state: AgentState) -> dict:
             "error": "No script available for quality check.",
         }
 
+    outline = state.get("script_outline")
+    local = check_script(
+        script, outline,
+        target_minutes=outline.target_minutes if outline else settings.script_target_minutes,
+    )
+    # Trust the word count over the model's own duration estimate
+    script.estimated_duration_minutes = local.estimated_minutes
+    logger.info(
+        "  Local check: %.0f/100 (%d words, ~%.1f min, %d issues)",
+        local.score, local.word_count, local.estimated_minutes, len(local.issues),
+    )
+
+    if local.critical or local.score < settings.quality_local_fail_score:
+        report = QualityReport(
+            passed=False,
+            overall_score=local.score,
+            retention_estimate=None,
+            feedback="Failed the local structure/length check; the LLM review was skipped.",
+            issues=local.issues,
+            source="local",
+        )
+        return _finish(script, report)
+    if not local.issues and local.score >= settings.quality_local_pass_score:
+        report = QualityReport(
+            passed=True,
+            overall_score=local.score,
+            retention_estimate=None,
+            feedback="Passed the local structure/length check; the LLM review was skipped.",
+            source="local",
+        )
+        return _finish(script, report)
+
     llm = _build_llm()
     script_json = json.dumps(script.model_dump(), indent=2)
 
@@ -71,17 +94,24 @@ def quality_check_node(state: AgentState) -> dict:
         overall_score=float(raw.get("overall_score", 0)),
         retention_estimate=float(raw.get("retention_estimate", 0)),
         feedback=raw.get("feedback", ""),
-        issues=raw.get("issues", []),
+        issues=local.issues + [i for i in raw.get("issues", []) if i not in local.issues],
     )
+    return _finish(script, report)
 
+
+def _finish(script: FinalScript, report: QualityReport) -> dict:
     # Attach report to the script
     script.quality_report = report
 
+    retention = (
+        f"{report.retention_estimate:.0%}" if report.retention_estimate is not None else "n/a"
+    )
     logger.info(
-        "✅ Quality check: %s (score=%.0f, retention=%.0f%%)",
+        "✅ Quality check (%s): %s (score=%.0f, retention=%s)",
+        report.source,
         "PASSED" if report.passed else "FAILED",
         report.overall_score,
-        report.retention_estimate * 100,
+        retention,
     )
 
     return {
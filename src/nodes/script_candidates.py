@@ -0,0 +1,130 @@
+"""ScriptCandidatesNode — writes several scripts at once and keeps the best.
+
+Replaces the generate → check pair when ``SCRIPT_CANDIDATES`` is above 1.
+Each candidate is written at a different temperature and quality-checked in
+its own thread; the first one to pass wins and the rest are cancelled: queued
+ones never start and running ones stop before their next LLM call or streamed
+chunk. The node waits for them to wind down before returning. If none pass,
+the highest ``overall_score`` is kept and the usual retry loop takes over.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from src.config import settings
+from src.models.state import AgentState
+from src.nodes.quality_check import quality_check_node
+from src.nodes.script_generation import write_script
+from src.utils.llm import LLMCallCancelled
+
+logger = logging.getLogger(__name__)
+
+# Candidate temperatures are spread evenly across this range
+TEMPERATURE_RANGE = (0.55, 0.95)
+
+
+def candidate_temperatures(n: int) -> list[float]:
+    """Return ``n`` distinct sampling temperatures, coolest first."""
+    low, high = TEMPERATURE_RANGE
+    if n <= 1:
+        return [round((low + high) / 2, 2)]
+    step = (high - low) / (n - 1)
+    return [round(low + i * step, 2) for i in range(n)]
+
+
+def _run_candidate(
+    state: AgentState, temperature: float, cancelled: threading.Event,
+) -> dict | None:
+    """Write and check one candidate; return None if cancelled before the check."""
+    script = write_script(
+        state, temperature=temperature, stream=False, should_stop=cancelled.is_set,
+    )
+    if cancelled.is_set():
+        return None
+    return {"final_script": script, **quality_check_node({**state, "final_script": script})}
+
+
+def _score(result: dict) -> float:
+    report = result["final_script"].quality_report
+    return report.overall_score if report else float("-inf")
+
+
+def script_candidates_node(state: AgentState) -> dict:
+    """LangGraph node: write N candidate scripts concurrently and keep the best."""
+    if state.get("script_outline") is None:
+        return {
+            "final_script": None,
+            "quality_passed": False,
+            "quality_feedback": "No script to evaluate.",
+            "error": "No outline available for script generation.",
+        }
+
+    temperatures = candidate_temperatures(settings.script_candidates)
+    logger.info(
+        "🎬 ScriptCandidatesNode — writing %d candidates (temperatures %s) …",
+        len(temperatures), ", ".join(f"{t:g}" for t in temperatures),
+    )
+
+    start = time.perf_counter()
+    cancelled = threading.Event()
+    best: dict | None = None
+    failures: list[str] = []
+    pool = ThreadPoolExecutor(max_workers=len(temperatures), thread_name_prefix="candidate")
+    try:
+        pending = {pool.submit(_run_candidate, state, t, cancelled): t for t in temperatures}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                temperature = pending.pop(future)
+                try:
+                    result = future.result()
+                except LLMCallCancelled:
+                    continue
+                except Exception as exc:
+                    logger.warning("  Candidate at t=%g failed: %s", temperature, exc)
+                    failures.append(str(exc))
+                    continue
+                if result is None:
+                    continue
+                logger.info(
+                    "  Candidate at t=%g scored %.0f (%s)", temperature, _score(result),
+                    "passed" if result["quality_passed"] else "failed",
+                )
+                if best is None or (result["quality_passed"], _score(result)) > (
+                    best["quality_passed"], _score(best)
+                ):
+                    best = result
+            if best is not None and best["quality_passed"]:
+                break
+    finally:
+        # Losers stop at their next LLM call or chunk; wait so none outlive the node
+        cancelled.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    if best is None:
+        error = f"Script generation error: all {len(temperatures)} candidates failed"
+        if failures:
+            error += f" ({failures[-1]})"
+        return {
+            "final_script": None,
+            "quality_passed": False,
+            "quality_feedback": "No script to evaluate.",
+            "error": error,
+        }
+
+    script = best["final_script"]
+    logger.info(
+        "✅ Kept '%s' (score=%.0f, %s) after %.1fs",
+        script.title, _score(best), "passed" if best["quality_passed"] else "failed", elapsed,
+    )
+    return {
+        "final_script": script,
+        "quality_passed": best["quality_passed"],
+        "quality_feedback": best["quality_feedback"],
+        "error": "",
+    }
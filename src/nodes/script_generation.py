@@ -4,89 +4,604 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_openai import ChatOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    retry,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from src.config import settings
-from src.models.script import FinalScript, ScriptSection
+from src.models.script import FinalScript, ScriptOutline, ScriptSection
 from src.models.state import AgentState
-from src.prompts.script import SCRIPT_SYSTEM, SCRIPT_USER
+from src.nodes.select_samples import sample_tweets
+from src.prompts.script import (
+    REVISE_SECTION_USER,
+    SCRIPT_SYSTEM,
+    SCRIPT_USER,
+    SECTION_USER,
+    STITCH_SYSTEM,
+    STITCH_USER,
+)
+from src.scoring.script_quality import GENERAL, issues_by_section
+from src.utils.json_stream import SectionStreamParser
+from src.utils.llm import (
+    LLMCallCancelled,
+    cached_invoke,
+    get_llm,
+    parse_json_response,
+    stream_invoke,
+)
+from src.utils.output import DraftWriter
+from src.utils.timestamps import WORDS_PER_MINUTE, range_seconds
 
 logger = logging.getLogger(__name__)
 
+# Extra listeners notified of each section as soon as it streams in
+section_callbacks: list[Callable[[ScriptSection], None]] = []
 
-def _build_llm() -> ChatOpenAI:
-    return ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.7,
-        max_tokens=8192,
+# Polled before each LLM call (and per streamed chunk); True abandons the script
+StopCheck = Callable[[], bool]
+
+
+GENERATION_TEMPERATURE = 0.7
+
+
+def _build_llm(temperature: float = GENERATION_TEMPERATURE) -> ChatOpenAI:
+    return get_llm(temperature=temperature, max_tokens=8192)
+
+
+def _build_section_llm(temperature: float = GENERATION_TEMPERATURE) -> ChatOpenAI:
+    return get_llm(temperature=temperature, max_tokens=2048)
+
+
+def _build_stitch_llm() -> ChatOpenAI:
+    return get_llm(temperature=0.3, max_tokens=1024)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(min=2, max=30),
+    retry=retry_if_not_exception_type(LLMCallCancelled),
+)
+def _generate_script(
+    llm: ChatOpenAI,
+    outline_json: str,
+    narratives_json: str,
+    samples: str,
+    attempt: int = 0,
+    *,
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Ask the LLM to write the full script.
+
+    ``attempt`` keys the response cache so a quality-check retry gets a fresh
+    draft instead of replaying the one that just failed.
+    """
+    user = SCRIPT_USER.format(
+        outline_json=outline_json,
+        narratives_json=narratives_json,
+        sample_tweets=samples,
     )
+    return cached_invoke(llm, [
+        {"role": "system", "content": SCRIPT_SYSTEM},
+        {"role": "user", "content": user},
+    ], cache_tag=f"attempt-{attempt}", should_stop=should_stop)
+
 
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(min=2, max=30),
+    retry=retry_if_not_exception_type(LLMCallCancelled),
+)
+def _stream_script(
+    llm: ChatOpenAI,
+    outline_json: str,
+    narratives_json: str,
+    samples: str,
+    attempt: int,
+    on_section: Callable[[ScriptSection], None],
+    *,
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Stream the full script, handing each section to ``on_section`` as it closes.
 
-def _sample_tweets(state: AgentState, max_samples: int = 15) -> str:
-    """Pick the highest-signal tweets as paraphrased reference for the LLM."""
-    tweets = state.get("tweets_filtered", [])
-    top = sorted(tweets, key=lambda t: t.engagement_score, reverse=True)[:max_samples]
-    lines = []
-    for t in top:
-        lines.append(
-            f"- @{t.author.username} ({t.author.followers_count:,} followers, "
-            f"cred={t.credibility_score:.0f}): \"{t.text[:200]}\""
+    A response cut off mid-way (or a stream that drops after at least one
+    section) yields the sections completed so far instead of raising; a
+    cancelled stream always raises.
+    """
+    user = SCRIPT_USER.format(
+        outline_json=outline_json,
+        narratives_json=narratives_json,
+        sample_tweets=samples,
+    )
+    parser = SectionStreamParser(lambda raw: on_section(_section(raw)))
+    try:
+        stream_invoke(llm, [
+            {"role": "system", "content": SCRIPT_SYSTEM},
+            {"role": "user", "content": user},
+        ], on_text=parser.feed, cache_tag=f"attempt-{attempt}", should_stop=should_stop)
+    except Exception as exc:
+        if isinstance(exc, LLMCallCancelled) or not parser.sections:
+            raise
+        logger.warning("Script stream failed after %d sections: %s", len(parser.sections), exc)
+    if not parser.complete:
+        if not parser.sections:
+            raise ValueError("Streamed script contained no complete sections")
+        logger.warning(
+            "⚠️  Script response truncated — keeping %d completed sections", len(parser.sections),
         )
-    return "\n".join(lines) if lines else "(no sample tweets available)"
+    return parser.result()
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
-def _generate_script(llm: ChatOpenAI, outline_json: str, narratives_json: str, samples: str) -> dict:
-    """Ask the LLM to write the full script."""
-    user = SCRIPT_USER.format(
+# ── Section-parallel mode ─────────────────────────────────────
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _parse_object(content: str) -> dict:
+    """Parse a per-section reply, rejecting anything but a JSON object.
+
+    Raising here keeps the reply out of the response cache, so the call's
+    retry asks the model again.
+    """
+    parsed = parse_json_response(content)
+    if not isinstance(parsed, dict):
+        raise ValueError(f"Expected a JSON object, got {type(parsed).__name__}")
+    return parsed
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(min=2, max=30),
+    retry=retry_if_not_exception_type(LLMCallCancelled),
+)
+def _generate_section(
+    llm: ChatOpenAI,
+    outline: ScriptOutline,
+    index: int,
+    outline_json: str,
+    narratives_json: str,
+    samples: str,
+    attempt: int = 0,
+    *,
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Write one outline section on its own, with the shared narrative context."""
+    sections = outline.sections
+    section = sections[index]
+    seconds = range_seconds(section.timestamp)
+    if seconds is None:
+        seconds = outline.target_minutes * 60 / max(len(sections), 1)
+    user = SECTION_USER.format(
+        section_name=section.section_name,
+        timestamp=section.timestamp,
+        position=index + 1,
+        total=len(sections),
+        content_notes=section.content,
+        stage_direction=section.stage_direction or "(none)",
+        previous_section=(
+            sections[index - 1].section_name if index > 0 else "(none — opens the video)"
+        ),
+        next_section=(
+            sections[index + 1].section_name if index + 1 < len(sections)
+            else "(none — closes the video)"
+        ),
         outline_json=outline_json,
         narratives_json=narratives_json,
         sample_tweets=samples,
+        target_words=round(seconds / 60 * WORDS_PER_MINUTE),
     )
-    response = llm.invoke([
+    return cached_invoke(llm, [
         {"role": "system", "content": SCRIPT_SYSTEM},
         {"role": "user", "content": user},
-    ])
-    raw = response.content.strip()
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-    return json.loads(raw)
+    ], parse=_parse_object, cache_tag=f"attempt-{attempt}", should_stop=should_stop)
 
 
-def script_generation_node(state: AgentState) -> dict:
-    """LangGraph node: generate the full script."""
+def _edge(text: str, *, tail: bool, sentences: int = 2) -> str:
+    parts = [p for p in _SENTENCE_END.split(text.strip()) if p]
+    return " ".join(parts[-sentences:] if tail else parts[:sentences])
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(min=2, max=30),
+    retry=retry_if_not_exception_type(LLMCallCancelled),
+)
+def _stitch(
+    llm: ChatOpenAI,
+    title: str,
+    sections: list[ScriptSection],
+    attempt: int = 0,
+    *,
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Ask for transition bridges and packaging from the section boundaries only."""
+    boundaries = [
+        {
+            "after_section": a.section_name,
+            "ends_with": _edge(a.content, tail=True),
+            "next_section": b.section_name,
+            "next_begins_with": _edge(b.content, tail=False),
+        }
+        for a, b in zip(sections, sections[1:])
+    ]
+    user = STITCH_USER.format(
+        title=title,
+        boundaries_json=json.dumps(boundaries, indent=2, ensure_ascii=False),
+    )
+    return cached_invoke(llm, [
+        {"role": "system", "content": STITCH_SYSTEM},
+        {"role": "user", "content": user},
+    ], parse=_parse_object, cache_tag=f"attempt-{attempt}", should_stop=should_stop)
+
+
+def _generate_by_section(
+    outline: ScriptOutline,
+    outline_json: str,
+    narratives_json: str,
+    samples: str,
+    attempt: int,
+    on_section: Callable[[ScriptSection], None] | None = None,
+    temperature: float = GENERATION_TEMPERATURE,
+    *,
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Write every outline section concurrently, then stitch them together.
+
+    Returns the same shape as the single-call response. Sections are merged
+    (and streamed to ``on_section``) in outline order.
+    """
+    llm = _build_section_llm(temperature)
+    count = len(outline.sections)
+    workers = max(1, min(settings.script_section_concurrency, count))
+    start = time.perf_counter()
+    sections: list[ScriptSection] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="section") as pool:
+        futures = [
+            pool.submit(
+                _generate_section, llm, outline, i, outline_json, narratives_json, samples, attempt,
+                should_stop=should_stop,
+            )
+            for i in range(count)
+        ]
+        for i, future in enumerate(futures):
+            planned = outline.sections[i]
+            try:
+                section = _planned_section(planned, future.result())
+            except LLMCallCancelled:
+                raise
+            except Exception as exc:
+                # Left out, so the quality check flags it missing and a retry writes it
+                logger.warning(
+                    "Section '%s' failed — leaving it out: %s", planned.section_name, exc,
+                )
+                continue
+            sections.append(section)
+            if on_section is not None:
+                on_section(section)
+    if not sections:
+        raise ValueError(f"All {count} sections failed")
+    logger.info(
+        "  %d of %d sections written in %.1fs (%d in flight)",
+        len(sections), count, time.perf_counter() - start, workers,
+    )
+
+    packaging: dict = {}
+    try:
+        packaging = _stitch(
+            _build_stitch_llm(), outline.title, sections, attempt, should_stop=should_stop,
+        )
+    except LLMCallCancelled:
+        raise
+    except Exception as exc:
+        logger.warning("Stitching pass failed — assembling without bridges: %s", exc)
+
+    bridges = {
+        t.get("after_section"): t.get("bridge", "").strip()
+        for t in packaging.get("transitions", [])
+        if isinstance(t, dict)
+    }
+    for section in sections[:-1]:
+        bridge = bridges.get(section.section_name)
+        if bridge:
+            section.content = f"{section.content.rstrip()} {bridge}"
+
+    words = sum(len(s.content.split()) for s in sections)
+    return {
+        "title": packaging.get("title") or outline.title,
+        "thumbnail_text": packaging.get("thumbnail_text") or outline.thumbnail_hook,
+        "description": packaging.get("description", ""),
+        "tags": packaging.get("tags", []),
+        "estimated_duration_minutes": round(words / WORDS_PER_MINUTE, 1),
+        "sections": [s.model_dump() for s in sections],
+    }
+
+
+# ── Targeted revision on retry ────────────────────────────────
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(min=2, max=30),
+    retry=retry_if_not_exception_type(LLMCallCancelled),
+)
+def _revise_section(
+    llm: ChatOpenAI,
+    script: FinalScript,
+    index: int,
+    issues: list[str],
+    general_issues: list[str],
+    feedback: str,
+    narratives_json: str,
+    samples: str,
+    attempt: int,
+    *,
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Rewrite one section of a failed script against the reviewer's issues."""
+    sections = script.sections
+    section = sections[index]
+    seconds = range_seconds(section.timestamp)
+    target_words = (
+        round(seconds / 60 * WORDS_PER_MINUTE) if seconds else len(section.content.split())
+    )
+    user = REVISE_SECTION_USER.format(
+        section_name=section.section_name,
+        timestamp=section.timestamp,
+        current_content=section.content,
+        issues="\n".join(f"- {issue}" for issue in issues) or "(none)",
+        general_issues="\n".join(f"- {issue}" for issue in general_issues) or "(none)",
+        feedback=feedback or "(none)",
+        previous_edge=(
+            _edge(sections[index - 1].content, tail=True) if index > 0
+            else "(none — opens the video)"
+        ),
+        next_edge=(
+            _edge(sections[index + 1].content, tail=False) if index + 1 < len(sections)
+            else "(none — closes the video)"
+        ),
+        narratives_json=narratives_json,
+        sample_tweets=samples,
+        target_words=target_words,
+    )
+    return cached_invoke(llm, [
+        {"role": "system", "content": SCRIPT_SYSTEM},
+        {"role": "user", "content": user},
+    ], parse=_parse_object, cache_tag=f"attempt-{attempt}", should_stop=should_stop)
+
+
+def _missing_sections(script: FinalScript, outline: ScriptOutline | None) -> list[int]:
+    """Outline indices of the sections the script never got to (e.g. a cut-off stream)."""
+    if outline is None:
+        return []
+    written = {s.section_name for s in script.sections}
+    return [i for i, s in enumerate(outline.sections) if s.section_name not in written]
+
+
+def _revision_targets(
+    script: FinalScript | None, outline: ScriptOutline | None = None,
+) -> tuple[dict[int, list[str]], list[int]]:
+    """Plan a targeted retry of a failed script.
+
+    Returns the script's section indices with the issues raised against each,
+    and the outline indices of sections missing from the script, which are
+    written fresh. Both are empty when the script should be rewritten in full.
+    """
+    if script is None or script.quality_report is None or not script.sections:
+        return {}, []
+    report = script.quality_report
+    missing = _missing_sections(script, outline)
+    if report.source == "local" and not missing:
+        # Failed the local gate for something section edits won't fix (length, …)
+        return {}, []
+    names = [s.section_name for s in script.sections]
+    if outline is not None:
+        names += [outline.sections[i].section_name for i in missing]
+    mapped = issues_by_section(report.issues, names)
+    targets = {
+        i: mapped[section.section_name]
+        for i, section in enumerate(script.sections)
+        if section.section_name in mapped
+    }
+    return targets, missing
+
+
+def _revise_script(
+    script: FinalScript,
+    targets: dict[int, list[str]],
+    narratives_json: str,
+    samples: str,
+    attempt: int,
+    temperature: float = GENERATION_TEMPERATURE,
+    *,
+    outline: ScriptOutline | None = None,
+    missing: list[int] | None = None,
+    outline_json: str = "",
+    should_stop: StopCheck | None = None,
+) -> dict:
+    """Rewrite only the flagged sections and write any missing ones from the outline.
+
+    Every other section is kept verbatim. Returns the same shape as the
+    single-call response, reusing the failed script's packaging.
+    """
+    report = script.quality_report
+    feedback = report.feedback if report else ""
+    missing = missing or []
+    # Issues naming a missing section are settled by writing it, so map those away too
+    names = [s.section_name for s in script.sections]
+    names += [outline.sections[i].section_name for i in missing]
+    general = issues_by_section(report.issues, names).get(GENERAL, []) if report else []
+    llm = _build_section_llm(temperature)
+    workers = max(1, min(settings.script_section_concurrency, len(targets) + len(missing)))
+    sections = [s.model_copy() for s in script.sections]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="revise") as pool:
+        futures = {
+            i: pool.submit(
+                _revise_section, llm, script, i, issues, general, feedback,
+                narratives_json, samples, attempt, should_stop=should_stop,
+            )
+            for i, issues in targets.items()
+        }
+        fresh = {
+            i: pool.submit(
+                _generate_section, llm, outline, i, outline_json, narratives_json, samples, attempt,
+                should_stop=should_stop,
+            )
+            for i in missing
+        }
+        for i, future in futures.items():
+            try:
+                raw = future.result()
+            except LLMCallCancelled:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "Revising '%s' failed — keeping it as is: %s", sections[i].section_name, exc,
+                )
+                continue
+            content = raw.get("content")
+            if content:
+                sections[i].content = content
+            if raw.get("stage_direction"):
+                sections[i].stage_direction = raw["stage_direction"]
+        for i, future in fresh.items():
+            planned = outline.sections[i]
+            try:
+                section = _planned_section(planned, future.result())
+            except LLMCallCancelled:
+                raise
+            except Exception as exc:
+                logger.warning("Section '%s' failed — still missing: %s", planned.section_name, exc)
+                continue
+            # Slot it in after the last section that precedes it in the outline
+            before = {s.section_name for s in outline.sections[:i]}
+            position = max(
+                (j + 1 for j, s in enumerate(sections) if s.section_name in before), default=0,
+            )
+            sections.insert(position, section)
+
+    words = sum(len(s.content.split()) for s in sections)
+    return {
+        "title": script.title,
+        "thumbnail_text": script.thumbnail_text,
+        "description": script.description,
+        "tags": list(script.tags),
+        "estimated_duration_minutes": round(words / WORDS_PER_MINUTE, 1),
+        "sections": [s.model_dump() for s in sections],
+    }
+
+
+def _planned_section(planned: ScriptSection, raw: dict) -> ScriptSection:
+    """A written section, keeping the outline's name and timestamp unless the reply sets them."""
+    return _section({
+        "section_name": planned.section_name,
+        "timestamp": planned.timestamp,
+        **{k: v for k, v in raw.items() if v},
+    })
+
+
+def _section(raw: dict) -> ScriptSection:
+    return ScriptSection(
+        section_name=raw.get("section_name", ""),
+        timestamp=raw.get("timestamp", ""),
+        content=raw.get("content", ""),
+        stage_direction=raw.get("stage_direction", ""),
+    )
+
+
+def _section_emitter() -> Callable[[ScriptSection], None]:
+    """Send each streamed section to stdout, the draft file and any callbacks."""
+    draft = DraftWriter(settings.output_dir)
+    start = time.perf_counter()
+    count = 0
+
+    def emit(section: ScriptSection) -> None:
+        nonlocal count
+        count += 1
+        if count == 1:
+            logger.info("  First section streamed after %.1fs", time.perf_counter() - start)
+        print(section.render(), flush=True)
+        draft(section)
+        for callback in section_callbacks:
+            callback(section)
+
+    return emit
+
+
+def _discard(_section: ScriptSection) -> None:
+    pass
+
+
+def write_script(
+    state: AgentState,
+    *,
+    temperature: float = GENERATION_TEMPERATURE,
+    stream: bool | None = None,
+    should_stop: StopCheck | None = None,
+) -> FinalScript:
+    """Write (or, on a retry, revise) the script for the current state.
+
+    ``stream`` defaults to ``settings.script_streaming``. Raises on failure,
+    including ``LLMCallCancelled`` once ``should_stop`` returns True.
+    """
     outline = state.get("script_outline")
     narratives = state.get("dominant_narratives", [])
-    logger.info("🎬 ScriptGenerationNode — writing full script …")
-
     if outline is None:
-        return {"final_script": None, "error": "No outline available for script generation."}
+        raise ValueError("No outline available for script generation.")
+    if stream is None:
+        stream = settings.script_streaming
 
-    llm = _build_llm()
     outline_json = json.dumps(outline.model_dump(), indent=2)
     narratives_json = json.dumps([n.model_dump() for n in narratives], indent=2)
-    samples = _sample_tweets(state)
-
-    try:
-        raw = _generate_script(llm, outline_json, narratives_json, samples)
-    except Exception as exc:
-        logger.exception("Script generation failed")
-        return {"final_script": None, "error": f"Script generation error: {exc}"}
+    # Normally selected alongside the outline; fall back if that branch didn't run
+    samples = state.get("sample_tweets") or sample_tweets(state.get("tweets_filtered", []))
 
-    sections = [
-        ScriptSection(
-            section_name=s.get("section_name", ""),
-            timestamp=s.get("timestamp", ""),
-            content=s.get("content", ""),
-            stage_direction=s.get("stage_direction", ""),
+    attempt = state.get("retry_count", 0)
+    previous = state.get("final_script")
+    targets, missing = (
+        _revision_targets(previous, outline)
+        if attempt and settings.script_targeted_retry else ({}, [])
+    )
+    if targets or missing:
+        names = ", ".join(previous.sections[i].section_name for i in targets)
+        logger.info(
+            "  Revising %d of %d sections flagged by the quality check: %s",
+            len(targets), len(previous.sections), names or "(none)",
+        )
+        if missing:
+            logger.info(
+                "  Writing %d missing sections from the outline: %s",
+                len(missing), ", ".join(outline.sections[i].section_name for i in missing),
+            )
+        raw = _revise_script(
+            previous, targets, narratives_json, samples, attempt, temperature,
+            outline=outline, missing=missing, outline_json=outline_json,
+            should_stop=should_stop,
+        )
+    elif settings.script_generation_mode == "sections" and outline.sections:
+        raw = _generate_by_section(
+            outline, outline_json, narratives_json, samples, attempt,
+            _section_emitter() if stream else None, temperature, should_stop=should_stop,
+        )
+    elif stream or should_stop is not None:
+        # A cancellable call streams too, so it can stop mid-response
+        raw = _stream_script(
+            _build_llm(temperature), outline_json, narratives_json, samples, attempt,
+            _section_emitter() if stream else _discard, should_stop=should_stop,
+        )
+    else:
+        raw = _generate_script(
+            _build_llm(temperature), outline_json, narratives_json, samples, attempt,
         )
-        for s in raw.get("sections", [])
-    ]
+
+    sections = [_section(s) for s in raw.get("sections", [])]
 
     full_text = "\n\n".join(s.content for s in sections if s.content)
 
@@ -99,6 +614,21 @@ def script_generation_node(state: AgentState) -> dict:
         sections=sections,
         full_text=full_text,
     )
+    return script
+
+
+def script_generation_node(state: AgentState) -> dict:
+    """LangGraph node: generate the full script."""
+    logger.info("🎬 ScriptGenerationNode — writing full script …")
+
+    if state.get("script_outline") is None:
+        return {"final_script": None, "error": "No outline available for script generation."}
+
+    try:
+        script = write_script(state)
+    except Exception as exc:
+        logger.exception("Script generation failed")
+        return {"final_script": None, "error": f"Script generation error: {exc}"}
 
     logger.info("✅ Script generated: '%s' (~%.1f min)", script.title, script.estimated_duration_minutes)
     return {"final_script": script, "error": ""}
@@ -12,17 +12,13 @@ from src.config import settings
 from src.models.script import ScriptOutline, ScriptSection
 from src.models.state import AgentState
 from src.prompts.script import OUTLINE_SYSTEM, OUTLINE_USER
+from src.utils.llm import cached_invoke, get_llm
 
 logger = logging.getLogger(__name__)
 
 
 def _build_llm() -> ChatOpenAI:
-    return ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.5,
-        max_tokens=4096,
-    )
+    return get_llm(temperature=0.5, max_tokens=4096)
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
@@ -32,16 +28,10 @@ def _generate_outline(llm: ChatOpenAI, narratives_json: str, target_minutes: int
         narratives_json=narratives_json,
         target_minutes=target_minutes,
     )
-    response = llm.invoke([
+    return cached_invoke(llm, [
         {"role": "system", "content": OUTLINE_SYSTEM},
         {"role": "user", "content": user},
     ])
-    raw = response.content.strip()
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-    return json.loads(raw)
 
 
 def script_outline_node(state: AgentState) -> dict:
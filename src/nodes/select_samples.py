@@ -0,0 +1,29 @@
+"""SelectSamplesNode — picks the reference tweets the script writer paraphrases."""
+
+from __future__ import annotations
+
+import logging
+
+from src.models.state import AgentState
+from src.models.tweets import Tweet
+
+logger = logging.getLogger(__name__)
+
+
+def sample_tweets(tweets: list[Tweet], max_samples: int = 15) -> str:
+    """Pick the highest-signal tweets as paraphrased reference for the LLM."""
+    top = sorted(tweets, key=lambda t: t.engagement_score, reverse=True)[:max_samples]
+    lines = []
+    for t in top:
+        lines.append(
+            f"- @{t.author.username} ({t.author.followers_count:,} followers, "
+            f"cred={t.credibility_score:.0f}): \"{t.text[:200]}\""
+        )
+    return "\n".join(lines) if lines else "(no sample tweets available)"
+
+
+def select_samples_node(state: AgentState) -> dict:
+    """LangGraph node: format sample tweets while the outline is being drafted."""
+    tweets = state.get("tweets_filtered", [])
+    logger.info("🧾 SelectSamplesNode — choosing samples from %d tweets", len(tweets))
+    return {"sample_tweets": sample_tweets(tweets)}
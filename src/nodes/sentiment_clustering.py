@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_openai import ChatOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -11,17 +14,47 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from src.config import settings
 from src.models.state import AgentState
 from src.prompts.sentiment import SENTIMENT_SYSTEM, SENTIMENT_USER
+from src.scoring.clustering import cluster_tweets
+from src.scoring.lexicon import score_sentiment
+from src.utils.llm import cached_invoke, get_llm
+from src.utils.sentiment_store import SentimentStore
+from src.utils.tokens import estimate_tokens, pack_batches
 
 logger = logging.getLogger(__name__)
 
+SENTIMENT_TEMPERATURE = 0.3
+
+# Rough size of one result object in the model's reply (id, labels, key phrases)
+OUTPUT_TOKENS_PER_TWEET = 60
+
 
 def _build_llm() -> ChatOpenAI:
-    return ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.3,
-        max_tokens=4096,
+    return get_llm(
+        temperature=SENTIMENT_TEMPERATURE,
+        max_tokens=settings.sentiment_batch_output_tokens,
+    )
+
+
+_store: SentimentStore | None = None
+
+
+def get_sentiment_store() -> SentimentStore | None:
+    """Return the cross-run sentiment store, or None when it is disabled."""
+    global _store
+    if _store is None and settings.sentiment_store_path:
+        _store = SentimentStore(
+            settings.sentiment_store_path,
+            ttl_seconds=settings.sentiment_store_ttl_hours * 3600,
+        )
+    return _store
+
+
+def sentiment_version() -> str:
+    """Fingerprint of everything that shapes a per-tweet result."""
+    material = "\x00".join(
+        (settings.openai_model, str(SENTIMENT_TEMPERATURE), SENTIMENT_SYSTEM, SENTIMENT_USER)
     )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
@@ -29,19 +62,76 @@ def _analyse_batch(llm: ChatOpenAI, tweets_data: list[dict]) -> list[dict]:
     """Send a batch of tweets to the LLM for sentiment analysis."""
     prompt_text = SENTIMENT_USER.format(
         count=len(tweets_data),
-        tweets_json=json.dumps(tweets_data, indent=2),
+        tweets_json=_compact_json(tweets_data),
     )
-    response = llm.invoke([
+    return cached_invoke(llm, [
         {"role": "system", "content": SENTIMENT_SYSTEM},
         {"role": "user", "content": prompt_text},
     ])
-    raw = response.content.strip()
-    # Strip markdown code fences if present
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-    return json.loads(raw)
+
+
+def _compact_json(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def plan_sentiment_batches(tweets_data: list[dict]) -> list[list[dict]]:
+    """Pack tweets into batches that fit the configured input/output token budgets."""
+    overhead = estimate_tokens(SENTIMENT_SYSTEM) + estimate_tokens(
+        SENTIMENT_USER.format(count=len(tweets_data), tweets_json="[]")
+    )
+    budget = max(settings.sentiment_batch_input_tokens - overhead, 1)
+    max_items = max(settings.sentiment_batch_output_tokens // OUTPUT_TOKENS_PER_TWEET, 1)
+    # +1 per tweet for the separating comma
+    costs = [estimate_tokens(_compact_json(t)) + 1 for t in tweets_data]
+    return [
+        [tweets_data[i] for i in indices]
+        for indices in pack_batches(costs, budget=budget, max_items=max_items)
+    ]
+
+
+def resolve_locally(tweets_data: list[dict]) -> tuple[dict[str, dict], list[dict]]:
+    """Split tweets into confident lexicon results and those needing the LLM.
+
+    Follows ``settings.sentiment_mode``: ``llm`` sends everything on,
+    ``lexicon`` keeps everything local, ``cascade`` keeps results whose
+    confidence reaches ``sentiment_lexicon_min_confidence``.
+    """
+    mode = settings.sentiment_mode
+    if mode == "llm":
+        return {}, list(tweets_data)
+
+    local: dict[str, dict] = {}
+    remaining: list[dict] = []
+    for t in tweets_data:
+        result = score_sentiment(t["text"])
+        if mode == "lexicon" or result.confidence >= settings.sentiment_lexicon_min_confidence:
+            local[t["tweet_id"]] = {
+                "tweet_id": t["tweet_id"],
+                "sentiment": result.sentiment,
+                "intensity": result.intensity,
+                "emotion": result.emotion,
+                "key_phrases": result.key_phrases,
+                "source": "lexicon",
+            }
+        else:
+            remaining.append(t)
+    return local, remaining
+
+
+def _run_batch(llm: ChatOpenAI, index: int, batch: list[dict]) -> list[dict]:
+    """Analyse one batch, logging its latency; a failed batch yields no results."""
+    start = time.perf_counter()
+    try:
+        results = _analyse_batch(llm, batch)
+    except Exception as exc:
+        logger.error(
+            "Sentiment batch %d failed after %.1fs: %s", index, time.perf_counter() - start, exc,
+        )
+        return []
+    logger.info(
+        "  Sentiment batch %d: %d tweets in %.1fs", index, len(batch), time.perf_counter() - start,
+    )
+    return results
 
 
 def sentiment_clustering_node(state: AgentState) -> dict:
@@ -50,30 +140,57 @@ def sentiment_clustering_node(state: AgentState) -> dict:
     logger.info("🧠 SentimentClusteringNode — analysing %d tweets …", len(tweets))
 
     if not tweets:
-        return {"sentiment_clusters": [], "error": "No tweets for sentiment analysis."}
-
-    llm = _build_llm()
+        return {
+            "sentiment_clusters": [],
+            "tweet_clusters": [],
+            "error": "No tweets for sentiment analysis.",
+        }
 
     # Prepare minimal tweet dicts for the LLM
     tweets_for_llm = [
-        {"tweet_id": t.id, "text": t.text, "engagement_score": t.engagement_score}
+        {"tweet_id": t.id, "text": t.text, "engagement_score": round(t.engagement_score, 1)}
         for t in tweets
     ]
 
-    # Batch in groups of 30 to stay within context window
-    batch_size = 30
-    all_results: list[dict] = []
-
-    for i in range(0, len(tweets_for_llm), batch_size):
-        batch = tweets_for_llm[i : i + batch_size]
-        try:
-            results = _analyse_batch(llm, batch)
-            all_results.extend(results)
-        except Exception as exc:
-            logger.error("Sentiment batch %d failed: %s", i // batch_size, exc)
+    # Easy cases are labelled locally by the lexicon scorer
+    local, uncertain = resolve_locally(tweets_for_llm)
+
+    # Results from earlier runs are reused; only unseen tweets go to the LLM
+    store = get_sentiment_store()
+    version = sentiment_version()
+    stored = store.get_many(version, (t["tweet_id"] for t in uncertain)) if store else {}
+    pending = [t for t in uncertain if t["tweet_id"] not in stored]
+
+    # Pack by estimated token cost so long tweets can't overflow the context window
+    batches = plan_sentiment_batches(pending)
+
+    # Dispatch batches concurrently; results are merged in batch order
+    fresh: list[dict] = []
+    if batches:
+        llm = _build_llm()
+        start = time.perf_counter()
+        workers = max(1, min(settings.sentiment_max_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sentiment") as pool:
+            futures = [pool.submit(_run_batch, llm, i, batch) for i, batch in enumerate(batches)]
+            for future in futures:
+                fresh.extend(future.result())
+        logger.info(
+            "  %d sentiment batches in %.1fs (%d in flight)",
+            len(batches), time.perf_counter() - start, workers,
+        )
+
+    requested = {t["tweet_id"] for t in pending}
+    fresh_map = {r["tweet_id"]: r for r in fresh if r.get("tweet_id") in requested}
+    if store is not None and fresh_map:
+        store.put_many(version, fresh_map.values())
+    logger.info(
+        "  Sentiment mix (%s): %d lexicon, %d stored, %d sent to the LLM",
+        settings.sentiment_mode, len(local), len(stored), len(pending),
+    )
 
-    # Map results back to Tweet objects
-    result_map = {r["tweet_id"]: r for r in all_results if "tweet_id" in r}
+    # Map results back to Tweet objects, in tweet order
+    result_map = {**local, **stored, **fresh_map}
+    all_results = [result_map[tw.id] for tw in tweets if tw.id in result_map]
     for tw in tweets:
         if tw.id in result_map:
             r = result_map[tw.id]
@@ -81,4 +198,15 @@ def sentiment_clustering_node(state: AgentState) -> dict:
             tw.sentiment_intensity = float(r.get("intensity", 0.0))
 
     logger.info("✅ Sentiment analysed for %d / %d tweets", len(result_map), len(tweets))
-    return {"sentiment_clusters": all_results, "tweets_filtered": tweets, "error": ""}
+
+    # Group tweets into topic clusters locally for narrative extraction
+    clusters = cluster_tweets(
+        tweets, settings.narrative_cluster_count,
+        max_representatives=settings.cluster_representatives,
+    )
+    return {
+        "sentiment_clusters": all_results,
+        "tweet_clusters": clusters,
+        "tweets_filtered": tweets,
+        "error": "",
+    }
@@ -9,8 +9,12 @@ from src.prompts.sentiment import (
 from src.prompts.script import (
     OUTLINE_SYSTEM,
     OUTLINE_USER,
+    REVISE_SECTION_USER,
     SCRIPT_SYSTEM,
     SCRIPT_USER,
+    SECTION_USER,
+    STITCH_SYSTEM,
+    STITCH_USER,
     QUALITY_SYSTEM,
     QUALITY_USER,
 )
@@ -22,8 +26,12 @@ __all__ = [
     "OUTLINE_USER",
     "QUALITY_SYSTEM",
     "QUALITY_USER",
+    "REVISE_SECTION_USER",
     "SCRIPT_SYSTEM",
     "SCRIPT_USER",
+    "SECTION_USER",
     "SENTIMENT_SYSTEM",
     "SENTIMENT_USER",
+    "STITCH_SYSTEM",
+    "STITCH_USER",
 ]
@@ -136,6 +136,101 @@ Return JSON:
   ]
 }}"""
 
+SECTION_USER = """Write ONLY the "{section_name}" section ({timestamp}) of this video.
+It is section {position} of {total}; the other sections are being written in parallel.
+
+SECTION NOTES:
+{content_notes}
+
+STAGE DIRECTION:
+{stage_direction}
+
+PREVIOUS SECTION: {previous_section}
+NEXT SECTION: {next_section}
+
+FULL OUTLINE (for context — do not write the other sections):
+{outline_json}
+
+NARRATIVES WITH SUPPORTING DATA:
+{narratives_json}
+
+SAMPLE PARAPHRASED SENTIMENT (do NOT read verbatim):
+{sample_tweets}
+
+Aim for about {target_words} words of spoken script.
+
+Return JSON:
+{{
+  "section_name": "{section_name}",
+  "timestamp": "{timestamp}",
+  "content": "FULL spoken-word script for this section",
+  "stage_direction": "..."
+}}"""
+
+STITCH_SYSTEM = """You are the editor of an NFL YouTube channel. Sections of a script were
+written separately; you smooth the hand-offs between them and package the video.
+Keep the host's voice: first person, spoken-word, confident.
+
+Return ONLY valid JSON. No markdown fencing."""
+
+STITCH_USER = """Working title: {title}
+
+Below are the boundaries between consecutive sections — how each one ends and
+how the next begins.
+
+BOUNDARIES:
+{boundaries_json}
+
+For each boundary write one short spoken bridge (max 2 sentences) that will be
+appended to the end of the earlier section so it flows into the next. Leave the
+bridge empty if the hand-off already works.
+
+Return JSON:
+{{
+  "title": "...",
+  "thumbnail_text": "max 5 words",
+  "description": "YouTube description (2-3 paragraphs, SEO optimised)",
+  "tags": ["tag1", "tag2", ...],
+  "transitions": [
+    {{"after_section": "section name", "bridge": "..."}}
+  ]
+}}"""
+
+REVISE_SECTION_USER = """A reviewer flagged problems in the "{section_name}" section ({timestamp})
+of this video script. Rewrite ONLY this section to fix them. The other sections
+stay exactly as they are, so keep the hand-offs intact.
+
+CURRENT SECTION:
+{current_content}
+
+ISSUES IN THIS SECTION:
+{issues}
+
+ISSUES WITH THE WHOLE SCRIPT (fix what this section can):
+{general_issues}
+
+REVIEWER FEEDBACK ON THE WHOLE SCRIPT:
+{feedback}
+
+PREVIOUS SECTION ENDS WITH: {previous_edge}
+NEXT SECTION BEGINS WITH: {next_edge}
+
+NARRATIVES WITH SUPPORTING DATA:
+{narratives_json}
+
+SAMPLE PARAPHRASED SENTIMENT (do NOT read verbatim):
+{sample_tweets}
+
+Aim for about {target_words} words of spoken script.
+
+Return JSON:
+{{
+  "section_name": "{section_name}",
+  "timestamp": "{timestamp}",
+  "content": "Revised spoken-word script for this section",
+  "stage_direction": "..."
+}}"""
+
 QUALITY_SYSTEM = """You are a YouTube content quality analyst specialising in retention optimisation.
 You review NFL video scripts and evaluate them on:
 1. Hook strength (first 20 seconds)
@@ -159,7 +254,11 @@ Return JSON:
   "overall_score": 0-100,
   "retention_estimate": 0.0-1.0,
   "feedback": "Detailed feedback paragraph",
-  "issues": ["issue1", "issue2"]
+  "issues": ["[Section Name] issue1", "[General] issue2"]
 }}
 
+Start every issue with the exact name of the section it concerns in square
+brackets, e.g. "[Big Take] the claim isn't backed by any numbers". Use
+"[General]" only for problems that span the whole script.
+
 Pass threshold: overall_score >= 70 AND retention_estimate >= 0.45"""
@@ -27,27 +27,30 @@ Return a JSON array with one object per tweet:
 ]"""
 
 CLUSTERING_SYSTEM = """You are an expert at identifying dominant narratives in sports discourse.
-Given a set of tweets with sentiment labels, group them into {num_clusters} distinct narrative clusters.
-Each cluster should represent a coherent storyline or debate.
+You receive topic clusters of tweets that were grouped by wording, each with its
+size, engagement, majority sentiment and a few representative tweets. Merge and
+interpret them into {num_clusters} distinct narratives.
+Each narrative should represent a coherent storyline or debate.
 
 Return ONLY valid JSON. No markdown fencing."""
 
-CLUSTERING_USER = """Here are {count} scored and sentiment-labeled NFL tweets from the last post-game window.
+CLUSTERING_USER = """Here are {count} topic clusters built from scored and sentiment-labeled NFL
+tweets from the last post-game window.
 
-TWEETS:
-{tweets_json}
+CLUSTERS:
+{clusters_json}
 
-Identify exactly {num_clusters} dominant narrative clusters. For each:
+Identify exactly {num_clusters} dominant narratives. A narrative may draw on one
+or several clusters; list every cluster it is built from. For each:
 
 [
   {{
-    "cluster_id": 0,
     "title": "Short narrative title",
     "summary": "2-3 sentence summary of the narrative",
     "emotion": "primary emotion",
     "intensity": 0.0-1.0,
     "stance": "consensus|divided|polarized",
-    "tweet_ids": ["id1", "id2", ...],
+    "cluster_ids": [0, 3],
     "key_phrases": ["phrase1", "phrase2"],
     "counter_arguments": ["counter1", "counter2"]
   }}
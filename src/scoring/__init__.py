@@ -1,6 +1,6 @@
 """Scoring package."""
 
-from src.scoring.engagement import score_tweets
+from src.scoring.engagement import engagement_scores, score_tweets
 from src.scoring.credibility import score_credibility
 
-__all__ = ["score_tweets", "score_credibility"]
+__all__ = ["engagement_scores", "score_tweets", "score_credibility"]
@@ -0,0 +1,113 @@
+"""Local topic clustering of filtered tweets.
+
+Tweets are vectorised with TF-IDF (unigrams + bigrams, English stop words
+removed) and grouped with MiniBatchKMeans. Each cluster becomes a
+``SentimentCluster`` carrying its top terms as a label, the majority sentiment,
+mean intensity, size and the texts closest to its centroid, so narrative
+extraction can reason over a handful of cluster summaries instead of every
+tweet. Clusters are numbered by total engagement, highest first. A cluster's
+``tweet_ids`` also list the near-copies collapsed into its members.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import Counter
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.models.narratives import SentimentCluster
+from src.models.tweets import Tweet
+
+logger = logging.getLogger(__name__)
+
+MAX_AUTO_CLUSTERS = 30
+LABEL_TERMS = 3
+
+
+def auto_cluster_count(n_tweets: int) -> int:
+    """Rule-of-thumb cluster count, ``sqrt(n / 2)`` clamped to a sensible range."""
+    if n_tweets < 2:
+        return 1
+    return max(2, min(round(math.sqrt(n_tweets / 2)), MAX_AUTO_CLUSTERS, n_tweets))
+
+
+def cluster_tweets(
+    tweets: list[Tweet],
+    n_clusters: int = 0,
+    *,
+    max_representatives: int = 3,
+    random_state: int = 0,
+) -> list[SentimentCluster]:
+    """Cluster ``tweets`` by text and set each tweet's ``narrative_cluster``.
+
+    ``n_clusters`` of 0 picks a count from the number of tweets.
+    """
+    if not tweets:
+        return []
+    k = min(n_clusters or auto_cluster_count(len(tweets)), len(tweets))
+
+    vectorizer = TfidfVectorizer(
+        stop_words="english", ngram_range=(1, 2), sublinear_tf=True, max_features=20_000,
+    )
+    try:
+        matrix = vectorizer.fit_transform([t.text for t in tweets])
+    except ValueError:
+        # Nothing but stop words / punctuation — treat everything as one topic
+        k, matrix = 1, None
+
+    if k == 1 or matrix is None:
+        labels = np.zeros(len(tweets), dtype=np.int64)
+        distances = np.zeros(len(tweets))
+        terms = np.array([])
+        centroids = None
+    else:
+        model = MiniBatchKMeans(
+            n_clusters=k, n_init=3, random_state=random_state, batch_size=1024,
+        )
+        labels = model.fit_predict(matrix)
+        distances = model.transform(matrix)[np.arange(len(tweets)), labels]
+        terms = vectorizer.get_feature_names_out()
+        centroids = model.cluster_centers_
+
+    engagement = np.array([t.engagement_score for t in tweets])
+    totals = np.bincount(labels, weights=engagement, minlength=k)
+    # Renumber so cluster 0 carries the most engagement
+    order = np.argsort(-totals, kind="stable")
+
+    clusters: list[SentimentCluster] = []
+    for old_id in order:
+        members = np.flatnonzero(labels == old_id)
+        if not len(members):
+            continue
+        new_id = len(clusters)
+        closest = members[np.argsort(distances[members], kind="stable")]
+        for i in members:
+            tweets[i].narrative_cluster = new_id
+
+        sentiments = Counter(
+            tweets[i].sentiment_label for i in members if tweets[i].sentiment_label
+        )
+        if centroids is not None:
+            top = terms[np.argsort(-centroids[old_id], kind="stable")[:LABEL_TERMS]]
+            label = ", ".join(top)
+        else:
+            label = "general discussion"
+
+        clusters.append(SentimentCluster(
+            cluster_id=new_id,
+            label=label,
+            sentiment=sentiments.most_common(1)[0][0] if sentiments else "neutral",
+            intensity=float(np.mean([tweets[i].sentiment_intensity for i in members])),
+            # Near-copies collapsed into a member stay citable through the cluster
+            tweet_ids=[tid for i in members for tid in (tweets[i].id, *tweets[i].duplicate_ids)],
+            representative_texts=[tweets[i].text for i in closest[:max_representatives]],
+            size=len(members),
+            total_engagement=float(totals[old_id]),
+        ))
+
+    logger.info("  Clustered %d tweets into %d topics", len(tweets), len(clusters))
+    return clusters
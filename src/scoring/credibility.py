@@ -5,10 +5,15 @@ Higher score → more authoritative source.
 
 from __future__ import annotations
 
+import hashlib
 import logging
-import re
 
-from src.models.tweets import Tweet
+import numpy as np
+
+from src.models.batch import TweetBatch
+from src.models.tweets import Tweet, TweetAuthor
+from src.scoring.credibility_cache import CredibilityCache
+from src.scoring.keywords import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -32,69 +37,143 @@ MAJOR_OUTLETS = [
 ]
 
 
-def _bio_match(bio: str, keywords: list[str]) -> float:
-    """Return a score boost (0-30) based on bio keyword matches."""
-    bio_lower = bio.lower()
-    hits = sum(1 for kw in keywords if kw in bio_lower)
+MEME_KEYWORDS = ["parody", "meme", "fan page", "not affiliated", "satire"]
+
+# Compiled once at import: one scan per bio / handle covers every category
+_BIO_MATCHER = KeywordMatcher({
+    "insider": INSIDER_KEYWORDS,
+    "former_player": FORMER_PLAYER_KEYWORDS,
+    "meme": MEME_KEYWORDS,
+})
+_HANDLE_MATCHER = KeywordMatcher({"outlet": MAJOR_OUTLETS})
+
+
+def _bio_boost(hits: int) -> float:
+    """Return a score boost (0-30) based on the number of bio keyword matches."""
     return min(hits * 10.0, 30.0)
 
 
-def _handle_match(username: str) -> float:
-    """Return a score boost (0-25) if username is a known outlet / insider."""
-    handle = username.lower()
-    hits = sum(1 for outlet in MAJOR_OUTLETS if outlet in handle)
+def _handle_boost(hits: int) -> float:
+    """Return a score boost (0-25) if the username contains a known outlet / insider."""
     return min(hits * 25.0, 25.0)
 
 
-def compute_credibility(tweet: Tweet) -> float:
-    """Return a 0–100 credibility score for a tweet author."""
+def _follower_points(followers_count: int) -> float:
+    """Follower count tiers (max 25 pts)."""
+    if followers_count >= 500_000:
+        return 25.0
+    if followers_count >= 100_000:
+        return 20.0
+    if followers_count >= 25_000:
+        return 12.0
+    if followers_count >= 5_000:
+        return 6.0
+    return 0.0
+
+
+def _age_points(account_age_days: int) -> float:
+    """Account age (older = more trustworthy, max 10 pts)."""
+    if account_age_days >= 365 * 5:
+        return 10.0
+    if account_age_days >= 365 * 2:
+        return 6.0
+    if account_age_days >= 365:
+        return 3.0
+    return 0.0
+
+
+def credibility_from_fields(
+    *,
+    verified: bool,
+    followers_count: int,
+    description: str,
+    username: str,
+    account_age_days: int,
+) -> float:
+    """Return a 0–100 credibility score from the author fields it depends on."""
     score = 0.0
-    author = tweet.author
 
     # Verification status
-    if author.verified:
+    if verified:
         score += 20.0
 
-    # Follower count tiers
-    if author.followers_count >= 500_000:
-        score += 25.0
-    elif author.followers_count >= 100_000:
-        score += 20.0
-    elif author.followers_count >= 25_000:
-        score += 12.0
-    elif author.followers_count >= 5_000:
-        score += 6.0
+    score += _follower_points(followers_count)
 
     # Bio analysis
-    score += _bio_match(author.description, INSIDER_KEYWORDS)
-    score += _bio_match(author.description, FORMER_PLAYER_KEYWORDS) * 0.8
+    bio_hits = _BIO_MATCHER.count(description)
+    score += _bio_boost(bio_hits["insider"])
+    score += _bio_boost(bio_hits["former_player"]) * 0.8
 
     # Handle matching
-    score += _handle_match(author.username)
+    score += _handle_boost(_HANDLE_MATCHER.count(username)["outlet"])
 
-    # Account age (older = more trustworthy, max 10 pts)
-    if author.account_age_days >= 365 * 5:
-        score += 10.0
-    elif author.account_age_days >= 365 * 2:
-        score += 6.0
-    elif author.account_age_days >= 365:
-        score += 3.0
+    score += _age_points(account_age_days)
 
     # Penalise likely meme / fan accounts
-    meme_patterns = re.compile(
-        r"(parody|meme|fan page|not affiliated|satire)", re.IGNORECASE
-    )
-    if meme_patterns.search(author.description):
+    if bio_hits["meme"]:
         score *= 0.3
 
     return round(min(score, 100.0), 2)
 
 
-def score_credibility(tweets: list[Tweet], min_score: float = 0.0) -> list[Tweet]:
-    """Assign credibility scores and optionally filter by minimum."""
+def author_cache_key(
+    *,
+    author_id: str,
+    verified: bool,
+    followers_count: int,
+    description: str,
+    username: str,
+    account_age_days: int,
+) -> str:
+    """Cache key: author id plus a hash of everything that affects the score.
+
+    Follower count and account age enter only through their tiers, so an
+    author gaining a few followers between runs still hits the cache.
+    """
+    fingerprint = "\x1f".join((
+        str(verified),
+        str(_follower_points(followers_count)),
+        str(_age_points(account_age_days)),
+        username,
+        description,
+    ))
+    digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{author_id}:{digest}"
+
+
+def compute_author_credibility(author: TweetAuthor, cache: CredibilityCache | None = None) -> float:
+    """Return a 0–100 credibility score for an author, memoised in ``cache``."""
+    fields = {
+        "verified": author.verified,
+        "followers_count": author.followers_count,
+        "description": author.description,
+        "username": author.username,
+        "account_age_days": author.account_age_days,
+    }
+    if cache is None:
+        return credibility_from_fields(**fields)
+    key = author_cache_key(author_id=author.id, **fields)
+    return cache.get_or_compute(key, lambda: credibility_from_fields(**fields))
+
+
+def compute_credibility(tweet: Tweet) -> float:
+    """Return a 0–100 credibility score for a tweet author."""
+    return compute_author_credibility(tweet.author)
+
+
+def score_credibility(
+    tweets: list[Tweet],
+    min_score: float = 0.0,
+    cache: CredibilityCache | None = None,
+) -> list[Tweet]:
+    """Assign credibility scores and optionally filter by minimum.
+
+    With a ``cache``, repeat authors (within the batch or from earlier runs)
+    skip scoring entirely.
+    """
     result: list[Tweet] = []
     for tw in tweets:
-        tw.credibility_score = compute_credibility(tw)
+        tw.credibility_score = compute_author_credibility(tw.author, cache)
         if tw.credibility_score >= min_score:
             result.append(tw)
 
@@ -104,3 +183,39 @@ def score_credibility(tweets: list[Tweet], min_score: float = 0.0) -> list[Tweet
         len(result), len(tweets), min_score,
     )
     return result
+
+
+def score_credibility_batch(
+    batch: TweetBatch,
+    min_score: float = 0.0,
+    cache: CredibilityCache | None = None,
+) -> TweetBatch:
+    """Columnar ``score_credibility``: fill ``credibility_score``, return kept rows best first."""
+    ages = batch.account_age_days().tolist()
+    rows = zip(
+        batch.author_id.tolist(), batch.verified.tolist(), batch.followers_count.tolist(),
+        batch.description.tolist(), batch.username.tolist(), ages,
+    )
+    scores = np.empty(len(batch), dtype=np.float64)
+    for i, (author_id, verified, followers, description, username, age) in enumerate(rows):
+        fields = {
+            "verified": verified,
+            "followers_count": followers,
+            "description": description,
+            "username": username,
+            "account_age_days": age,
+        }
+        if cache is None:
+            scores[i] = credibility_from_fields(**fields)
+        else:
+            key = author_cache_key(author_id=author_id, **fields)
+            scores[i] = cache.get_or_compute(key, lambda f=fields: credibility_from_fields(**f))
+    batch.credibility_score[:] = scores
+
+    kept = np.flatnonzero(scores >= min_score)
+    order = kept[np.argsort(-scores[kept], kind="stable")]
+    logger.info(
+        "Credibility filtering: %d kept (from %d), min=%.1f",
+        len(order), len(batch), min_score,
+    )
+    return batch.take(order)
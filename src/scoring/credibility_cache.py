@@ -0,0 +1,94 @@
+"""Author-level memoisation for credibility scores.
+
+Credibility depends only on the author, so the score is cached under a key of
+author id plus a fingerprint of the fields that feed the score (see
+``credibility.author_cache_key``). The cache is a bounded LRU that can be
+backed by a JSON file to carry scores across runs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class CredibilityCache:
+    """Bounded LRU of ``key → score`` with hit/miss counters."""
+
+    def __init__(self, max_size: int = 50_000, path: str | Path | None = None) -> None:
+        self.max_size = max_size
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._scores: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_or_compute(self, key: str, compute: Callable[[], float]) -> float:
+        """Return the cached score for ``key``, computing and storing it on a miss."""
+        with self._lock:
+            score = self._scores.get(key)
+            if score is not None:
+                self._scores.move_to_end(key)
+                self.hits += 1
+                return score
+            self.misses += 1
+
+        score = compute()
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+        return score
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+            self.hits = self.misses = 0
+
+    # ── Persistence ───────────────────────────────────────────
+
+    def load(self) -> None:
+        """Load scores from the backing file, if any (oldest first)."""
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except ValueError:
+            logger.warning("Credibility cache %s is unreadable — starting empty", self.path)
+            return
+        with self._lock:
+            for key, score in data.items():
+                self._scores[key] = float(score)
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+    def save(self) -> None:
+        """Write scores to the backing file in LRU order; no-op without a path."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = json.dumps(self._scores)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, self.path)
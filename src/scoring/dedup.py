@@ -0,0 +1,149 @@
+"""Near-duplicate detection with MinHash + LSH banding.
+
+Copy-pasted takes, "this 👇" variants and templated outlet posts differ only in
+links, mentions or a word or two. Each tweet is normalised (lower-cased, URLs
+and @mentions stripped, whitespace collapsed) and shingled into character
+5-grams. Its MinHash signature comes from ``NUM_PERM`` universal hash functions
+applied to the shingles, computed for all tweets at once with NumPy.
+
+Signatures are split into ``BANDS`` bands; tweets sharing any band become
+candidates. Each candidate pair is then confirmed by its estimated Jaccard
+similarity, so the whole pass is near-linear in the number of tweets.
+Confirmed pairs are merged with union-find into groups.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.models.tweets import Tweet
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 16                        # 16 × 8 rows → candidate threshold ≈ 0.71
+_PRIME = (1 << 31) - 1
+_MAX_CHUNK = 32_768               # shingles hashed per NumPy block
+
+_URL = re.compile(r"https?://\S+")
+_MENTION = re.compile(r"@\w+")
+_SPACE = re.compile(r"\s+")
+
+
+def normalise(text: str) -> str:
+    """Strip the parts of a tweet that vary between copies of the same take."""
+    text = _MENTION.sub(" ", _URL.sub(" ", text.lower()))
+    return _SPACE.sub(" ", text).strip()
+
+
+def _shingles(text: str) -> list[int]:
+    if len(text) <= SHINGLE_SIZE:
+        grams = {text}
+    else:
+        grams = {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    return [zlib.crc32(g.encode("utf-8")) for g in grams]
+
+
+def minhash_signatures(texts: Sequence[str], *, seed: int = 0) -> np.ndarray:
+    """Return a ``(len(texts), NUM_PERM)`` MinHash matrix of normalised texts.
+
+    Rows for texts that normalise to nothing are all ``_PRIME`` and never match.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.uint64)[:, None]
+    b = rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.uint64)[:, None]
+
+    signatures = np.full((len(texts), NUM_PERM), _PRIME, dtype=np.uint64)
+    shingles = [_shingles(t) if t else [] for t in (normalise(t) for t in texts)]
+
+    start = 0
+    while start < len(texts):
+        # Group consecutive documents into one block of at most _MAX_CHUNK shingles
+        end, size = start, 0
+        while end < len(texts) and (end == start or size + len(shingles[end]) <= _MAX_CHUNK):
+            size += len(shingles[end])
+            end += 1
+        docs = [i for i in range(start, end) if shingles[i]]
+        if docs:
+            hashes = np.fromiter(
+                (h for i in docs for h in shingles[i]), dtype=np.uint64, count=size,
+            )
+            offsets = np.cumsum([0] + [len(shingles[i]) for i in docs[:-1]])
+            # a < 2**31 and h < 2**32, so a·h + b stays below 2**64
+            permuted = (a * hashes[None, :] + b) % _PRIME
+            signatures[docs] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        start = end
+    return signatures
+
+
+def near_duplicate_groups(
+    texts: Sequence[str], *, threshold: float = 0.8, seed: int = 0,
+) -> list[list[int]]:
+    """Group indices of texts whose estimated Jaccard similarity ≥ ``threshold``.
+
+    Every index appears in exactly one group; groups and their members are
+    ordered by first occurrence.
+    """
+    n = len(texts)
+    signatures = minhash_signatures(texts, seed=seed)
+    valid = signatures[:, 0] != _PRIME
+    rows = NUM_PERM // BANDS
+
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked: set[tuple[int, int]] = set()
+    for band in range(BANDS):
+        buckets: dict[bytes, list[int]] = defaultdict(list)
+        block = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        for i in np.flatnonzero(valid):
+            buckets[block[i].tobytes()].append(int(i))
+        for members in buckets.values():
+            first = members[0]
+            for other in members[1:]:
+                root_a, root_b = find(first), find(other)
+                if root_a == root_b or (first, other) in checked:
+                    continue
+                checked.add((first, other))
+                if np.mean(signatures[first] == signatures[other]) >= threshold:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i in range(n):
+        groups[find(i)].append(i)
+    return list(groups.values())
+
+
+def collapse_duplicates(tweets: list[Tweet], *, threshold: float = 0.8) -> list[Tweet]:
+    """Collapse near-identical tweets into one representative each.
+
+    The member with the highest engagement represents its group; it carries
+    the group's summed engagement score and the other members' ids in
+    ``duplicate_ids``. Representatives keep their original relative order.
+    """
+    if len(tweets) < 2:
+        return list(tweets)
+    groups = near_duplicate_groups([t.text for t in tweets], threshold=threshold)
+
+    representatives: list[tuple[int, Tweet]] = []
+    for members in groups:
+        rep_index = max(members, key=lambda i: (tweets[i].engagement_score, -i))
+        rep = tweets[rep_index]
+        if len(members) > 1:
+            rep.duplicate_ids = [tweets[i].id for i in members if i != rep_index]
+            rep.engagement_score = sum(tweets[i].engagement_score for i in members)
+        representatives.append((rep_index, rep))
+    representatives.sort(key=lambda pair: pair[0])
+    return [rep for _, rep in representatives]
@@ -2,13 +2,20 @@
 
 WeightedScore = (Likes × 1) + (Retweets × 2) + (QuoteTweets × 3) + (Replies × 2.5)
 Normalised by follower count, account age, and verification status.
+
+The per-tweet functions below are the reference definition; ``engagement_scores``
+is the vectorised equivalent used by ``score_tweets`` and ``score_batch``.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+from datetime import datetime, timezone
+
+import numpy as np
 
+from src.models.batch import TweetBatch
 from src.models.tweets import Tweet
 
 logger = logging.getLogger(__name__)
@@ -72,16 +79,114 @@ def passes_filter(tweet: Tweet) -> bool:
     return True
 
 
+def engagement_scores(
+    likes: np.ndarray,
+    retweets: np.ndarray,
+    quote_tweets: np.ndarray,
+    replies: np.ndarray,
+    followers: np.ndarray,
+    tweet_count: np.ndarray,
+    verified: np.ndarray,
+    author_created: np.ndarray,
+    *,
+    now: float | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised equivalent of ``passes_filter`` + ``normalise_engagement``.
+
+    ``author_created`` holds account creation times as epoch seconds (NaN when
+    unknown). Account age is measured against a single reference timestamp
+    ``now`` (defaults to the current time). Returns ``(scores, keep)`` where
+    ``keep`` is the spam/bot filter mask; scores are computed for every row.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc).timestamp()
+
+    likes = np.asarray(likes, dtype=np.float64)
+    retweets = np.asarray(retweets, dtype=np.float64)
+    quote_tweets = np.asarray(quote_tweets, dtype=np.float64)
+    replies = np.asarray(replies, dtype=np.float64)
+    followers = np.asarray(followers, dtype=np.float64)
+    tweet_count = np.asarray(tweet_count, dtype=np.float64)
+    verified = np.asarray(verified, dtype=bool)
+    author_created = np.asarray(author_created, dtype=np.float64)
+
+    # ── Filter mask (passes_filter) ──────────────────────────
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(followers == 0, 0.0, tweet_count / followers)
+    small_and_quiet = (followers < MIN_FOLLOWERS_HARD) & (ratio < MIN_ENGAGEMENT_RATIO)
+    keep = ~small_and_quiet & ((likes + retweets + quote_tweets + replies) != 0)
+
+    # ── Raw weighted engagement ──────────────────────────────
+    raw = (
+        likes * LIKE_WEIGHT
+        + retweets * RETWEET_WEIGHT
+        + quote_tweets * QUOTE_WEIGHT
+        + replies * REPLY_WEIGHT
+    )
+
+    # ── Normalisation (normalise_engagement) ─────────────────
+    follower_factor = np.log10(np.maximum(followers, 1.0) + 1.0)
+    age_days = np.floor((now - author_created) / 86_400.0)
+    age_days = np.where(np.isnan(age_days), 1.0, np.maximum(age_days, 1.0))
+    age_factor = np.minimum(np.log10(age_days + 1.0), 3.0) / 3.0
+
+    scores = raw / follower_factor * (0.7 + 0.3 * age_factor)
+    scores = np.where(verified, scores * VERIFIED_BOOST, scores)
+    return np.round(scores, 4), keep
+
+
 def score_tweets(tweets: list[Tweet]) -> list[Tweet]:
     """Score and filter a batch of tweets. Returns scored list (may be smaller)."""
+    n = len(tweets)
+    likes = np.empty(n, dtype=np.int64)
+    retweets = np.empty(n, dtype=np.int64)
+    quotes = np.empty(n, dtype=np.int64)
+    replies = np.empty(n, dtype=np.int64)
+    followers = np.empty(n, dtype=np.int64)
+    tweet_count = np.empty(n, dtype=np.int64)
+    verified = np.empty(n, dtype=bool)
+    created = np.full(n, np.nan)
+
+    for i, tw in enumerate(tweets):
+        m, a = tw.metrics, tw.author
+        likes[i], retweets[i] = m.likes, m.retweets
+        quotes[i], replies[i] = m.quote_tweets, m.replies
+        followers[i], tweet_count[i], verified[i] = a.followers_count, a.tweet_count, a.verified
+        if a.created_at is not None:
+            c = a.created_at
+            if c.tzinfo is None:
+                c = c.replace(tzinfo=timezone.utc)
+            created[i] = c.timestamp()
+
+    scores, keep = engagement_scores(
+        likes, retweets, quotes, replies, followers, tweet_count, verified, created,
+    )
+
+    # Stable descending sort, matching list.sort(reverse=True) on ties
+    kept = np.flatnonzero(keep)
+    order = kept[np.argsort(-scores[kept], kind="stable")]
+
     scored: list[Tweet] = []
-    for tw in tweets:
-        if not passes_filter(tw):
-            continue
-        raw = compute_raw_engagement(tw)
-        tw.engagement_score = normalise_engagement(raw, tw)
+    for i in order:
+        tw = tweets[i]
+        tw.engagement_score = float(scores[i])
         scored.append(tw)
 
-    scored.sort(key=lambda t: t.engagement_score, reverse=True)
     logger.info("Scored %d tweets (from %d raw)", len(scored), len(tweets))
     return scored
+
+
+def score_batch(batch: TweetBatch) -> TweetBatch:
+    """Columnar ``score_tweets``: return kept rows with ``engagement_score`` set, best first.
+
+    ``batch`` itself is left untouched; parallel branches read it concurrently.
+    """
+    scores, keep = engagement_scores(
+        batch.likes, batch.retweets, batch.quote_tweets, batch.replies,
+        batch.followers_count, batch.tweet_count, batch.verified, batch.author_created_at,
+    )
+
+    kept = np.flatnonzero(keep)
+    order = kept[np.argsort(-scores[kept], kind="stable")]
+    logger.info("Scored %d tweets (from %d raw)", len(order), len(batch))
+    return batch.replace(engagement_score=scores.astype(np.float64, copy=False)).take(order)
@@ -0,0 +1,50 @@
+"""Single-pass multi-keyword matching.
+
+``KeywordMatcher`` compiles every keyword of every category into one regex and
+scans a text once, returning how many distinct keywords of each category it
+contains — the same answer as testing ``kw in text.lower()`` per keyword.
+
+The pattern is a zero-width lookahead over an alternation sorted longest-first,
+so every start position is tried and, at each position, the longest keyword
+wins. A shorter keyword starting at the same position is always a prefix of
+that winner, so each keyword's hit also credits every keyword it contains
+(precomputed once); together this finds exactly the set of substrings present.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+
+class KeywordMatcher:
+    """Match many case-insensitive keyword categories in one regex pass."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]) -> None:
+        self.categories: dict[str, frozenset[str]] = {
+            name: frozenset(kw.lower() for kw in keywords)
+            for name, keywords in categories.items()
+        }
+        keywords = sorted(set().union(*self.categories.values()), key=lambda k: (-len(k), k))
+
+        # Keyword → every keyword it contains (including itself)
+        self._implied: dict[str, frozenset[str]] = {
+            kw: frozenset(other for other in keywords if other in kw) for kw in keywords
+        }
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(kw) for kw in keywords) + "))"
+        ) if keywords else None
+
+    def match(self, text: str) -> set[str]:
+        """Return the distinct keywords occurring anywhere in ``text``."""
+        if self._pattern is None or not text:
+            return set()
+        found: set[str] = set()
+        for kw in {m.group(1) for m in self._pattern.finditer(text.lower())}:
+            found |= self._implied[kw]
+        return found
+
+    def count(self, text: str) -> dict[str, int]:
+        """Return the number of distinct keywords hit per category."""
+        found = self.match(text)
+        return {name: len(found & keywords) for name, keywords in self.categories.items()}
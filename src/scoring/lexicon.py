@@ -0,0 +1,201 @@
+"""Deterministic lexicon sentiment scorer tuned for NFL discourse.
+
+A VADER-style scorer: each token (or two-word phrase) found in ``LEXICON``
+contributes a valence in [-4, 4]. The valence is adjusted for
+
+* negation — "not", "isn't", "never" … in the three preceding tokens flip and
+  dampen it;
+* boosters — "absolutely", "so", "completely" … push it further from zero;
+* emphasis — an ALL-CAPS word in otherwise mixed-case text is amplified, and
+  up to three "!" add to the overall magnitude;
+* contrast — words after "but" count more than those before it.
+
+Emoji carry their own valence. The summed valence is squashed into a compound
+score in [-1, 1]. Confidence rises with the evidence — sentiment-bearing
+tokens, with a strong or shouted term counting double and "!" emphasis adding
+half a token — and the strength of the compound, and falls when positive and
+negative evidence conflict, so a lone "ROBBED" is as sure as two milder terms.
+Callers send low-confidence tweets to the LLM.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+
+LEXICON: dict[str, float] = {
+    # ── Praise ────────────────────────────────────────────
+    "elite": 3.0, "goat": 3.2, "clutch": 2.8, "mvp": 2.6, "dominant": 2.8,
+    "dominated": 2.4, "insane": 2.2, "incredible": 3.0, "amazing": 3.0,
+    "unreal": 2.6, "legendary": 3.0, "special": 2.0, "beast": 2.4, "baller": 2.2,
+    "dawg": 2.0, "cooking": 2.0, "cooked": -2.0, "masterclass": 3.0,
+    "best": 2.6, "great": 2.6, "good": 1.8, "love": 2.8, "proud": 2.4,
+    "win": 2.0, "won": 2.0, "winning": 2.0, "victory": 2.4, "respect": 2.0,
+    "hype": 2.2, "hyped": 2.4, "lets go": 2.8, "let's go": 2.8, "scary good": 3.2,
+    "comeback": 2.0, "statement": 1.6, "healthy": 1.2, "underrated": 1.6,
+    "sensational": 3.0, "electric": 2.6, "stud": 2.2, "perfect": 2.8,
+    # ── Criticism ─────────────────────────────────────────
+    "robbed": -3.2, "rigged": -3.0, "trash": -3.0, "garbage": -3.0, "bust": -2.8,
+    "fraud": -3.0, "frauds": -3.0, "washed": -2.6, "choke": -2.8, "choked": -2.8,
+    "embarrassing": -3.0, "pathetic": -3.0, "awful": -3.0, "terrible": -3.0,
+    "horrible": -3.0, "worst": -3.0, "bad": -2.4, "lost": -1.6, "lose": -1.8,
+    "loss": -1.8, "blew": -2.2, "blown": -1.8, "overrated": -2.4, "disaster": -3.0,
+    "joke": -2.4, "clown": -2.4, "clowns": -2.4, "lost cause": -2.6, "problem": -1.6,
+    "fire him": -3.0, "benched": -1.6, "injured": -1.8, "injury": -1.8,
+    "thrown away": -2.4, "no-call": -2.2, "no call": -2.2, "robbery": -3.2,
+    "sucks": -2.8, "hate": -3.0, "ugly": -2.2, "sloppy": -2.2, "disgrace": -3.2,
+    "fumble": -1.4, "interception": -1.2, "heartbreaking": -2.8,
+}
+
+EMOJI: dict[str, float] = {
+    "🔥": 2.4, "🐐": 3.0, "👏": 2.0, "🙌": 2.2, "💯": 2.0, "👍": 1.8, "💪": 2.0,
+    "❤": 2.4, "😍": 2.8, "🥳": 2.6, "🎉": 2.4, "🚀": 2.2,
+    "😡": -3.0, "🤬": -3.2, "🤡": -2.6, "👎": -2.0, "🤦": -2.2, "😤": -1.6,
+    "💩": -2.8, "😒": -1.8, "😞": -2.0, "😢": -2.0, "💔": -2.6, "🗑": -2.6,
+}
+
+# Emoji that mostly signal humour in sports posts rather than a polarity
+HUMOR_EMOJI = frozenset("😂🤣💀😭")
+
+NEGATIONS = frozenset({
+    "not", "no", "never", "isn't", "ain't", "wasn't", "aren't", "don't",
+    "doesn't", "didn't", "can't", "cannot", "won't", "nobody", "nothing",
+})
+BOOSTERS: dict[str, float] = {
+    "absolutely": 0.3, "so": 0.3, "very": 0.3, "really": 0.3, "completely": 0.3,
+    "totally": 0.3, "extremely": 0.35, "literally": 0.2, "super": 0.3,
+    "insanely": 0.35, "straight": 0.2, "truly": 0.3,
+    "barely": -0.3, "kinda": -0.3, "somewhat": -0.3, "slightly": -0.3,
+}
+EMOTION_CUES: dict[str, frozenset[str]] = {
+    "controversy": frozenset({"refs", "ref", "officiating", "rigged", "robbed", "robbery",
+                              "no-call", "flag", "penalty", "interference"}),
+    "disbelief": frozenset({"unbelievable", "wtf", "insane", "unreal", "shocked", "stunned"}),
+    "sadness": frozenset({"heartbreaking", "injured", "injury", "sad", "💔", "😢", "😞"}),
+    "celebration": frozenset({"won", "win", "victory", "champions", "🎉", "🥳", "lets go",
+                              "let's go"}),
+}
+
+NEGATION_SCALAR = -0.74
+CAPS_BOOST = 0.733
+EXCLAMATION_BOOST = 0.292
+NORMALISATION_ALPHA = 15.0
+STRONG_VALENCE = 3.0        # a term this strong counts as two pieces of evidence
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:['’-][a-z]+)*|[^\sa-z0-9]", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class LexiconResult:
+    """Local sentiment judgement for one text."""
+
+    sentiment: str                      # positive / negative / neutral / mixed
+    intensity: float                    # 0‑1
+    confidence: float                   # 0‑1
+    emotion: str = ""
+    key_phrases: list[str] = field(default_factory=list)
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(text.replace("\ufe0f", ""))
+
+
+def score_sentiment(text: str) -> LexiconResult:
+    """Score ``text`` with the lexicon; deterministic and dependency-free."""
+    raw = _tokens(text)
+    lowered = [t.lower().replace("’", "'") for t in raw]
+    has_mixed_case = any(t.isalpha() and not t.isupper() for t in raw)
+    contrast_at = lowered.index("but") if "but" in lowered else -1
+
+    positive = negative = 0.0
+    hits: list[tuple[float, str]] = []
+    strong = 0
+    humor = False
+    i = 0
+    while i < len(lowered):
+        token = lowered[i]
+        phrase = f"{token} {lowered[i + 1]}" if i + 1 < len(lowered) else ""
+        if phrase in LEXICON:
+            term, valence, width = phrase, LEXICON[phrase], 2
+        elif token in LEXICON:
+            term, valence, width = token, LEXICON[token], 1
+        elif token in EMOJI:
+            term, valence, width = token, EMOJI[token], 1
+        else:
+            humor = humor or token in HUMOR_EMOJI or token in ("lol", "lmao", "lmfao")
+            i += 1
+            continue
+
+        word = raw[i]
+        shouted = has_mixed_case and word.isalpha() and word.isupper() and len(word) > 1
+        if shouted:
+            valence += math.copysign(CAPS_BOOST, valence)
+        window = lowered[max(0, i - 3) : i]
+        for prev in window:
+            boost = BOOSTERS.get(prev)
+            if boost:
+                valence += math.copysign(boost, valence)
+        negated = any(prev in NEGATIONS for prev in window)
+        if negated:
+            valence *= NEGATION_SCALAR
+        elif shouted or abs(valence) >= STRONG_VALENCE:
+            strong += 1
+        if contrast_at >= 0:
+            valence *= 1.5 if i > contrast_at else 0.5
+
+        hits.append((valence, term))
+        if valence > 0:
+            positive += valence
+        else:
+            negative += valence
+        i += width
+
+    total = positive + negative
+    if total:
+        total += math.copysign(min(text.count("!"), 3) * EXCLAMATION_BOOST, total)
+    compound = total / math.sqrt(total * total + NORMALISATION_ALPHA)
+
+    strongest = max(positive, -negative)
+    conflict = min(positive, -negative) / strongest if strongest else 0.0
+    if conflict > 0.6 and min(positive, -negative) >= 1.5:
+        sentiment = "mixed"
+    elif compound >= 0.05:
+        sentiment = "positive"
+    elif compound <= -0.05:
+        sentiment = "negative"
+    else:
+        sentiment = "neutral"
+
+    # Two pieces of evidence saturate the term: two plain hits, or one strong
+    # or shouted hit; "!" emphasis adds half
+    emphasis = 0.5 if hits and "!" in text else 0.0
+    evidence = min((len(hits) + strong + emphasis) / 2.0, 1.0)
+    confidence = evidence * (0.5 + 0.5 * abs(compound)) * (1.0 - conflict)
+    if sentiment == "mixed":
+        confidence = evidence * 0.5
+
+    key_phrases = [term for _, term in sorted(hits, key=lambda h: -abs(h[0]))[:3]]
+    return LexiconResult(
+        sentiment=sentiment,
+        intensity=round(abs(compound), 3),
+        confidence=round(confidence, 3),
+        emotion=_emotion(set(lowered) | set(key_phrases), sentiment, humor, has_mixed_case, raw),
+        key_phrases=list(dict.fromkeys(key_phrases)),
+    )
+
+
+def _emotion(
+    cues: set[str], sentiment: str, humor: bool, has_mixed_case: bool, raw: list[str],
+) -> str:
+    for emotion, words in EMOTION_CUES.items():
+        if cues & words:
+            return emotion
+    if humor:
+        return "humor"
+    if sentiment == "positive":
+        return "hype"
+    if sentiment == "negative":
+        shouting = has_mixed_case and any(w.isupper() and len(w) > 1 for w in raw if w.isalpha())
+        return "anger" if shouting or "!" in raw else "disbelief"
+    return ""
@@ -0,0 +1,204 @@
+"""Deterministic script quality checks.
+
+``issues_by_section`` maps reviewer issues onto script sections;
+``check_script`` scores a script locally so obviously broken drafts fail
+without an LLM review and clearly sound ones can skip it.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from src.models.script import FinalScript, ScriptOutline
+from src.utils.timestamps import WORDS_PER_MINUTE, parse_range
+
+GENERAL = "General"
+
+_PREFIX = re.compile(r"^\s*\[([^\]]+)\]\s*[:\-–—]?\s*(.*)$", re.S)
+
+
+def issues_by_section(issues: Iterable[str], section_names: Iterable[str]) -> dict[str, list[str]]:
+    """Assign each reviewer issue to the section it concerns.
+
+    Issues are expected as ``"[Section Name] text"``; without a usable prefix
+    the first section named anywhere in the text is used. Anything else lands
+    under ``GENERAL``. Section names match case-insensitively.
+    """
+    names = list(section_names)
+    lookup = {name.lower(): name for name in names}
+    # Longest names first so "Big Take" is not claimed by a shorter "Take"
+    by_length = sorted(names, key=len, reverse=True)
+
+    mapped: dict[str, list[str]] = {}
+    for issue in issues:
+        target, text = GENERAL, issue.strip()
+        match = _PREFIX.match(text)
+        if match and match.group(1).strip().lower() in lookup:
+            target, text = lookup[match.group(1).strip().lower()], match.group(2).strip()
+        else:
+            if match and match.group(1).strip().lower() == GENERAL.lower():
+                text = match.group(2).strip()
+            lowered = text.lower()
+            for name in by_length:
+                if name.lower() in lowered:
+                    target = name
+                    break
+        mapped.setdefault(target, []).append(text)
+    return mapped
+
+
+# ── Local heuristic check ─────────────────────────────────────
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Component weights of the local score (sum to 100)
+WEIGHTS = {"structure": 35, "duration": 30, "timestamps": 15, "repetition": 20}
+
+DURATION_TOLERANCE = 0.15     # within ±15 % of target scores full marks
+DURATION_LIMIT = 0.5          # ±50 % or worse scores zero and is critical
+REPEAT_NGRAM = 6
+MIN_REPEAT_SENTENCE_WORDS = 6
+
+
+@dataclass(frozen=True)
+class LocalQuality:
+    """Outcome of the deterministic script check."""
+
+    score: float                                   # 0-100
+    word_count: int
+    estimated_minutes: float
+    components: dict[str, float] = field(default_factory=dict)
+    issues: list[str] = field(default_factory=list)
+    critical: bool = False                         # broken beyond what an LLM review can add
+
+
+def _words(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def _structure(script: FinalScript, outline: ScriptOutline | None) -> tuple[float, list[str], bool]:
+    issues: list[str] = []
+    names = [s.section_name for s in script.sections]
+    expected = [s.section_name for s in outline.sections] if outline and outline.sections else []
+    missing = [name for name in expected if name not in names]
+    empty = [s.section_name for s in script.sections if not s.content.strip()]
+    issues += [f"[{name}] section is missing from the script" for name in missing]
+    issues += [f"[{name}] section has no content" for name in empty]
+
+    present = [name for name in names if name in expected]
+    if present != [name for name in expected if name in present]:
+        issues.append(f"[{GENERAL}] sections are out of outline order")
+
+    total = max(len(expected) or len(names), 1)
+    score = max(0.0, 1 - (len(missing) + len(empty)) / total)
+    if len(issues) > len(missing) + len(empty):
+        score *= 0.8
+    return score, issues, bool(missing or empty) or not names
+
+
+def _duration(words: int, target_minutes: float, wpm: int) -> tuple[float, list[str], bool]:
+    minutes = words / wpm
+    deviation = abs(minutes - target_minutes) / max(target_minutes, 0.1)
+    if deviation <= DURATION_TOLERANCE:
+        return 1.0, [], False
+    issue = (
+        f"[{GENERAL}] runs ~{minutes:.1f} min at {wpm} wpm against a "
+        f"{target_minutes:g} min target"
+    )
+    score = max(0.0, 1 - (deviation - DURATION_TOLERANCE) / (DURATION_LIMIT - DURATION_TOLERANCE))
+    return score, [issue], deviation >= DURATION_LIMIT
+
+
+def _timestamps(script: FinalScript, wpm: int) -> tuple[float, list[str]]:
+    issues: list[str] = []
+    checked = bad = 0
+    previous_end: int | None = None
+    for section in script.sections:
+        checked += 1
+        parsed = parse_range(section.timestamp)
+        if parsed is None or parsed[1] <= parsed[0]:
+            bad += 1
+            issues.append(f"[{section.section_name}] timestamp {section.timestamp!r} is invalid")
+            previous_end = None
+            continue
+        start, end = parsed
+        problem = ""
+        if previous_end is None and checked == 1 and start != 0:
+            problem = "does not start at 0:00"
+        elif previous_end is not None and start != previous_end:
+            problem = "overlaps the previous section" if start < previous_end else "leaves a gap"
+        if not problem and section.content.strip():
+            # Spoken length far from the slot it is meant to fill
+            spoken = len(section.content.split()) / wpm * 60
+            if spoken < (end - start) * 0.4 or spoken > (end - start) * 2.5:
+                problem = f"slot is {end - start}s but the text reads in ~{spoken:.0f}s"
+        if problem:
+            bad += 1
+            issues.append(f"[{section.section_name}] timestamp {section.timestamp} {problem}")
+        previous_end = end
+    return (1 - bad / checked if checked else 0.0), issues
+
+
+def _repetition(script: FinalScript) -> tuple[float, list[str]]:
+    issues: list[str] = []
+    seen_sentences: dict[str, str] = {}
+    for section in script.sections:
+        for sentence in _SENTENCE.split(section.content.strip()):
+            words = _words(sentence)
+            if len(words) < MIN_REPEAT_SENTENCE_WORDS:
+                continue
+            key = " ".join(words)
+            if key in seen_sentences:
+                issues.append(
+                    f"[{section.section_name}] repeats a line from "
+                    f"{seen_sentences[key]}: \"{sentence.strip()[:60]}\""
+                )
+            else:
+                seen_sentences[key] = section.section_name
+
+    words = _words(" ".join(s.content for s in script.sections))
+    grams = [tuple(words[i : i + REPEAT_NGRAM]) for i in range(len(words) - REPEAT_NGRAM + 1)]
+    ratio = (1 - len(set(grams)) / len(grams)) if grams else 0.0
+    if ratio > 0.05:
+        issues.append(f"[{GENERAL}] {ratio:.0%} of {REPEAT_NGRAM}-word phrases are repeats")
+    # 0 % repeated phrases scores full marks, 20 % or more scores zero
+    return max(0.0, 1 - ratio / 0.2) * (0.5 if len(issues) > 3 else 1.0), issues
+
+
+def check_script(
+    script: FinalScript,
+    outline: ScriptOutline | None = None,
+    *,
+    target_minutes: float,
+    wpm: int = WORDS_PER_MINUTE,
+) -> LocalQuality:
+    """Score a script on structure, duration, timestamps and repetition without an LLM.
+
+    Duration is estimated from the word count at ``wpm`` rather than taken
+    from the script's self-reported estimate. Issues carry ``[Section Name]``
+    prefixes in the same form the LLM reviewer uses.
+    """
+    words = sum(len(s.content.split()) for s in script.sections)
+    structure, structure_issues, broken = _structure(script, outline)
+    duration, duration_issues, too_far = _duration(words, target_minutes, wpm)
+    timestamps, timestamp_issues = _timestamps(script, wpm)
+    repetition, repetition_issues = _repetition(script)
+
+    components = {
+        "structure": structure,
+        "duration": duration,
+        "timestamps": timestamps,
+        "repetition": repetition,
+    }
+    score = sum(WEIGHTS[name] * value for name, value in components.items())
+    return LocalQuality(
+        score=round(score, 1),
+        word_count=words,
+        estimated_minutes=round(words / wpm, 1),
+        components={name: round(value, 3) for name, value in components.items()},
+        issues=structure_issues + duration_issues + timestamp_issues + repetition_issues,
+        critical=broken or too_far,
+    )
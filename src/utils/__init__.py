@@ -1,12 +1,18 @@
 """Utility package."""
 
+from src.utils.ingest_state import IngestState
+from src.utils.llm_cache import LLMCache
 from src.utils.logging import setup_logging
 from src.utils.nfl import NFL_TEAMS, NFL_SEARCH_TERMS, build_search_queries
 from src.utils.output import save_script
+from src.utils.search_cache import SearchCache
 
 __all__ = [
+    "IngestState",
+    "LLMCache",
     "NFL_SEARCH_TERMS",
     "NFL_TEAMS",
+    "SearchCache",
     "build_search_queries",
     "save_script",
     "setup_logging",
@@ -0,0 +1,222 @@
+"""Durable per-node checkpoints so a failed run can resume where it stopped.
+
+After each graph node finishes, its *update* (the dict it returned, not the
+whole state) is written as one row. Replaying a run's updates in order
+rebuilds the state as of its last completed node, so ``tweets_raw``,
+``tweets_scored`` and ``tweets_filtered`` are each written once, by the node
+that produced them.
+
+Tweets are pooled per run: the first time a tweet id is seen its full record
+goes into the ``tweets`` table, and every stage afterwards stores only the id
+plus whichever fields differ from the pooled record (scores, merged metrics,
+``duplicate_ids`` …). Update payloads are JSON, zlib-compressed.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from src.models.batch import TweetBatch
+from src.models.narratives import Narrative, SentimentCluster
+from src.models.script import FinalScript, ScriptOutline
+from src.models.tweets import Tweet
+
+# State field → how its value is encoded. Fields not listed are plain JSON.
+_BATCH = "batch"
+_TWEETS = "tweets"
+FIELD_CODECS: dict[str, object] = {
+    "tweets_raw": _BATCH,
+    "tweets_scored": _BATCH,
+    "tweets_filtered": _TWEETS,
+    "tweet_clusters": [SentimentCluster],
+    "dominant_narratives": [Narrative],
+    "script_outline": ScriptOutline,
+    "final_script": FinalScript,
+}
+
+# The debug-only message log isn't worth persisting, and timings from an
+# earlier process would skew a resumed run's critical path
+SKIPPED_FIELDS = frozenset({"messages", "node_timings"})
+
+
+def new_run_id() -> str:
+    """Return a sortable, human-typeable run id such as ``20251019-201502-3fa9c1``."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    return f"{stamp}-{uuid.uuid4().hex[:6]}"
+
+
+class CheckpointStore:
+    """SQLite log of node updates per run, with a shared per-run tweet pool."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tweets ("
+                " run_id TEXT NOT NULL,"
+                " tweet_id TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " PRIMARY KEY (run_id, tweet_id))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " run_id TEXT NOT NULL,"
+                " node TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS checkpoints_run ON checkpoints (run_id, seq)"
+            )
+        # run_id → {tweet_id: pooled record}, filled lazily from the database
+        self._pools: dict[str, dict[str, dict]] = {}
+
+    # ── Writing ───────────────────────────────────────────────
+
+    def save(self, run_id: str, node: str, update: dict) -> None:
+        """Record the update a node returned."""
+        with self._lock:
+            pool = self._pool(run_id)
+            fresh: dict[str, dict] = {}
+            encoded = {
+                key: self._encode(key, value, pool, fresh)
+                for key, value in update.items()
+                if key not in SKIPPED_FIELDS
+            }
+            payload = zlib.compress(json.dumps(encoded, ensure_ascii=False).encode("utf-8"))
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO tweets (run_id, tweet_id, data) VALUES (?, ?, ?)",
+                    [
+                        (run_id, tweet_id, json.dumps(data, ensure_ascii=False))
+                        for tweet_id, data in fresh.items()
+                    ],
+                )
+                self._conn.execute(
+                    "INSERT INTO checkpoints (run_id, node, payload, stored_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (run_id, node, payload, time.time()),
+                )
+
+    def recorder(self, run_id: str) -> Callable[[str, dict], None]:
+        """Return an ``on_node(node, update)`` callback bound to ``run_id``.
+
+        Nodes report most failures through the ``error`` field rather than by
+        raising. The first update carrying an error is not recorded, and
+        neither is anything after it, so a resume restarts at the node that
+        failed instead of trusting what ran downstream of it.
+        """
+        failed = False
+
+        def record(node: str, update: dict) -> None:
+            nonlocal failed
+            if failed or update.get("error"):
+                failed = True
+                return
+            self.save(run_id, node, update)
+
+        return record
+
+    # ── Reading ───────────────────────────────────────────────
+
+    def nodes(self, run_id: str) -> list[str]:
+        """Names of the nodes completed in ``run_id``, in order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT node FROM checkpoints WHERE run_id = ? ORDER BY seq", (run_id,),
+            ).fetchall()
+        return [node for (node,) in rows]
+
+    def load(self, run_id: str, state: dict | None = None) -> tuple[dict, list[str]]:
+        """Replay ``run_id``'s updates over ``state``.
+
+        Returns the rebuilt state and the completed node names in order.
+        Raises ``KeyError`` if the run has no checkpoints.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT node, payload FROM checkpoints WHERE run_id = ? ORDER BY seq", (run_id,),
+            ).fetchall()
+            if not rows:
+                raise KeyError(f"No checkpoints for run {run_id!r}")
+            pool = self._pool(run_id)
+        rebuilt = dict(state or {})
+        completed: list[str] = []
+        for node, payload in rows:
+            encoded = json.loads(zlib.decompress(payload))
+            rebuilt.update({key: _decode(key, value, pool) for key, value in encoded.items()})
+            completed.append(node)
+        return rebuilt, completed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Internals ─────────────────────────────────────────────
+
+    def _pool(self, run_id: str) -> dict[str, dict]:
+        pool = self._pools.get(run_id)
+        if pool is None:
+            rows = self._conn.execute(
+                "SELECT tweet_id, data FROM tweets WHERE run_id = ?", (run_id,),
+            ).fetchall()
+            pool = self._pools[run_id] = {tweet_id: json.loads(data) for tweet_id, data in rows}
+        return pool
+
+    def _encode(self, key: str, value, pool: dict[str, dict], fresh: dict[str, dict]):
+        codec = FIELD_CODECS.get(key)
+        if value is None:
+            return None
+        if codec == _BATCH:
+            return [_pack(t, pool, fresh) for t in value.to_tweets()]
+        if codec == _TWEETS:
+            return [_pack(t, pool, fresh) for t in value]
+        if isinstance(codec, list):
+            return [item.model_dump(mode="json") for item in value]
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json")
+        return value
+
+
+def _pack(tweet: Tweet, pool: dict[str, dict], fresh: dict[str, dict]) -> dict:
+    """Encode a tweet as its id plus the fields that differ from the pooled record."""
+    data = tweet.model_dump(mode="json")
+    base = pool.get(tweet.id)
+    if base is None:
+        pool[tweet.id] = fresh[tweet.id] = data
+        return {"id": tweet.id}
+    return {"id": tweet.id, **{k: v for k, v in data.items() if base.get(k) != v}}
+
+
+def _unpack(entry: dict, pool: dict[str, dict]) -> Tweet:
+    return Tweet.model_validate({**pool[entry["id"]], **entry})
+
+
+def _decode(key: str, value, pool: dict[str, dict]):
+    codec = FIELD_CODECS.get(key)
+    if value is None:
+        return None
+    if codec == _BATCH:
+        return TweetBatch.from_tweets([_unpack(e, pool) for e in value])
+    if codec == _TWEETS:
+        return [_unpack(e, pool) for e in value]
+    if isinstance(codec, list):
+        return [codec[0].model_validate(item) for item in value]
+    if isinstance(codec, type):
+        return codec.model_validate(value)
+    return value
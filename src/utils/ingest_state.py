@@ -0,0 +1,114 @@
+"""Persisted ingestion state for incremental fetching.
+
+Between runs we keep, per search query, a high-water mark (the newest tweet id
+and its timestamp) together with the tweets already fetched inside the current
+window. A new run only asks the X API for tweets newer than each watermark and
+merges the delta into the retained tweets, dropping anything that has slid out
+of the window. A query whose pagination stopped early keeps its previous
+watermark, so the tweets it did not reach are asked for again next run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.models.tweets import Tweet
+
+logger = logging.getLogger(__name__)
+
+_WATERMARKS_FILE = "watermarks.json"
+_TWEETS_FILE = "tweets.jsonl"
+
+
+class IngestState:
+    """Per-query ``since_id`` watermarks plus the retained window of tweets."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.watermarks: dict[str, dict] = {}
+        self.tweets: list[Tweet] = []
+
+    @classmethod
+    def load(cls, directory: str | Path) -> IngestState:
+        """Load state from ``directory``; a missing or corrupt store starts empty."""
+        state = cls(directory)
+        try:
+            state.watermarks = json.loads(
+                (state.directory / _WATERMARKS_FILE).read_text(encoding="utf-8")
+            )
+            with open(state.directory / _TWEETS_FILE, encoding="utf-8") as fh:
+                state.tweets = [Tweet.model_validate_json(line) for line in fh if line.strip()]
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            logger.warning("Ingest state in %s is unreadable — starting fresh", state.directory)
+            state.watermarks, state.tweets = {}, []
+        return state
+
+    def save(self) -> None:
+        """Persist watermarks and retained tweets atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tweets_tmp = self.directory / f"{_TWEETS_FILE}.tmp"
+        with open(tweets_tmp, "w", encoding="utf-8") as fh:
+            for tw in self.tweets:
+                fh.write(tw.model_dump_json())
+                fh.write("\n")
+        os.replace(tweets_tmp, self.directory / _TWEETS_FILE)
+
+        marks_tmp = self.directory / f"{_WATERMARKS_FILE}.tmp"
+        marks_tmp.write_text(json.dumps(self.watermarks, indent=2), encoding="utf-8")
+        os.replace(marks_tmp, self.directory / _WATERMARKS_FILE)
+
+    def since_id(self, query: str, window_start: datetime) -> str | None:
+        """Return the watermark for ``query`` if it is still inside the window."""
+        mark = self.watermarks.get(query)
+        if not mark:
+            return None
+        if datetime.fromisoformat(mark["newest_time"]) < window_start:
+            # The whole previous fetch has aged out; do a full-window fetch
+            return None
+        return mark["newest_id"]
+
+    def advance(self, query: str, fetched: list[Tweet]) -> None:
+        """Move the watermark for ``query`` to the newest tweet just fetched."""
+        if not fetched:
+            return
+        newest = max(fetched, key=lambda t: int(t.id))
+        mark = self.watermarks.get(query)
+        if mark and int(mark["newest_id"]) >= int(newest.id):
+            return
+        created = newest.created_at
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        self.watermarks[query] = {"newest_id": newest.id, "newest_time": created.isoformat()}
+
+    def merge(self, fresh: list[Tweet], window_start: datetime) -> list[Tweet]:
+        """Combine freshly fetched tweets with retained ones still in the window.
+
+        Fresh tweets come first, in fetch order, followed by retained tweets not
+        seen again. The merged list becomes the new retained window.
+        """
+        seen = {tw.id for tw in fresh}
+        merged = list(fresh)
+        for tw in self.tweets:
+            if tw.id in seen:
+                continue
+            created = tw.created_at
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            if created < window_start:
+                continue
+            seen.add(tw.id)
+            merged.append(tw)
+
+        # Forget watermarks that have slid out of the window
+        self.watermarks = {
+            q: m for q, m in self.watermarks.items()
+            if datetime.fromisoformat(m["newest_time"]) >= window_start
+        }
+        self.tweets = merged
+        return merged
@@ -0,0 +1,152 @@
+"""Incremental parsing of a streamed JSON object with a ``sections`` array.
+
+``SectionStreamParser`` is fed text chunks as the model produces them. It
+tracks string/escape state and bracket depth character by character, and
+whenever an element of the top-level ``"sections"`` array closes it is parsed
+and handed to ``on_section`` straight away. Other top-level members (title,
+tags …) are parsed as each one completes.
+
+If the stream stops early — a ``max_tokens`` cut-off or a dropped connection —
+``result()`` still returns every member and section that did complete,
+instead of failing the way ``json.loads`` on the whole text would. Text before
+the first ``{`` (such as a markdown code fence) and after the closing ``}`` is
+ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SectionStreamParser:
+    """Emit completed ``sections`` elements of a streamed JSON object."""
+
+    def __init__(
+        self, on_section: Callable[[dict], None] | None = None, key: str = "sections",
+    ) -> None:
+        self.on_section = on_section
+        self.key = key
+        self.fields: dict = {}
+        self.sections: list[dict] = []
+        self.complete = False
+
+        self._buf: list[str] = []
+        self._pos = 0                    # characters consumed so far
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._root_start = -1
+        self._root_end = -1
+        self._member_start = -1          # start of the current top-level member
+        self._array_depth = -1           # stack depth inside the sections array
+        self._item_start = -1
+
+    @property
+    def text(self) -> str:
+        return "".join(self._buf)
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of streamed text."""
+        if not chunk or self.complete:
+            return
+        self._buf.append(chunk)
+        text = None                      # joined lazily, only when something closes
+        for offset, ch in enumerate(chunk):
+            i = self._pos + offset
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                if self._stack:
+                    self._in_string = True
+                continue
+
+            if ch in "{[":
+                if not self._stack:
+                    if ch != "{":
+                        continue
+                    self._root_start = i
+                    self._member_start = i + 1
+                self._stack.append(ch)
+                depth = len(self._stack)
+                if ch == "[" and depth == 2:
+                    text = text or self.text
+                    if self._current_key(text, i) == self.key:
+                        self._array_depth = depth
+                elif ch == "{" and depth == self._array_depth + 1:
+                    self._item_start = i
+            elif ch in "}]" and self._stack:
+                depth = len(self._stack)
+                if ch == "}" and depth == self._array_depth + 1 and self._item_start >= 0:
+                    text = text or self.text
+                    self._emit(text[self._item_start : i + 1])
+                    self._item_start = -1
+                elif ch == "]" and depth == self._array_depth:
+                    self._array_depth = -1
+                if depth == 1:
+                    text = text or self.text
+                    self._close_member(text, i)
+                    self._root_end = i + 1
+                    self.complete = True
+                    self._stack.pop()
+                    break
+                self._stack.pop()
+            elif ch == "," and len(self._stack) == 1:
+                text = text or self.text
+                self._close_member(text, i)
+                self._member_start = i + 1
+        self._pos += len(chunk)
+
+    def result(self) -> dict:
+        """Return the parsed object, or the completed parts of a truncated one."""
+        if self.complete:
+            try:
+                return json.loads(self.text[self._root_start : self._root_end])
+            except ValueError:
+                pass
+        data = dict(self.fields)
+        data[self.key] = list(self.sections)
+        return data
+
+    # ── Internals ─────────────────────────────────────────────
+
+    def _current_key(self, text: str, end: int) -> str | None:
+        head = text[self._member_start : end].strip()
+        if not head.endswith(":"):
+            return None
+        try:
+            return json.loads(head[:-1].strip())
+        except ValueError:
+            return None
+
+    def _close_member(self, text: str, end: int) -> None:
+        member = text[self._member_start : end].strip()
+        if not member:
+            return
+        try:
+            parsed = json.loads("{" + member + "}")
+        except ValueError:
+            logger.debug("Skipping unparseable member %.40r", member)
+            return
+        for key, value in parsed.items():
+            if key != self.key:
+                self.fields[key] = value
+
+    def _emit(self, item_text: str) -> None:
+        try:
+            item = json.loads(item_text)
+        except ValueError:
+            logger.debug("Skipping unparseable section %.40r", item_text)
+            return
+        self.sections.append(item)
+        if self.on_section is not None:
+            self.on_section(item)
@@ -0,0 +1,241 @@
+"""Shared helpers for calling the chat model from pipeline nodes.
+
+Nodes get their ``ChatOpenAI`` from ``get_llm``, a process-wide registry with
+one client per (model, temperature, max_tokens). All clients share one httpx
+connection pool, so keep-alive connections and TLS sessions are reused across
+stages, concurrent batches and quality-check retries.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Any
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from src.config import settings
+from src.utils.llm_cache import LLMCache, SQLiteBackend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_BASE = "https://api.openai.com/v1"
+
+_cache: LLMCache | None = None
+_http_client: httpx.Client | None = None
+_clients: dict[tuple, ChatOpenAI] = {}
+_registry_lock = threading.Lock()
+
+
+class LLMCallCancelled(RuntimeError):
+    """A caller's ``should_stop`` fired before or during an LLM call."""
+
+
+# ── Client registry ───────────────────────────────────────────
+
+def get_http_client() -> httpx.Client:
+    """Return the shared keep-alive HTTP client, creating it on first use."""
+    global _http_client
+    with _registry_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_keepalive_connections,
+                    keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+                ),
+                timeout=httpx.Timeout(
+                    settings.llm_timeout_seconds, connect=settings.llm_connect_timeout_seconds,
+                ),
+            )
+        return _http_client
+
+
+def get_llm(*, temperature: float, max_tokens: int) -> ChatOpenAI:
+    """Return the shared chat client for this temperature / max_tokens pair."""
+    key = (settings.openai_model, temperature, max_tokens)
+    llm = _clients.get(key)
+    if llm is not None:
+        return llm
+    http_client = get_http_client()
+    with _registry_lock:
+        llm = _clients.get(key)
+        if llm is None:
+            llm = ChatOpenAI(
+                model=settings.openai_model,
+                api_key=settings.openai_api_key,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                http_client=http_client,
+                timeout=settings.llm_timeout_seconds,
+            )
+            _clients[key] = llm
+        return llm
+
+
+def prewarm_llm(builders: Iterable[Callable[[], ChatOpenAI]], connections: int = 1) -> None:
+    """Build each stage's client and open ``connections`` pooled connections.
+
+    Connections are opened concurrently with a lightweight ``GET /models`` so
+    the TCP and TLS handshakes are paid before the first real request.
+    Failures are logged, not raised — warming is an optimisation only.
+    """
+    try:
+        llms = [build() for build in builders]
+    except Exception as exc:
+        logger.warning("LLM prewarm skipped: %s", exc)
+        return
+    if not llms or connections < 1:
+        return
+
+    base = (getattr(llms[0], "openai_api_base", None) or DEFAULT_API_BASE).rstrip("/")
+    headers = {"Authorization": f"Bearer {settings.openai_api_key}"}
+
+    def _touch(_: int) -> None:
+        http_client.get(f"{base}/models", headers=headers)
+
+    try:
+        http_client = get_http_client()
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="prewarm") as pool:
+            list(pool.map(_touch, range(connections)))
+    except Exception as exc:
+        logger.warning("LLM prewarm request failed: %s", exc)
+        return
+    logger.info("  Prewarmed %d LLM clients over %d connections", len(llms), connections)
+
+
+def close_llm_clients() -> None:
+    """Drop registered clients and close the shared connection pool."""
+    global _http_client
+    with _registry_lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+# ── Response cache ────────────────────────────────────────────
+
+def get_llm_cache() -> LLMCache:
+    """Return the process-wide LLM response cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        backend = None
+        if settings.llm_cache_mode != "off":
+            backend = SQLiteBackend(
+                settings.llm_cache_path,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+                max_entries=settings.llm_cache_max_entries,
+            )
+        _cache = LLMCache(backend, mode=settings.llm_cache_mode)
+    return _cache
+
+
+def parse_json_response(content: str) -> Any:
+    """Parse a JSON reply, stripping markdown code fences if present."""
+    raw = content.strip()
+    if raw.startswith("```"):
+        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
+        if raw.endswith("```"):
+            raw = raw[:-3]
+    return json.loads(raw)
+
+
+def cached_invoke(
+    llm,
+    messages: list[dict],
+    *,
+    parse: Callable[[str], Any] = parse_json_response,
+    cache_tag: str = "",
+    cache: LLMCache | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> Any:
+    """Invoke ``llm`` through the response cache and return the parsed reply.
+
+    A reply is only stored once ``parse`` accepts it, so a malformed response
+    is retried against the model rather than replayed from the cache.
+    ``cache_tag`` separates otherwise identical calls that should differ, such
+    as successive regeneration attempts. ``should_stop`` is polled before a
+    cache miss goes to the model; if it returns True ``LLMCallCancelled`` is
+    raised instead.
+    """
+    cache = cache if cache is not None else get_llm_cache()
+    key = None
+    if cache.enabled:
+        key = LLMCache.key(
+            model=getattr(llm, "model_name", ""),
+            temperature=getattr(llm, "temperature", None),
+            max_tokens=getattr(llm, "max_tokens", None),
+            messages=messages,
+            tag=cache_tag,
+        )
+        content = cache.get(key)
+        if content is not None:
+            logger.debug("LLM cache hit %s", key[:12])
+            return parse(content)
+
+    if should_stop is not None and should_stop():
+        raise LLMCallCancelled("LLM call cancelled before it was sent")
+    content = llm.invoke(messages).content
+    parsed = parse(content)
+    if key is not None:
+        cache.put(key, content)
+    return parsed
+
+
+def stream_invoke(
+    llm,
+    messages: list[dict],
+    *,
+    on_text: Callable[[str], None],
+    cache_tag: str = "",
+    cache: LLMCache | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> str:
+    """Stream a reply through ``on_text`` chunk by chunk and return the full text.
+
+    A cached reply is replayed as a single chunk. Like ``cached_invoke``, a
+    streamed reply is only stored once it parses as JSON, so a truncated
+    response is never replayed. ``should_stop`` is polled before the request
+    and after every chunk; once it returns True the stream is closed and
+    ``LLMCallCancelled`` raised.
+    """
+    cache = cache if cache is not None else get_llm_cache()
+    key = None
+    if cache.enabled:
+        key = LLMCache.key(
+            model=getattr(llm, "model_name", ""),
+            temperature=getattr(llm, "temperature", None),
+            max_tokens=getattr(llm, "max_tokens", None),
+            messages=messages,
+            tag=cache_tag,
+        )
+        content = cache.get(key)
+        if content is not None:
+            on_text(content)
+            return content
+
+    if should_stop is not None and should_stop():
+        raise LLMCallCancelled("LLM call cancelled before it was sent")
+    parts: list[str] = []
+    with closing(llm.stream(messages)) as chunks:
+        for chunk in chunks:
+            if should_stop is not None and should_stop():
+                raise LLMCallCancelled("LLM stream cancelled mid-response")
+            text = chunk.content if isinstance(chunk.content, str) else ""
+            if text:
+                parts.append(text)
+                on_text(text)
+    content = "".join(parts)
+    if key is not None:
+        try:
+            parse_json_response(content)
+        except ValueError:
+            return content
+        cache.put(key, content)
+    return content
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
-from src.models.script import FinalScript
+from src.models.script import FinalScript, ScriptSection
 
 logger = logging.getLogger(__name__)
 
@@ -31,3 +31,20 @@ def save_script(script: FinalScript, output_dir: str = "output") -> Path:
     logger.info("JSON saved  → %s", json_path)
 
     return txt_path
+
+
+class DraftWriter:
+    """Append script sections to a draft file as they are generated."""
+
+    def __init__(self, output_dir: str = "output") -> None:
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        self.path = out / f"{ts}_draft.txt"
+        self.path.write_text("", encoding="utf-8")
+        logger.info("Streaming draft → %s", self.path)
+
+    def __call__(self, section: ScriptSection) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(section.render())
+            fh.write("\n")
@@ -0,0 +1,144 @@
+"""Header-aware rate limiting for the X API.
+
+Each endpoint gets a token bucket sized to its rate-limit window. Buckets start
+from a conservative default and are corrected from the ``x-rate-limit-limit``,
+``x-rate-limit-remaining`` and ``x-rate-limit-reset`` headers on every response.
+Concurrent callers reserve tokens up front, so a burst of parallel queries
+cannot overshoot the quota before the server has had a chance to answer; when
+the bucket is empty, only the calling thread sleeps until the window resets
+and the expected wait is logged instead of stalling silently.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when honouring the rate limit would mean waiting longer than allowed."""
+
+    def __init__(self, endpoint: str, wait_seconds: float) -> None:
+        super().__init__(f"{endpoint}: rate limit exhausted, reset in {wait_seconds:.0f}s")
+        self.endpoint = endpoint
+        self.wait_seconds = wait_seconds
+
+
+@dataclass
+class _Bucket:
+    limit: int
+    tokens: float       # may go negative: reservations queued for the next window
+    reset_at: float     # epoch seconds when the current window ends
+    window: float
+
+    def refill(self, now: float) -> None:
+        while now >= self.reset_at:
+            self.tokens = min(self.limit, self.tokens + self.limit)
+            self.reset_at += self.window
+
+    def wait_for_next(self, now: float) -> float:
+        """Seconds until a token would be available to a new reservation."""
+        if self.tokens >= 1:
+            return 0.0
+        windows_ahead = math.floor(-self.tokens / self.limit) if self.limit else 0
+        return max(self.reset_at - now, 0.0) + windows_ahead * self.window
+
+
+class RateLimiter:
+    """Per-endpoint token buckets paced by X API rate-limit headers."""
+
+    def __init__(
+        self,
+        *,
+        default_limit: int = 180,
+        window_seconds: float = 900.0,
+        max_wait_seconds: float = 900.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.default_limit = default_limit
+        self.window_seconds = window_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, endpoint: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            bucket = _Bucket(
+                limit=self.default_limit,
+                tokens=float(self.default_limit),
+                reset_at=now + self.window_seconds,
+                window=self.window_seconds,
+            )
+            self._buckets[endpoint] = bucket
+        bucket.refill(now)
+        return bucket
+
+    def expected_wait(self, endpoint: str) -> float:
+        """Seconds a new request to ``endpoint`` would currently have to wait."""
+        with self._lock:
+            now = self._clock()
+            return self._bucket(endpoint, now).wait_for_next(now)
+
+    def acquire(self, endpoint: str) -> float:
+        """Reserve one request slot, sleeping until it is available.
+
+        Returns the number of seconds waited. Raises ``RateLimitExceeded``
+        (without reserving) if the wait would exceed ``max_wait_seconds``.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint, now)
+            wait = bucket.wait_for_next(now)
+            if wait > self.max_wait_seconds:
+                raise RateLimitExceeded(endpoint, wait)
+            bucket.tokens -= 1
+
+        if wait > 0:
+            logger.warning("  Rate limit reached for %s — waiting %.0fs for reset", endpoint, wait)
+            self._sleep(wait)
+        return wait
+
+    def update(
+        self,
+        endpoint: str,
+        headers: Mapping[str, str] | None,
+        *,
+        exhausted: bool = False,
+    ) -> None:
+        """Correct the bucket from response headers.
+
+        ``exhausted`` marks a 429 response: the bucket is emptied even if the
+        headers are missing, so the next ``acquire`` waits for the reset.
+        """
+        headers = headers or {}
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint, now)
+            try:
+                limit = headers.get("x-rate-limit-limit")
+                remaining = headers.get("x-rate-limit-remaining")
+                reset = headers.get("x-rate-limit-reset")
+                if limit is not None:
+                    bucket.limit = int(limit)
+                if reset is not None and float(reset) > now:
+                    new_window = float(reset) > bucket.reset_at + 1
+                    bucket.reset_at = float(reset)
+                    if remaining is not None and new_window:
+                        bucket.tokens = float(remaining)
+                if remaining is not None:
+                    # Never trust a local estimate above what the server reports
+                    bucket.tokens = min(bucket.tokens, float(remaining))
+            except (TypeError, ValueError):
+                logger.debug("Ignoring malformed rate-limit headers for %s: %r", endpoint, headers)
+            if exhausted:
+                bucket.tokens = min(bucket.tokens, 0.0)
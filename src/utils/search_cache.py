@@ -0,0 +1,185 @@
+"""On-disk record/replay cache for raw X API search responses.
+
+Each cached entry is one raw v2 search page (the decoded JSON body), keyed by
+the request parameters that determine it: query, start/end window, page token,
+page size and the requested field set.
+
+Modes:
+  off        — never read or write.
+  readwrite  — serve fresh entries (younger than the TTL), record misses.
+  replay     — serve entries regardless of age and never touch the network;
+               a miss is treated as an empty page.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("off", "readwrite", "replay")
+
+_WINDOW_FILE = "window.json"
+
+
+class SearchCache:
+    """Size-bounded, TTL-aware cache of raw search pages stored as JSON files."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        mode: str = "readwrite",
+        ttl_seconds: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown search cache mode {mode!r}; expected one of {CACHE_MODES}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if mode != "off":
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == "replay"
+
+    # ── Keys ──────────────────────────────────────────────────
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """Return a stable hash of the request parameters."""
+        canonical = json.dumps(params, sort_keys=True, default=_json_default)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    # ── Pages ─────────────────────────────────────────────────
+
+    def get(self, params: dict) -> dict | None:
+        """Return the cached page for ``params``, or None on a miss."""
+        if not self.enabled:
+            return None
+        path = self._path(self.key(params))
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        if not self.replay and time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        # Touch so eviction is least-recently-used rather than oldest-written
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(hit=True)
+        return entry["payload"]
+
+    def put(self, params: dict, payload: dict) -> None:
+        """Record a raw page; no-op unless the cache is in readwrite mode."""
+        if self.mode != "readwrite":
+            return
+        path = self._path(self.key(params))
+        entry = {"stored_at": time.time(), "params": params, "payload": payload}
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(entry, default=_json_default), encoding="utf-8")
+        os.replace(tmp, path)
+        self._evict()
+
+    # ── Search window ─────────────────────────────────────────
+
+    def save_window(self, start_time: datetime, end_time: datetime) -> None:
+        """Remember the window of the current recording so it can be replayed."""
+        if self.mode != "readwrite":
+            return
+        data = {
+            "stored_at": time.time(),
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+        }
+        (self.directory / _WINDOW_FILE).write_text(json.dumps(data), encoding="utf-8")
+
+    def recorded_window(self) -> tuple[datetime, datetime] | None:
+        """Return the last recorded window if it can be served from cache.
+
+        In replay mode any recorded window is returned; in readwrite mode only
+        one still within the TTL, so a re-run shortly after a failure reuses the
+        same keys instead of sliding the window and missing every entry.
+        Incremental fetches skip this in readwrite mode, since they want tweets
+        newer than the recorded end.
+        """
+        if not self.enabled:
+            return None
+        try:
+            data = json.loads((self.directory / _WINDOW_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not self.replay and time.time() - data.get("stored_at", 0) > self.ttl_seconds:
+            return None
+        return (
+            datetime.fromisoformat(data["start_time"]),
+            datetime.fromisoformat(data["end_time"]),
+        )
+
+    # ── Housekeeping ──────────────────────────────────────────
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.directory.glob("*.json"):
+                if path.name == _WINDOW_FILE:
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _mtime, size, path in entries:
+                path.unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            logger.debug("Search cache evicted down to %d bytes", total)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
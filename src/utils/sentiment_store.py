@@ -0,0 +1,86 @@
+"""Persistent per-tweet sentiment results shared across runs.
+
+Consecutive runs search overlapping windows, so most tweets have already been
+analysed. Each row holds the LLM's result object for one tweet (sentiment,
+intensity, emotion, key phrases …) keyed by tweet id and a *version* string
+that fingerprints the prompt and model — changing either invalidates old rows
+without a manual purge. Rows older than the TTL are dropped on write; by then
+the tweet has slid out of every search window anyway.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_CHUNK = 500
+
+
+class SentimentStore:
+    """SQLite map of ``(version, tweet_id) → result dict``."""
+
+    def __init__(self, path: str | Path, *, ttl_seconds: float = 48 * 3600.0) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment ("
+                " version TEXT NOT NULL,"
+                " tweet_id TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " PRIMARY KEY (version, tweet_id))"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+
+    def get_many(self, version: str, tweet_ids: Iterable[str]) -> dict[str, dict]:
+        """Return stored results for whichever of ``tweet_ids`` are present."""
+        ids = list(dict.fromkeys(tweet_ids))
+        cutoff = time.time() - self.ttl_seconds
+        found: dict[str, dict] = {}
+        with self._lock:
+            for i in range(0, len(ids), _CHUNK):
+                chunk = ids[i : i + _CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT tweet_id, result FROM sentiment"
+                    f" WHERE version = ? AND stored_at >= ? AND tweet_id IN ({placeholders})",
+                    (version, cutoff, *chunk),
+                ).fetchall()
+                found.update((tweet_id, json.loads(result)) for tweet_id, result in rows)
+        return found
+
+    def put_many(self, version: str, results: Iterable[dict]) -> int:
+        """Store result dicts (each carrying ``tweet_id``); returns how many were written."""
+        now = time.time()
+        rows = [
+            (version, str(r["tweet_id"]), json.dumps(r, ensure_ascii=False), now)
+            for r in results
+            if "tweet_id" in r
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment (version, tweet_id, result, stored_at)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "DELETE FROM sentiment WHERE stored_at < ?", (now - self.ttl_seconds,)
+            )
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
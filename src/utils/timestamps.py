@@ -0,0 +1,26 @@
+"""Helpers for the ``m:ss-m:ss`` timestamp ranges used in outlines and scripts."""
+
+from __future__ import annotations
+
+import re
+
+_RANGE = re.compile(r"(\d+):(\d{2})\s*[-–—]\s*(\d+):(\d{2})")
+
+WORDS_PER_MINUTE = 150
+
+
+def parse_range(timestamp: str) -> tuple[int, int] | None:
+    """Return ``(start, end)`` in seconds for ``"1:00-3:00"``, or None if unparseable."""
+    match = _RANGE.search(timestamp or "")
+    if not match:
+        return None
+    m1, s1, m2, s2 = (int(g) for g in match.groups())
+    return m1 * 60 + s1, m2 * 60 + s2
+
+
+def range_seconds(timestamp: str) -> int | None:
+    """Length of a timestamp range in seconds, or None if unparseable or reversed."""
+    parsed = parse_range(timestamp)
+    if parsed is None or parsed[1] <= parsed[0]:
+        return None
+    return parsed[1] - parsed[0]
@@ -0,0 +1,83 @@
+"""Per-node wall-clock timings and the pipeline's critical path.
+
+Every graph node is wrapped with ``timed`` so its update carries a
+``node_timings`` entry of ``[start, end]`` epoch seconds; the state reducer
+merges entries from parallel branches. A node only starts once everything it
+waits on has finished, so walking back from the last node to finish — each
+time to the run that ended most recently before the current one started —
+recovers the critical path without needing the graph's edges.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+Timings = dict[str, list[list[float]]]
+
+# Scheduling slack between a node finishing and its successor starting
+_SLACK = 1e-3
+
+
+def timed(name: str, node: Callable[[dict], dict]) -> Callable[[dict], dict]:
+    """Wrap a node so its update records when it started and finished."""
+
+    def run(state: dict) -> dict:
+        start = time.time()
+        update = node(state)
+        return {**(update or {}), "node_timings": {name: [[start, time.time()]]}}
+
+    run.__name__ = getattr(node, "__name__", name)
+    return run
+
+
+def _runs(timings: Timings) -> list[tuple[str, float, float]]:
+    return sorted(
+        ((name, start, end) for name, spans in timings.items() for start, end in spans),
+        key=lambda run: run[1],
+    )
+
+
+def critical_path(timings: Timings) -> list[tuple[str, float, float]]:
+    """Return the chain of ``(node, start, end)`` runs that bounded the total latency."""
+    runs = _runs(timings)
+    if not runs:
+        return []
+    current = max(runs, key=lambda run: run[2])
+    path = [current]
+    while True:
+        before = [run for run in runs if run[2] <= current[1] + _SLACK and run[1] < current[1]]
+        if not before:
+            break
+        current = max(before, key=lambda run: run[2])
+        path.append(current)
+    return path[::-1]
+
+
+def timing_report(timings: Timings) -> str:
+    """Human-readable per-node timings with the critical path marked."""
+    runs = _runs(timings)
+    if not runs:
+        return "No node timings recorded."
+    path = critical_path(timings)
+    on_path = {name for name, _start, _end in path}
+    wall = max(end for _n, _s, end in runs) - min(start for _n, start, _e in runs)
+    busy = sum(end - start for _n, start, end in runs)
+
+    totals: dict[str, list[float]] = {}
+    for name, start, end in runs:
+        totals.setdefault(name, []).append(end - start)
+
+    width = max(len(name) for name in totals)
+    lines = [
+        f"Node timings — wall {wall:.2f}s, node total {busy:.2f}s "
+        f"({busy - wall:+.2f}s overlapped)"
+    ]
+    for name, durations in totals.items():
+        repeat = f" ×{len(durations)}" if len(durations) > 1 else ""
+        marker = "  ◀ critical" if name in on_path else ""
+        lines.append(f"  {name:<{width}}  {sum(durations):7.2f}s{repeat}{marker}")
+    chain = " → ".join(name for name, _start, _end in path)
+    length = sum(end - start for _name, start, end in path)
+    lines.append(f"Critical path ({length:.2f}s): {chain}")
+    return "\n".join(lines)
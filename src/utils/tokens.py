@@ -0,0 +1,63 @@
+"""Offline token estimation and budget-aware batch packing.
+
+``estimate_tokens`` approximates a modern BPE tokenizer (cl100k / o200k) without
+downloading one: common English words are about one token per four characters,
+digit runs about one per three, and each punctuation mark or non-ASCII symbol
+(emoji, accented letters) is counted separately. It errs slightly on the high
+side so packed batches stay inside the context window.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Sequence
+
+_PIECE = re.compile(r"[A-Za-z]+|\d+|\s+|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Return an approximate token count for ``text``."""
+    tokens = 0
+    for piece in _PIECE.findall(text):
+        first = piece[0]
+        if first.isspace():
+            # Single spaces merge into the following word; runs cost extra
+            tokens += len(piece) // 4
+        elif first.isascii() and first.isalpha():
+            tokens += math.ceil(len(piece) / 4)
+        elif first.isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        elif first.isascii():
+            tokens += 1
+        else:
+            # Emoji and other non-ASCII symbols are often split into several tokens
+            tokens += min(len(piece.encode("utf-8")) // 2, 3) or 1
+    return tokens
+
+
+def pack_batches(
+    costs: Sequence[int],
+    *,
+    budget: int,
+    max_items: int | None = None,
+) -> list[list[int]]:
+    """Greedily pack items into consecutive batches under a token ``budget``.
+
+    ``costs`` are per-item token estimates. Order is preserved and every batch
+    holds at most ``max_items`` items; an item larger than the whole budget is
+    placed in a batch of its own rather than dropped. Returns lists of indices.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+    for i, cost in enumerate(costs):
+        full = max_items is not None and len(current) >= max_items
+        if current and (full or used + cost > budget):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
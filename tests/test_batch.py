@@ -0,0 +1,112 @@
+"""Tests for the columnar TweetBatch container."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.models.batch import TweetBatch
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.scoring.credibility import score_credibility, score_credibility_batch
+from src.scoring.engagement import score_batch, score_tweets
+
+
+def _tweets(n: int = 6) -> list[Tweet]:
+    now = datetime.now(timezone.utc)
+    bios = ["NFL insider for ESPN", "fan page", "", "Former NFL player, Pro Bowl", "analyst"]
+    return [
+        Tweet(
+            id=f"t{i}",
+            text=f"take number {i} " * (i + 1),
+            created_at=now - timedelta(minutes=i),
+            author=TweetAuthor(
+                id=f"a{i % 3}",
+                username=["adamschefter", "randomfan", "pff"][i % 3],
+                name=f"Author {i}",
+                followers_count=[800, 20_000, 600_000][i % 3],
+                tweet_count=[100, 5_000, 40_000][i % 3],
+                verified=i % 2 == 0,
+                description=bios[i % len(bios)],
+                created_at=None if i == 4 else now - timedelta(days=400 * i + 3),
+            ),
+            metrics=TweetMetrics(likes=10 * i, retweets=i, quote_tweets=i % 2, replies=2 * i),
+            conversation_id=f"c{i}" if i % 2 else None,
+            referenced_tweet_ids=[f"r{i}"] if i % 3 == 0 else [],
+            context_annotations=["NFL"],
+        )
+        for i in range(n)
+    ]
+
+
+class TestTweetBatch:
+    def test_roundtrip(self):
+        tweets = _tweets()
+        batch = TweetBatch.from_tweets(tweets)
+        assert len(batch) == len(tweets)
+        for original, restored in zip(tweets, batch.to_tweets()):
+            assert restored.model_dump() == original.model_dump()
+
+    def test_text_offsets_share_one_buffer(self):
+        tweets = _tweets()
+        batch = TweetBatch.from_tweets(tweets)
+        assert batch.texts() == [t.text for t in tweets]
+        assert batch.text_buffer == "".join(t.text for t in tweets)
+
+    def test_slice_is_view(self):
+        batch = TweetBatch.from_tweets(_tweets())
+        view = batch[1:3]
+        view.engagement_score[:] = 42.0
+        assert batch.engagement_score[1] == 42.0
+        assert view.text(0) == batch.text(1)
+
+    def test_mask_and_take(self):
+        batch = TweetBatch.from_tweets(_tweets())
+        kept = batch.filter(batch.likes >= 30)
+        assert list(kept.id) == ["t3", "t4", "t5"]
+        assert kept.text_buffer is batch.text_buffer
+        reordered = batch.take([5, 0])
+        assert [t.id for t in reordered] == ["t5", "t0"]
+        assert reordered[0].text == batch.text(5)
+
+    def test_concat(self):
+        tweets = _tweets()
+        merged = TweetBatch.concat([
+            TweetBatch.from_tweets(tweets[:2]),
+            TweetBatch.empty(),
+            TweetBatch.from_tweets(tweets[2:]).take([3, 0]),
+        ])
+        assert list(merged.id) == ["t0", "t1", "t5", "t2"]
+        assert merged.texts() == [tweets[i].text for i in (0, 1, 5, 2)]
+
+    def test_coerce_and_truthiness(self):
+        assert not TweetBatch.coerce(None)
+        assert not TweetBatch.coerce([])
+        batch = TweetBatch.coerce(_tweets(2))
+        assert batch
+        assert TweetBatch.coerce(batch) is batch
+
+    def test_account_age_matches_model(self):
+        tweets = _tweets()
+        ages = TweetBatch.from_tweets(tweets).account_age_days()
+        assert ages.tolist() == [t.author.account_age_days for t in tweets]
+
+
+class TestBatchScoring:
+    def test_score_batch_matches_score_tweets(self):
+        expected = score_tweets(_tweets())
+        result = score_batch(TweetBatch.from_tweets(_tweets()))
+        assert list(result.id) == [t.id for t in expected]
+        assert np.allclose(result.engagement_score, [t.engagement_score for t in expected])
+
+    def test_score_batch_leaves_input_untouched(self):
+        batch = TweetBatch.from_tweets(_tweets())
+        before = batch.engagement_score.copy()
+        score_batch(batch)
+        assert batch.engagement_score.tolist() == before.tolist()
+
+    def test_credibility_batch_matches_list(self):
+        expected = score_credibility(_tweets(), min_score=20.0)
+        result = score_credibility_batch(TweetBatch.from_tweets(_tweets()), min_score=20.0)
+        assert list(result.id) == [t.id for t in expected]
+        assert result.credibility_score.tolist() == [t.credibility_score for t in expected]
@@ -0,0 +1,105 @@
+"""Tests for per-node checkpoints and resume routing."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import zlib
+from datetime import datetime, timezone
+
+import pytest
+
+from src.graph import resume_entry
+from src.models.batch import TweetBatch
+from src.models.script import FinalScript, ScriptOutline
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.utils.checkpoint import CheckpointStore
+
+
+def _tweets(n: int = 4) -> list[Tweet]:
+    now = datetime(2025, 10, 19, tzinfo=timezone.utc)
+    return [
+        Tweet(
+            id=f"t{i}",
+            text=f"Hot take number {i} about the refs",
+            created_at=now,
+            author=TweetAuthor(id=f"a{i}", username=f"user{i}", name=f"User {i}"),
+            metrics=TweetMetrics(likes=10 * i, retweets=i),
+        )
+        for i in range(n)
+    ]
+
+
+def _payloads(path) -> list[dict]:
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT payload FROM checkpoints ORDER BY seq").fetchall()
+    return [json.loads(zlib.decompress(p)) for (p,) in rows]
+
+
+class TestCheckpointStore:
+    def test_round_trip_and_tweets_stored_once(self, tmp_path):
+        path = tmp_path / "ck.sqlite"
+        store = CheckpointStore(path)
+        raw = _tweets()
+        scored = [t.model_copy(update={"engagement_score": 10.0 * i}) for i, t in enumerate(raw)]
+        filtered = [scored[3].model_copy(update={"duplicate_ids": ["t0"]}), scored[2]]
+        outline = ScriptOutline(title="Robbed", thumbnail_hook="ROBBED")
+
+        store.save("run1", "fetch_tweets", {"tweets_raw": TweetBatch.from_tweets(raw)})
+        store.save("run1", "engagement_scoring", {"tweets_scored": TweetBatch.from_tweets(scored)})
+        store.save("run1", "credibility_filter", {"tweets_filtered": filtered, "error": ""})
+        store.save("run1", "script_outline", {"script_outline": outline, "messages": ["x"]})
+        store.close()
+
+        reopened = CheckpointStore(path)
+        state, completed = reopened.load("run1", {"retry_count": 0})
+        assert completed == [
+            "fetch_tweets", "engagement_scoring", "credibility_filter", "script_outline",
+        ]
+        assert state["tweets_raw"].to_tweets() == raw
+        assert state["tweets_scored"].to_tweets() == scored
+        assert state["tweets_filtered"] == filtered
+        assert state["script_outline"] == outline
+        assert state["retry_count"] == 0 and "messages" not in state
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM tweets").fetchone()[0] == len(raw)
+        payloads = _payloads(path)
+        assert payloads[0]["tweets_raw"] == [{"id": t.id} for t in raw]
+        assert payloads[1]["tweets_scored"][2] == {"id": "t2", "engagement_score": 20.0}
+        assert payloads[2]["tweets_filtered"][0] == {
+            "id": "t3", "engagement_score": 30.0, "duplicate_ids": ["t0"],
+        }
+
+    def test_unknown_run_raises(self, tmp_path):
+        store = CheckpointStore(tmp_path / "ck.sqlite")
+        with pytest.raises(KeyError):
+            store.load("nope")
+
+    def test_recorder_stops_at_first_error(self, tmp_path):
+        store = CheckpointStore(tmp_path / "ck.sqlite")
+        record = store.recorder("run1")
+        record("narrative_extraction", {"dominant_narratives": [], "error": ""})
+        record("script_outline", {"script_outline": None, "error": "LLM down"})
+        record("script_generation", {"final_script": None, "error": ""})
+        assert store.nodes("run1") == ["narrative_extraction"]
+
+
+class TestResumeEntry:
+    def test_linear_nodes(self):
+        assert resume_entry([], {}) == ["fetch_tweets"]
+        fetched = {"tweets_raw": TweetBatch.from_tweets(_tweets())}
+        assert resume_entry(["fetch_tweets"], fetched) == [
+            "engagement_scoring", "credibility_scoring",
+        ]
+        assert resume_entry(["fetch_tweets"], {"tweets_raw": TweetBatch.empty()}) is None
+        assert resume_entry(["sentiment_clustering"], {}) == ["narrative_extraction"]
+        assert resume_entry(["script_generation"], {}) == ["quality_check"]
+        assert resume_entry(["increment_retry"], {}) == ["script_generation"]
+
+    def test_after_quality_check(self):
+        script = FinalScript(title="t", thumbnail_text="t", description="d")
+        passed = {"final_script": script, "quality_passed": True}
+        failed = {"final_script": script, "quality_passed": False, "retry_count": 0}
+        assert resume_entry(["quality_check"], passed) is None
+        assert resume_entry(["quality_check"], failed) == ["increment_retry"]
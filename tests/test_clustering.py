@@ -0,0 +1,111 @@
+"""Tests for local topic clustering and cluster-based narrative extraction."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.nodes import narrative_extraction as narrative_module
+from src.scoring.clustering import auto_cluster_count, cluster_tweets
+from src.scoring.dedup import collapse_duplicates
+
+REFS = "the refs blew the pass interference call in the end zone"
+QB = "mahomes threw four touchdowns in the fourth quarter comeback"
+
+
+def _tweet(i: int, text: str, engagement: float = 10.0, sentiment: str = "") -> Tweet:
+    return Tweet(
+        id=str(i),
+        text=text,
+        created_at=datetime.now(timezone.utc),
+        author=TweetAuthor(id="a", username="u", name="n"),
+        metrics=TweetMetrics(),
+        engagement_score=engagement,
+        sentiment_label=sentiment,
+        sentiment_intensity=0.5,
+    )
+
+
+def _two_topics() -> list[Tweet]:
+    tweets = [_tweet(i, f"{REFS} again {i}", 5.0, "negative") for i in range(6)]
+    tweets += [_tweet(10 + i, f"{QB} wow {i}", 50.0, "positive") for i in range(6)]
+    return tweets
+
+
+class TestClusterTweets:
+    def test_separates_topics(self):
+        tweets = _two_topics()
+        clusters = cluster_tweets(tweets, 2)
+        assert len(clusters) == 2
+        first, second = tweets[:6], tweets[6:]
+        assert {t.narrative_cluster for t in first} != {t.narrative_cluster for t in second}
+        assert sorted(c.size for c in clusters) == [6, 6]
+
+    def test_ordered_by_engagement_and_summarised(self):
+        clusters = cluster_tweets(_two_topics(), 2, max_representatives=2)
+        top = clusters[0]
+        assert top.cluster_id == 0
+        assert top.total_engagement == 300.0
+        assert top.sentiment == "positive"
+        assert top.intensity == 0.5
+        assert len(top.representative_texts) == 2
+        assert all(term in f"{QB} wow" for term in top.label.split(", "))
+
+    def test_every_tweet_assigned(self):
+        tweets = _two_topics()
+        clusters = cluster_tweets(tweets)
+        assert sum(c.size for c in clusters) == len(tweets)
+        assert all(t.narrative_cluster >= 0 for t in tweets)
+
+    def test_degenerate_inputs(self):
+        assert cluster_tweets([]) == []
+        single = cluster_tweets([_tweet(1, "the and of")], 3)
+        assert len(single) == 1 and single[0].size == 1
+
+    def test_auto_count(self):
+        assert auto_cluster_count(1) == 1
+        assert auto_cluster_count(8) == 2
+        assert auto_cluster_count(100_000) == 30
+
+
+class TestNarrativeFromClusters:
+    def test_cluster_ids_expand_to_tweets(self, monkeypatch):
+        tweets = _two_topics()
+        clusters = cluster_tweets(tweets, 2)
+        seen: list[list[dict]] = []
+
+        def fake_extract(_llm, clusters_data, _n):
+            seen.append(clusters_data)
+            return [{"title": "Refs", "summary": "", "emotion": "anger", "cluster_ids": [1]}]
+
+        monkeypatch.setattr(narrative_module, "_build_llm", lambda: None)
+        monkeypatch.setattr(narrative_module, "_extract_narratives", fake_extract)
+        result = narrative_module.narrative_extraction_node(
+            {"tweets_filtered": tweets, "tweet_clusters": clusters, "sentiment_clusters": []}
+        )
+        # Only cluster summaries reach the LLM
+        assert [c["cluster_id"] for c in seen[0]] == [0, 1]
+        narrative = result["dominant_narratives"][0]
+        assert narrative.supporting_tweet_ids == clusters[1].tweet_ids
+
+    def test_collapsed_copies_stay_citable(self, monkeypatch):
+        tweets = collapse_duplicates(_two_topics() + [_tweet(99, f"{REFS} again 0", 1.0)])
+        clusters = cluster_tweets(tweets, 2)
+        refs = next(c for c in clusters if "0" in c.tweet_ids)
+        fake = [{"title": "Refs", "summary": "", "cluster_ids": [refs.cluster_id]}]
+
+        monkeypatch.setattr(narrative_module, "_build_llm", lambda: None)
+        monkeypatch.setattr(narrative_module, "_extract_narratives", lambda *_: fake)
+        result = narrative_module.narrative_extraction_node(
+            {"tweets_filtered": tweets, "tweet_clusters": clusters, "sentiment_clusters": []}
+        )
+        supporting = result["dominant_narratives"][0].supporting_tweet_ids
+        assert {"0", "3", "99"} <= set(supporting)
+
+    def test_cluster_prompt_is_compact(self, monkeypatch):
+        seen: list[list[dict]] = []
+        monkeypatch.setattr(
+            narrative_module, "cached_invoke", lambda _llm, messages: seen.append(messages) or [],
+        )
+        narrative_module._extract_narratives(None, [{"cluster_id": 0, "top": "é"}], 1)
+        assert '[{"cluster_id":0,"top":"é"}]' in seen[0][-1]["content"]
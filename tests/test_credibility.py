@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
-from src.scoring.credibility import compute_credibility, score_credibility
+from src.scoring.credibility import author_cache_key, compute_credibility, score_credibility
+from src.scoring.credibility_cache import CredibilityCache
 
 
 def _make_tweet(
@@ -70,3 +71,87 @@ class TestScoreCredibility:
         tw_high.id = "high"
         result = score_credibility([tw_low, tw_high], min_score=30.0)
         assert all(t.credibility_score >= 30.0 for t in result)
+
+
+class TestCredibilityCache:
+    def test_repeat_author_hits_cache(self):
+        cache = CredibilityCache()
+        tweets = [_make_tweet(bio="NFL insider") for _ in range(5)]
+        score_credibility(tweets, cache=cache)
+        assert (cache.hits, cache.misses) == (4, 1)
+        assert all(t.credibility_score == compute_credibility(t) for t in tweets)
+
+    def test_key_tracks_score_inputs(self):
+        base = _make_tweet(followers=30_000, bio="analyst").author
+        same_tier = base.model_copy(update={"followers_count": 31_000})
+        new_bio = base.model_copy(update={"description": "parody account"})
+        new_tier = base.model_copy(update={"followers_count": 200_000})
+
+        def key(author):
+            return author_cache_key(
+                author_id=author.id,
+                verified=author.verified,
+                followers_count=author.followers_count,
+                description=author.description,
+                username=author.username,
+                account_age_days=author.account_age_days,
+            )
+
+        assert key(same_tier) == key(base)
+        assert key(new_bio) != key(base)
+        assert key(new_tier) != key(base)
+
+    def test_lru_eviction(self):
+        cache = CredibilityCache(max_size=2)
+        cache.get_or_compute("a", lambda: 1.0)
+        cache.get_or_compute("b", lambda: 2.0)
+        cache.get_or_compute("a", lambda: 0.0)  # refresh "a"
+        cache.get_or_compute("c", lambda: 3.0)  # evicts "b"
+        assert cache.get_or_compute("a", lambda: -1.0) == 1.0
+        assert cache.get_or_compute("b", lambda: -1.0) == -1.0
+
+    def test_persistent_backing_file(self, tmp_path):
+        path = tmp_path / "cred.json"
+        first = CredibilityCache(path=path)
+        score_credibility([_make_tweet(bio="ESPN reporter")], cache=first)
+        first.save()
+
+        second = CredibilityCache(path=path)
+        result = score_credibility([_make_tweet(bio="ESPN reporter")], cache=second)
+        assert (second.hits, second.misses) == (1, 0)
+        assert result[0].credibility_score == compute_credibility(result[0])
+
+
+class TestCredibilityBranches:
+    def _state(self) -> dict:
+        from src.models.batch import TweetBatch
+
+        tweets = [
+            _make_tweet(username=f"user{i}", followers=10 ** (i + 2), verified=i % 2 == 0)
+            .model_copy(update={"id": f"t{i}"})
+            for i in range(5)
+        ]
+        return {
+            "tweets_raw": TweetBatch.from_tweets(tweets),
+            "tweets_scored": TweetBatch.from_tweets(tweets[1:]),
+        }
+
+    def test_join_matches_inline_scoring(self, monkeypatch):
+        from src.nodes import credibility_filter as module
+
+        monkeypatch.setattr(module.settings, "dedup_enabled", False)
+        state = self._state()
+        raw_scores = state["tweets_raw"].credibility_score.copy()
+        scores = module.credibility_scoring_node(state)["credibility_scores"]
+        # The branch must not write into the shared raw batch
+        assert (state["tweets_raw"].credibility_score == raw_scores).all()
+        assert set(scores) == {f"t{i}" for i in range(5)}
+
+        joined = module.credibility_filter_node({**state, "credibility_scores": scores})
+        inline = module.credibility_filter_node(self._state())
+        assert [t.id for t in joined["tweets_filtered"]] == [
+            t.id for t in inline["tweets_filtered"]
+        ]
+        assert [t.credibility_score for t in joined["tweets_filtered"]] == [
+            t.credibility_score for t in inline["tweets_filtered"]
+        ]
@@ -0,0 +1,76 @@
+"""Tests for near-duplicate collapsing."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.scoring.dedup import collapse_duplicates, near_duplicate_groups, normalise
+
+TAKE = "The refs absolutely robbed the Lions today. That no-call in the end zone changed the game."
+
+
+def _tweet(i: int, text: str, engagement: float = 10.0) -> Tweet:
+    return Tweet(
+        id=str(i),
+        text=text,
+        created_at=datetime.now(timezone.utc),
+        author=TweetAuthor(id="a", username="u", name="n"),
+        metrics=TweetMetrics(),
+        engagement_score=engagement,
+    )
+
+
+class TestNormalise:
+    def test_strips_links_and_mentions(self):
+        assert normalise("Wow @NFL  look https://t.co/abc") == "wow look"
+
+
+class TestGroups:
+    def test_copies_grouped_distinct_kept_apart(self):
+        texts = [
+            TAKE,
+            "Mahomes threw four touchdowns in the fourth quarter comeback",
+            f"{TAKE} https://t.co/xyz",
+            f"@someone {TAKE}",
+            "Bills defense had six sacks and three turnovers",
+        ]
+        groups = near_duplicate_groups(texts)
+        assert [0, 2, 3] in groups
+        assert [1] in groups and [4] in groups
+
+    def test_threshold(self):
+        edited = TAKE.replace("Lions", "Packers").replace("today", "tonight")
+        assert len(near_duplicate_groups([TAKE, edited], threshold=0.5)) == 1
+        assert len(near_duplicate_groups([TAKE, edited], threshold=0.99)) == 2
+
+    def test_empty_texts_never_match(self):
+        assert near_duplicate_groups(["https://t.co/a", "https://t.co/b"]) == [[0], [1]]
+
+    def test_scales_near_linearly(self):
+        texts = [f"unique take number {i} about game {i * 7919}" for i in range(5000)]
+        start = time.perf_counter()
+        groups = near_duplicate_groups(texts)
+        assert time.perf_counter() - start < 10
+        assert len(groups) > 4000
+
+
+class TestCollapse:
+    def test_representative_carries_group(self):
+        tweets = [
+            _tweet(1, TAKE, 5.0),
+            _tweet(2, "Something else entirely about the draft", 1.0),
+            _tweet(3, f"{TAKE} 👇", 20.0),
+            _tweet(4, f"RT-style copy: {TAKE}", 2.0),
+        ]
+        collapsed = collapse_duplicates(tweets)
+        assert [t.id for t in collapsed] == ["2", "3"]
+        rep = collapsed[1]
+        assert sorted(rep.duplicate_ids) == ["1", "4"]
+        assert rep.engagement_score == 27.0
+        assert collapsed[0].duplicate_ids == []
+
+    def test_no_duplicates_is_identity(self):
+        tweets = [_tweet(i, f"take {i} on a totally different subject {i * 31}") for i in range(5)]
+        assert [t.id for t in collapse_duplicates(tweets)] == [t.id for t in tweets]
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
 
 from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
 from src.scoring.engagement import (
     compute_raw_engagement,
+    engagement_scores,
     normalise_engagement,
     passes_filter,
     score_tweets,
@@ -100,3 +105,78 @@ class TestScoreTweets:
         assert len(result) >= 1
         if len(result) == 2:
             assert result[0].engagement_score >= result[1].engagement_score
+
+
+class TestVectorisedEquivalence:
+    @staticmethod
+    def _reference(tweets: list[Tweet]) -> list[tuple[str, float]]:
+        """The original per-tweet scoring loop."""
+        scored = []
+        for tw in tweets:
+            if not passes_filter(tw):
+                continue
+            scored.append((tw.id, normalise_engagement(compute_raw_engagement(tw), tw)))
+        scored.sort(key=lambda p: p[1], reverse=True)
+        return scored
+
+    @staticmethod
+    def _random_tweets(n: int, seed: int = 7) -> list[Tweet]:
+        rng = random.Random(seed)
+        tweets = []
+        for i in range(n):
+            tw = _make_tweet(
+                likes=rng.choice([0, rng.randint(0, 50_000)]),
+                retweets=rng.choice([0, rng.randint(0, 10_000)]),
+                quotes=rng.randint(0, 2_000),
+                replies=rng.choice([0, rng.randint(0, 5_000)]),
+                followers=rng.choice([0, 10, 999, 1_000, rng.randint(0, 10_000_000)]),
+                verified=rng.random() < 0.3,
+                tweet_count=rng.randint(0, 100_000),
+            )
+            tw.id = f"t{i}"
+            roll = rng.random()
+            if roll < 0.1:
+                tw.author.created_at = None
+            elif roll < 0.2:
+                tw.author.created_at = datetime(2015, 6, 1, 12, 30)  # naive
+            else:
+                tw.author.created_at = datetime.now(timezone.utc) - timedelta(
+                    days=rng.randint(0, 6000), hours=rng.randint(0, 23),
+                )
+            tweets.append(tw)
+        return tweets
+
+    def test_matches_scalar_functions(self):
+        tweets = self._random_tweets(2_000)
+        expected = self._reference(tweets)
+        result = score_tweets(tweets)
+        assert [t.id for t in result] == [tid for tid, _ in expected]
+        for tw, (_, score) in zip(result, expected):
+            assert tw.engagement_score == pytest.approx(score, rel=1e-12, abs=1e-4)
+
+    def test_arrays_match_scalar_per_row(self):
+        tweets = self._random_tweets(500, seed=11)
+        now = datetime.now(timezone.utc).timestamp()
+        created = np.array([
+            np.nan if (c := t.author.created_at) is None
+            else c.replace(tzinfo=c.tzinfo or timezone.utc).timestamp()
+            for t in tweets
+        ])
+        scores, keep = engagement_scores(
+            [t.metrics.likes for t in tweets],
+            [t.metrics.retweets for t in tweets],
+            [t.metrics.quote_tweets for t in tweets],
+            [t.metrics.replies for t in tweets],
+            [t.author.followers_count for t in tweets],
+            [t.author.tweet_count for t in tweets],
+            [t.author.verified for t in tweets],
+            created,
+            now=now,
+        )
+        for i, tw in enumerate(tweets):
+            assert bool(keep[i]) == passes_filter(tw)
+            expected = normalise_engagement(compute_raw_engagement(tw), tw)
+            assert scores[i] == pytest.approx(expected, rel=1e-12, abs=1e-4)
+
+    def test_empty_batch(self):
+        assert score_tweets([]) == []
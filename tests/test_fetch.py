@@ -0,0 +1,349 @@
+"""Tests for the X API fetch node."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+import tweepy
+
+from src.models.tweets import Tweet, TweetMetrics
+from src.nodes import fetch_tweets as fetch_module
+from src.utils.ingest_state import IngestState
+from src.utils.rate_limit import RateLimiter
+
+
+def _tweet(tid: str, created_at: str = "2026-01-01T12:00:00.000Z") -> dict:
+    return {
+        "id": tid,
+        "text": f"tweet {tid}",
+        "edit_history_tweet_ids": [tid],
+        "author_id": "1",
+        "created_at": created_at,
+        "public_metrics": {"like_count": 1, "retweet_count": 0, "quote_count": 0, "reply_count": 0},
+    }
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200, headers: dict | None = None):
+        self.payload = payload
+        self.status_code = status_code
+        self.reason = "Too Many Requests" if status_code == 429 else "OK"
+        self.headers = headers or {}
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class _FakeClient:
+    """Serves canned results per query, paged by ``max_results``.
+
+    Earlier queries sleep longer so completion order differs from query order.
+    """
+
+    def __init__(
+        self, pages: dict[str, list[str]], delay: float = 0.05, created_at: str | None = None,
+    ):
+        self.pages = pages
+        self.delay = delay
+        self.created_at = created_at
+        self.calls = 0
+        self.since_ids: list = []
+        self.end_times: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def search_recent_tweets(
+        self, query: str, max_results: int = 10, next_token=None, since_id=None, end_time=None,
+        **_kwargs,
+    ):
+        with self._lock:
+            self.calls += 1
+            self.since_ids.append(since_id)
+            self.end_times.append(end_time)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay * (len(self.pages) - list(self.pages).index(query)))
+        with self._lock:
+            self.in_flight -= 1
+        available = [
+            tid for tid in self.pages[query] if since_id is None or int(tid) > int(since_id)
+        ]
+        offset = int(next_token or 0)
+        ids = available[offset : offset + max_results]
+        meta = {}
+        if offset + max_results < len(available):
+            meta["next_token"] = str(offset + max_results)
+        users = [{"id": "1", "name": "Fan", "username": "fan", "verified": False}]
+        return _FakeResponse({
+            "data": [_tweet(tid, self.created_at or "2026-01-01T12:00:00.000Z") for tid in ids],
+            "includes": {"users": users},
+            "meta": meta,
+        })
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch):
+    monkeypatch.setattr(fetch_module.settings, "search_cache_mode", "off")
+    monkeypatch.setattr(fetch_module, "rate_limiter", RateLimiter(sleep=lambda _s: None))
+
+
+def _run(
+    monkeypatch, pages: dict[str, list[str]], concurrency: int,
+) -> tuple[list[str], _FakeClient]:
+    client = _FakeClient(pages)
+    monkeypatch.setattr(fetch_module, "_build_client", lambda: client)
+    monkeypatch.setattr(fetch_module, "build_search_queries", lambda: list(pages))
+    monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "token")
+    monkeypatch.setattr(fetch_module.settings, "fetch_concurrency", concurrency)
+    result = fetch_module.fetch_tweets_node({"tweets_raw": []})
+    return [t.id for t in result["tweets_raw"]], client
+
+
+class TestConcurrentFetch:
+    PAGES = {"q1": ["1", "2"], "q2": ["2", "3"], "q3": ["4", "1"]}
+
+    def test_order_matches_sequential(self, monkeypatch):
+        sequential, _ = _run(monkeypatch, self.PAGES, concurrency=1)
+        concurrent, client = _run(monkeypatch, self.PAGES, concurrency=3)
+        assert sequential == ["1", "2", "3", "4"]
+        assert concurrent == sequential
+        assert client.max_in_flight > 1
+
+    def test_concurrency_limit_respected(self, monkeypatch):
+        _, client = _run(monkeypatch, self.PAGES, concurrency=2)
+        assert client.max_in_flight <= 2
+
+    def test_parsed_fields(self, monkeypatch):
+        client = _FakeClient({"q": ["9"]})
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: client)
+        monkeypatch.setattr(fetch_module, "build_search_queries", lambda: ["q"])
+        monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "token")
+        tweets = fetch_module.fetch_tweets_node({"tweets_raw": []})["tweets_raw"]
+        assert tweets[0].created_at == datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        assert tweets[0].metrics.likes == 1
+        assert tweets[0].author.username == "fan"
+
+
+class TestPagination:
+    WINDOW = (datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+    def test_follows_next_token_up_to_limit(self):
+        client = _FakeClient({"q": [str(i) for i in range(250)]}, delay=0)
+        tweets = list(fetch_module.iter_query_tweets(client, "q", *self.WINDOW, max_tweets=230))
+        assert len(tweets) == 230
+        assert [t.id for t in tweets] == [str(i) for i in range(230)]
+        assert client.calls == 3
+
+    def test_stops_when_results_exhausted(self):
+        client = _FakeClient({"q": [str(i) for i in range(15)]}, delay=0)
+        tweets = list(fetch_module.iter_query_tweets(client, "q", *self.WINDOW, max_tweets=500))
+        assert len(tweets) == 15
+        assert client.calls == 1
+
+    def test_should_stop_ends_pagination(self):
+        client = _FakeClient({"q": [str(i) for i in range(500)]}, delay=0)
+        seen: list = []
+        for tw in fetch_module.iter_query_tweets(
+            client, "q", *self.WINDOW, max_tweets=500, should_stop=lambda: len(seen) >= 100,
+        ):
+            seen.append(tw)
+        assert len(seen) == 100
+        assert client.calls == 1
+
+    def test_global_limit(self, monkeypatch):
+        monkeypatch.setattr(fetch_module.settings, "max_tweets_total", 120)
+        pages = {"q1": [str(i) for i in range(200)], "q2": [str(1000 + i) for i in range(200)]}
+        ids, _ = _run(monkeypatch, pages, concurrency=2)
+        assert len(ids) == 120
+        assert ids[:100] == [str(i) for i in range(100)]
+
+
+class TestSearchCacheReplay:
+    PAGES = {"q1": [str(i) for i in range(30)], "q2": [str(100 + i) for i in range(5)]}
+
+    def test_record_then_replay_without_client(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(fetch_module.settings, "search_cache_dir", str(tmp_path))
+        monkeypatch.setattr(fetch_module.settings, "search_cache_mode", "readwrite")
+        monkeypatch.setattr(fetch_module.settings, "max_tweets_per_query", 20)
+        recorded, client = _run(monkeypatch, self.PAGES, concurrency=2)
+        assert len(recorded) == 25
+        assert client.calls == 2
+
+        def _no_client():
+            raise AssertionError("replay must not build a client")
+
+        monkeypatch.setattr(fetch_module.settings, "search_cache_mode", "replay")
+        monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "")
+        monkeypatch.setattr(fetch_module, "_build_client", _no_client)
+        result = fetch_module.fetch_tweets_node({"tweets_raw": []})
+        assert [t.id for t in result["tweets_raw"]] == recorded
+
+    def test_rerun_within_ttl_hits_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(fetch_module.settings, "search_cache_dir", str(tmp_path))
+        monkeypatch.setattr(fetch_module.settings, "search_cache_mode", "readwrite")
+        first, _ = _run(monkeypatch, self.PAGES, concurrency=2)
+        second, client = _run(monkeypatch, self.PAGES, concurrency=2)
+        assert second == first
+        assert client.calls == 0
+
+    def test_replay_without_recording_reports_error(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(fetch_module.settings, "search_cache_dir", str(tmp_path))
+        monkeypatch.setattr(fetch_module.settings, "search_cache_mode", "replay")
+        result = fetch_module.fetch_tweets_node({"tweets_raw": []})
+        assert len(result["tweets_raw"]) == 0
+        assert "no recorded window" in result["error"]
+
+
+class TestIncrementalFetch:
+    def test_second_run_fetches_only_delta(self, monkeypatch, tmp_path):
+        recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        monkeypatch.setattr(fetch_module.settings, "incremental_fetch", True)
+        monkeypatch.setattr(fetch_module.settings, "ingest_state_dir", str(tmp_path))
+        monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "token")
+        monkeypatch.setattr(fetch_module.settings, "fetch_concurrency", 1)
+        monkeypatch.setattr(fetch_module, "build_search_queries", lambda: ["q"])
+
+        first = _FakeClient({"q": ["12", "11", "10"]}, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: first)
+        ids = [t.id for t in fetch_module.fetch_tweets_node({"tweets_raw": []})["tweets_raw"]]
+        assert ids == ["12", "11", "10"]
+        assert first.since_ids == [None]
+
+        second = _FakeClient({"q": ["14", "13", "12", "11", "10"]}, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: second)
+        ids = [t.id for t in fetch_module.fetch_tweets_node({"tweets_raw": []})["tweets_raw"]]
+        assert second.since_ids == ["12"]
+        assert ids == ["14", "13", "12", "11", "10"]
+
+    def test_tweets_cut_by_global_cap_are_fetched_next_run(self, monkeypatch, tmp_path):
+        recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        monkeypatch.setattr(fetch_module.settings, "incremental_fetch", True)
+        monkeypatch.setattr(fetch_module.settings, "ingest_state_dir", str(tmp_path))
+        monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "token")
+        monkeypatch.setattr(fetch_module.settings, "fetch_concurrency", 1)
+        monkeypatch.setattr(fetch_module.settings, "max_tweets_total", 3)
+        monkeypatch.setattr(fetch_module, "build_search_queries", lambda: ["a", "b"])
+        pages = {"a": ["12", "11"], "b": ["22", "21"]}
+
+        first = _FakeClient(pages, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: first)
+        fetch_module.fetch_tweets_node({"tweets_raw": []})
+        # "a" was kept whole; "b" lost 21 to the cap, so its watermark stays put
+        second = _FakeClient(pages, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: second)
+        monkeypatch.setattr(fetch_module.settings, "max_tweets_total", 10)
+        ids = [t.id for t in fetch_module.fetch_tweets_node({"tweets_raw": []})["tweets_raw"]]
+        assert second.since_ids == ["12", None]
+        assert sorted(ids) == ["11", "12", "21", "22"]
+
+    @pytest.mark.parametrize("setting, value", [
+        ("max_tweets_total", 100),       # budget exhausted before the second page
+        ("max_tweets_per_query", 20),    # per-query cap hit with a next_token pending
+    ])
+    def test_query_stopped_early_keeps_watermark(self, setting, value, monkeypatch, tmp_path):
+        recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        monkeypatch.setattr(fetch_module.settings, "incremental_fetch", True)
+        monkeypatch.setattr(fetch_module.settings, "ingest_state_dir", str(tmp_path))
+        monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "token")
+        monkeypatch.setattr(fetch_module.settings, setting, value)
+        monkeypatch.setattr(fetch_module, "build_search_queries", lambda: ["q"])
+        client = _FakeClient({"q": [str(1000 - i) for i in range(150)]}, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: client)
+
+        tweets = fetch_module.fetch_tweets_node({"tweets_raw": []})["tweets_raw"]
+        assert len(tweets) == value
+        assert "q" not in IngestState.load(tmp_path).watermarks
+
+    def test_refresh_within_cache_ttl_slides_window(self, monkeypatch, tmp_path):
+        recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        monkeypatch.setattr(fetch_module.settings, "incremental_fetch", True)
+        monkeypatch.setattr(fetch_module.settings, "ingest_state_dir", str(tmp_path / "ingest"))
+        monkeypatch.setattr(fetch_module.settings, "search_cache_mode", "readwrite")
+        monkeypatch.setattr(fetch_module.settings, "search_cache_dir", str(tmp_path / "search"))
+        monkeypatch.setattr(fetch_module.settings, "x_bearer_token", "token")
+        monkeypatch.setattr(fetch_module, "build_search_queries", lambda: ["q"])
+
+        first = _FakeClient({"q": ["11", "10"]}, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: first)
+        fetch_module.fetch_tweets_node({"tweets_raw": []})
+        time.sleep(0.01)
+        second = _FakeClient({"q": ["12", "11", "10"]}, delay=0, created_at=recent)
+        monkeypatch.setattr(fetch_module, "_build_client", lambda: second)
+        ids = [t.id for t in fetch_module.fetch_tweets_node({"tweets_raw": []})["tweets_raw"]]
+        assert second.end_times[0] > first.end_times[0]
+        assert ids == ["12", "11", "10"]
+
+
+class TestRateLimitedFetch:
+    WINDOW = (datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+    def test_429_is_retried_after_reset_instead_of_dropped(self, monkeypatch):
+        waits: list[float] = []
+        limiter = RateLimiter(clock=lambda: 1000.0, sleep=waits.append)
+        monkeypatch.setattr(fetch_module, "rate_limiter", limiter)
+        client = _FakeClient({"q": ["1", "2"]}, delay=0)
+        real_search = client.search_recent_tweets
+        calls = {"n": 0}
+
+        def flaky_search(**kwargs):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                headers = {"x-rate-limit-remaining": "0", "x-rate-limit-reset": "1060"}
+                raise tweepy.TooManyRequests(_FakeResponse({}, status_code=429, headers=headers))
+            return real_search(**kwargs)
+
+        client.search_recent_tweets = flaky_search
+        tweets = list(fetch_module.iter_query_tweets(client, "q", *self.WINDOW, max_tweets=10))
+        assert [t.id for t in tweets] == ["1", "2"]
+        assert waits == [60.0]
+
+    def test_wait_beyond_max_stops_query_with_report(self, monkeypatch, caplog):
+        limiter = RateLimiter(clock=lambda: 1000.0, max_wait_seconds=30)
+        limiter.update(
+            fetch_module.SEARCH_ENDPOINT,
+            {"x-rate-limit-remaining": "0", "x-rate-limit-reset": "1600"},
+        )
+        monkeypatch.setattr(fetch_module, "rate_limiter", limiter)
+        client = _FakeClient({"q": ["1"]}, delay=0)
+        tweets = list(fetch_module.iter_query_tweets(client, "q", *self.WINDOW, max_tweets=10))
+        assert tweets == []
+        assert client.calls == 0
+        assert "600s" in caplog.text
+
+
+class TestFastParse:
+    def test_matches_tweepy_object_path(self):
+        from benchmarks.bench_parse import synthetic_page, tweepy_path
+
+        payload = synthetic_page(0, size=25, authors=10)
+        payload["data"][3]["author_id"] = "999"  # author missing from includes
+        del payload["data"][4]["created_at"]
+        expected = tweepy_path(payload)
+        result = fetch_module._page_tweets(payload)
+        for fast, slow in zip(result, expected):
+            fast_dump, slow_dump = fast.model_dump(), slow.model_dump()
+            if fast.id == payload["data"][4]["id"]:
+                fast_dump.pop("created_at"), slow_dump.pop("created_at")
+            assert fast_dump == slow_dump
+        assert len(result) == len(expected) == 25
+
+    def test_authors_shared_across_pages(self):
+        from benchmarks.bench_parse import synthetic_page
+
+        authors: dict = {}
+        first = fetch_module._page_tweets(synthetic_page(0, size=10, authors=5), authors)
+        second = fetch_module._page_tweets(synthetic_page(0, size=10, authors=5), authors)
+        assert first[0].author is second[0].author
+        assert len(authors) == 5
+
+    def test_every_field_passed_explicitly(self):
+        # Fields left to model_construct's defaults run their default_factory per tweet
+        from benchmarks.bench_parse import synthetic_page
+
+        tweet = fetch_module._page_tweets(synthetic_page(0, size=1, authors=1))[0]
+        assert tweet.model_fields_set == set(Tweet.model_fields)
+        assert tweet.metrics.model_fields_set == set(TweetMetrics.model_fields)
@@ -0,0 +1,112 @@
+"""Tests for the pipeline graph topology, timings and resume routing."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src import graph as graph_module
+from src.models.batch import TweetBatch
+from src.models.script import FinalScript, ScriptOutline
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.utils.timing import critical_path, timing_report
+
+DELAY = 0.2
+
+
+def _batch() -> TweetBatch:
+    tweet = Tweet(
+        id="t1", text="Refs robbed the Lions", created_at=datetime.now(timezone.utc),
+        author=TweetAuthor(id="a1", username="u", name="U"), metrics=TweetMetrics(),
+    )
+    return TweetBatch.from_tweets([tweet])
+
+
+def _slow(update: dict, delay: float = DELAY):
+    def node(_state):
+        time.sleep(delay)
+        return update
+
+    return node
+
+
+@pytest.fixture
+def stub_nodes(monkeypatch):
+    script = FinalScript(title="t", thumbnail_text="t", description="d")
+    stubs = {
+        "fetch_tweets_node": _slow({"tweets_raw": _batch(), "error": ""}, 0),
+        "engagement_scoring_node": _slow({"tweets_scored": _batch()}),
+        "credibility_scoring_node": _slow({"credibility_scores": {"t1": 50.0}}),
+        "credibility_filter_node": _slow({"tweets_filtered": [], "error": ""}, 0),
+        "sentiment_clustering_node": _slow({"sentiment_clusters": []}, 0),
+        "narrative_extraction_node": _slow({"dominant_narratives": []}, 0),
+        "script_outline_node": _slow(
+            {"script_outline": ScriptOutline(title="o", thumbnail_hook="h")}
+        ),
+        "select_samples_node": _slow({"sample_tweets": "- @u"}, 0.05),
+        "script_generation_node": _slow({"final_script": script, "error": ""}, 0),
+        "quality_check_node": _slow({"quality_passed": True, "quality_feedback": ""}, 0),
+    }
+    for name, node in stubs.items():
+        monkeypatch.setattr(graph_module, name, node)
+    monkeypatch.setattr(graph_module.settings, "script_candidates", 1)
+
+
+class TestTopology:
+    def test_independent_stages_run_concurrently(self, stub_nodes):
+        start = time.perf_counter()
+        state = graph_module.build_graph().invoke({"retry_count": 0})
+        elapsed = time.perf_counter() - start
+
+        # Two pairs of 0.2s branches: ~0.4s on the critical path, not 0.8s in sequence
+        assert elapsed < 0.65
+        timings = state["node_timings"]
+        assert {"engagement_scoring", "credibility_scoring", "select_samples"} <= set(timings)
+        eng, cred = timings["engagement_scoring"][0], timings["credibility_scoring"][0]
+        assert eng[0] < cred[1] and cred[0] < eng[1]          # overlapping runs
+        assert state["sample_tweets"] == "- @u"
+
+        path = [name for name, _start, _end in critical_path(timings)]
+        assert path[0] == "fetch_tweets" and path[-1] == "quality_check"
+        assert "script_outline" in path and "select_samples" not in path
+        assert "Critical path" in timing_report(timings)
+
+    def test_resume_at_parallel_group(self, stub_nodes):
+        recorded: list[str] = []
+        state = graph_module.build_graph(
+            entry=list(graph_module.SCORING_BRANCHES),
+            on_node=lambda name, _update: recorded.append(name),
+        ).invoke({"retry_count": 0, "tweets_raw": _batch()})
+        assert "fetch_tweets" not in recorded
+        assert recorded[-1] == "quality_check"
+        assert state["final_script"] is not None
+
+
+class TestCriticalPath:
+    def test_walks_back_through_blocking_runs(self):
+        timings = {
+            "a": [[0.0, 1.0]],
+            "b": [[1.0, 3.0]],
+            "c": [[1.0, 1.5]],
+            "d": [[3.0, 4.0]],
+        }
+        assert [name for name, *_ in critical_path(timings)] == ["a", "b", "d"]
+
+    def test_empty(self):
+        assert critical_path({}) == []
+        assert timing_report({}) == "No node timings recorded."
+
+
+class TestResumeEntry:
+    def test_parallel_groups(self):
+        entry = graph_module.resume_entry
+        assert entry(["fetch_tweets", "engagement_scoring"], {}) == [
+            "engagement_scoring", "credibility_scoring",
+        ]
+        assert entry(["fetch_tweets", "credibility_scoring", "engagement_scoring"], {}) == [
+            "credibility_filter",
+        ]
+        assert entry(["narrative_extraction"], {}) == ["script_outline", "select_samples"]
+        assert entry(["script_outline", "select_samples"], {}) == ["script_generation"]
@@ -0,0 +1,57 @@
+"""Tests for persisted incremental-ingestion state."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.utils.ingest_state import IngestState
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _tweet(tid: str, hours_ago: float = 1.0) -> Tweet:
+    return Tweet(
+        id=tid,
+        text=f"tweet {tid}",
+        created_at=NOW - timedelta(hours=hours_ago),
+        author=TweetAuthor(id="a", username="u", name="n"),
+        metrics=TweetMetrics(likes=1),
+    )
+
+
+class TestIngestState:
+    def test_advance_tracks_newest_id(self):
+        state = IngestState("unused")
+        state.advance("q", [_tweet("5"), _tweet("9"), _tweet("7")])
+        assert state.since_id("q", NOW - timedelta(hours=12)) == "9"
+        state.advance("q", [_tweet("8")])
+        assert state.since_id("q", NOW - timedelta(hours=12)) == "9"
+
+    def test_watermark_outside_window_ignored(self):
+        state = IngestState("unused")
+        state.advance("q", [_tweet("9", hours_ago=20)])
+        assert state.since_id("q", NOW - timedelta(hours=12)) is None
+        assert state.since_id("other", NOW - timedelta(hours=12)) is None
+
+    def test_merge_keeps_fresh_first_and_prunes_window(self):
+        state = IngestState("unused")
+        state.tweets = [_tweet("3"), _tweet("2", hours_ago=13), _tweet("1")]
+        merged = state.merge([_tweet("5"), _tweet("3")], NOW - timedelta(hours=12))
+        assert [t.id for t in merged] == ["5", "3", "1"]
+        assert state.tweets == merged
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        state = IngestState(tmp_path)
+        state.advance("q", [_tweet("9")])
+        state.merge([_tweet("9"), _tweet("4")], NOW - timedelta(hours=12))
+        state.save()
+
+        loaded = IngestState.load(tmp_path)
+        assert loaded.since_id("q", NOW - timedelta(hours=12)) == "9"
+        assert [t.id for t in loaded.tweets] == ["9", "4"]
+
+    def test_load_missing_directory_is_empty(self, tmp_path):
+        loaded = IngestState.load(tmp_path / "missing")
+        assert loaded.watermarks == {}
+        assert loaded.tweets == []
@@ -0,0 +1,61 @@
+"""Tests for incremental section parsing of streamed JSON."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.utils.json_stream import SectionStreamParser
+
+DOC = {
+    "title": 'The "Refs" {Game}',
+    "tags": ["nfl", "refs"],
+    "sections": [
+        {"section_name": "Hook", "content": "Tricky text: } ] { , \\ \" end"},
+        {"section_name": "Build", "content": "More", "meta": {"nested": [1, 2]}},
+        {"section_name": "CTA", "content": "Subscribe"},
+    ],
+    "description": "desc",
+}
+
+
+def _feed(text: str, size: int, on_section=None) -> SectionStreamParser:
+    parser = SectionStreamParser(on_section)
+    for i in range(0, len(text), size):
+        parser.feed(text[i : i + size])
+    return parser
+
+
+class TestSectionStreamParser:
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 10_000])
+    def test_any_chunking_gives_the_full_document(self, size):
+        emitted: list[dict] = []
+        parser = _feed(json.dumps(DOC, indent=2), size, emitted.append)
+        assert parser.complete
+        assert parser.result() == DOC
+        assert emitted == DOC["sections"]
+
+    def test_sections_emitted_as_soon_as_they_close(self):
+        text = json.dumps(DOC)
+        emitted: list[dict] = []
+        parser = SectionStreamParser(emitted.append)
+        first_end = text.index('"Build"')
+        parser.feed(text[:first_end])
+        assert [s["section_name"] for s in emitted] == ["Hook"]
+        parser.feed(text[first_end:])
+        assert len(emitted) == 3
+
+    def test_truncated_stream_keeps_completed_parts(self):
+        text = json.dumps(DOC)
+        parser = _feed(text[: text.index('"CTA"') + 8], 7)
+        assert not parser.complete
+        result = parser.result()
+        assert [s["section_name"] for s in result["sections"]] == ["Hook", "Build"]
+        assert result["title"] == DOC["title"]
+        assert result["tags"] == DOC["tags"]
+        assert "description" not in result
+
+    def test_code_fences_ignored(self):
+        parser = _feed("```json\n" + json.dumps(DOC) + "\n```", 3)
+        assert parser.result() == DOC
@@ -0,0 +1,50 @@
+"""Tests for the single-pass keyword matcher."""
+
+from __future__ import annotations
+
+import random
+
+from src.scoring.credibility import (
+    FORMER_PLAYER_KEYWORDS,
+    INSIDER_KEYWORDS,
+    MAJOR_OUTLETS,
+)
+from src.scoring.keywords import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    def test_counts_per_category(self):
+        matcher = KeywordMatcher({"a": ["espn", "analyst"], "b": ["pro bowl"]})
+        assert matcher.count("ESPN Analyst, 3x Pro Bowl") == {"a": 2, "b": 1}
+        assert matcher.count("") == {"a": 0, "b": 0}
+
+    def test_overlapping_and_nested_keywords(self):
+        matcher = KeywordMatcher({"outlet": ["nfl", "nflnetwork", "network", "espn"]})
+        assert matcher.match("@NFLNetwork") == {"nfl", "nflnetwork", "network"}
+
+    def test_repeated_keyword_counted_once(self):
+        matcher = KeywordMatcher({"a": ["host"]})
+        assert matcher.count("host host host") == {"a": 1}
+
+    def test_regex_metacharacters_escaped(self):
+        matcher = KeywordMatcher({"a": ["ex-nfl", "c++"]})
+        assert matcher.count("ex-NFL and C++ fan") == {"a": 2}
+        assert matcher.count("exxnfl") == {"a": 0}
+
+    def test_matches_naive_substring_counts(self):
+        categories = {
+            "insider": INSIDER_KEYWORDS,
+            "former": FORMER_PLAYER_KEYWORDS,
+            "outlet": MAJOR_OUTLETS,
+        }
+        matcher = KeywordMatcher(categories)
+        vocab = sorted(set(INSIDER_KEYWORDS + FORMER_PLAYER_KEYWORDS + MAJOR_OUTLETS))
+        vocab += ["football", "fan", "the", "Senior", "NFL", "writer", "x", "network"]
+        rng = random.Random(3)
+        for _ in range(500):
+            text = rng.choice(["", " ", "_"]).join(rng.choices(vocab, k=rng.randint(0, 8)))
+            lower = text.lower()
+            expected = {
+                name: sum(1 for kw in set(kws) if kw in lower) for name, kws in categories.items()
+            }
+            assert matcher.count(text) == expected, text
@@ -0,0 +1,76 @@
+"""Tests for the lexicon sentiment scorer."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.config import Settings
+from src.scoring.lexicon import score_sentiment
+
+DEFAULT_MIN_CONFIDENCE = Settings.model_fields["sentiment_lexicon_min_confidence"].default
+
+
+class TestPolarity:
+    @pytest.mark.parametrize("text, expected", [
+        ("The Bills defense is SCARY good right now. Elite unit 🔥", "positive"),
+        ("The refs absolutely ROBBED the Lions. Pathetic officiating.", "negative"),
+        ("Kickoff is at 1pm ET on CBS", "neutral"),
+        ("Great throw, but that defense was awful and embarrassing", "negative"),
+    ])
+    def test_labels(self, text, expected):
+        assert score_sentiment(text).sentiment == expected
+
+    def test_negation_flips(self):
+        assert score_sentiment("that was good").sentiment == "positive"
+        assert score_sentiment("that was not good").sentiment == "negative"
+
+    def test_caps_and_exclamation_amplify(self):
+        plain = score_sentiment("the offense is elite")
+        loud = score_sentiment("the offense is ELITE!!!")
+        assert loud.intensity > plain.intensity
+
+    def test_booster_amplifies(self):
+        boosted = score_sentiment("absolutely terrible")
+        assert boosted.intensity > score_sentiment("terrible").intensity
+
+
+class TestConfidence:
+    def test_no_signal_is_not_confident(self):
+        assert score_sentiment("Chiefs vs Bills tonight").confidence == 0.0
+
+    def test_more_evidence_is_more_confident(self):
+        one = score_sentiment("good")
+        many = score_sentiment("elite, clutch, the GOAT 🐐")
+        assert many.confidence > one.confidence
+        assert many.confidence >= 0.6
+
+    @pytest.mark.parametrize("text, expected", [
+        ("ROBBED", "negative"),
+        ("SCARY good", "positive"),
+        ("Refs ROBBED us!!!", "negative"),
+    ])
+    def test_short_emphatic_tweets_clear_default_threshold(self, text, expected):
+        result = score_sentiment(text)
+        assert result.sentiment == expected
+        assert result.confidence >= DEFAULT_MIN_CONFIDENCE
+
+    @pytest.mark.parametrize("text", ["good", "lost!", "not elite"])
+    def test_single_mild_term_stays_below_threshold(self, text):
+        assert score_sentiment(text).confidence < DEFAULT_MIN_CONFIDENCE
+
+    def test_conflict_lowers_confidence(self):
+        clean = score_sentiment("elite and clutch")
+        conflicted = score_sentiment("elite and clutch but trash and washed")
+        assert conflicted.confidence < clean.confidence
+
+    def test_deterministic(self):
+        text = "Lamar is the MVP 🔥🔥 let's go"
+        assert score_sentiment(text) == score_sentiment(text)
+
+
+class TestExtras:
+    def test_controversy_emotion(self):
+        assert score_sentiment("the refs robbed us, rigged").emotion == "controversy"
+
+    def test_key_phrases_strongest_first(self):
+        assert score_sentiment("good, amazing").key_phrases[0] == "amazing"
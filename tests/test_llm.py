@@ -0,0 +1,90 @@
+"""Tests for the shared LLM client registry."""
+
+from __future__ import annotations
+
+import threading
+
+import httpx
+import pytest
+
+from src.utils import llm as llm_module
+
+
+@pytest.fixture(autouse=True)
+def _registry(monkeypatch):
+    monkeypatch.setattr(llm_module.settings, "openai_api_key", "sk-test")
+    llm_module.close_llm_clients()
+    yield
+    llm_module.close_llm_clients()
+
+
+class TestRegistry:
+    def test_same_config_reuses_client(self):
+        a = llm_module.get_llm(temperature=0.3, max_tokens=100)
+        b = llm_module.get_llm(temperature=0.3, max_tokens=100)
+        assert a is b
+
+    def test_configs_get_separate_clients_on_one_pool(self):
+        a = llm_module.get_llm(temperature=0.3, max_tokens=100)
+        b = llm_module.get_llm(temperature=0.7, max_tokens=100)
+        assert a is not b
+        assert a.temperature == 0.3 and b.temperature == 0.7
+        assert a.http_client is b.http_client is llm_module.get_http_client()
+
+    def test_pool_limits_from_settings(self, monkeypatch):
+        monkeypatch.setattr(llm_module.settings, "llm_max_connections", 3)
+        client = llm_module.get_http_client()
+        pool = client._transport._pool
+        assert pool._max_connections == 3
+
+    def test_concurrent_lookups_build_once(self):
+        results = []
+
+        def worker():
+            results.append(llm_module.get_llm(temperature=0.5, max_tokens=64))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(r is results[0] for r in results)
+
+    def test_close_resets(self):
+        a = llm_module.get_llm(temperature=0.3, max_tokens=100)
+        llm_module.close_llm_clients()
+        assert llm_module.get_llm(temperature=0.3, max_tokens=100) is not a
+
+
+class TestPrewarm:
+    def test_builds_clients_and_opens_connections(self):
+        requests: list[str] = []
+        transport = httpx.MockTransport(
+            lambda request: requests.append(str(request.url)) or httpx.Response(200)
+        )
+        llm_module._http_client = httpx.Client(transport=transport)
+
+        llm_module.prewarm_llm(
+            [lambda: llm_module.get_llm(temperature=0.1, max_tokens=10)], connections=3,
+        )
+        assert len(requests) == 3
+        assert requests[0].endswith("/models")
+        assert len(llm_module._clients) == 1
+
+    def test_failures_are_swallowed(self):
+        def refuse(_request):
+            raise httpx.ConnectError("offline")
+
+        llm_module._http_client = httpx.Client(transport=httpx.MockTransport(refuse))
+        llm_module.prewarm_llm([lambda: llm_module.get_llm(temperature=0.1, max_tokens=10)])
+
+        def sdk_error(_request):
+            raise RuntimeError("invalid api key")
+
+        llm_module._http_client = httpx.Client(transport=httpx.MockTransport(sdk_error))
+        llm_module.prewarm_llm([lambda: llm_module.get_llm(temperature=0.1, max_tokens=10)])
+
+        def broken():
+            raise RuntimeError("no key")
+
+        llm_module.prewarm_llm([broken])
@@ -0,0 +1,137 @@
+"""Tests for the LLM response cache."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.utils.llm import LLMCallCancelled, cached_invoke, parse_json_response, stream_invoke
+from src.utils.llm_cache import LLMCache, MemoryBackend, SQLiteBackend
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class _Reply:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _FakeLLM:
+    model_name = "gpt-test"
+    temperature = 0.3
+    max_tokens = 100
+
+    def __init__(self, replies: list[str]):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def invoke(self, _messages):
+        self.calls += 1
+        return _Reply(self.replies.pop(0))
+
+
+class TestKey:
+    def test_stable(self):
+        a = LLMCache.key(model="m", temperature=0.2, max_tokens=10, messages=MESSAGES)
+        b = LLMCache.key(model="m", temperature=0.2, max_tokens=10, messages=list(MESSAGES))
+        assert a == b
+
+    @pytest.mark.parametrize("change", [
+        {"model": "other"}, {"temperature": 0.9}, {"max_tokens": 11},
+        {"messages": [{"role": "user", "content": "bye"}]}, {"tag": "attempt-1"},
+    ])
+    def test_every_input_matters(self, change):
+        base = {"model": "m", "temperature": 0.2, "max_tokens": 10, "messages": MESSAGES}
+        assert LLMCache.key(**base) != LLMCache.key(**{**base, **change})
+
+
+class TestSQLiteBackend:
+    def test_roundtrip_and_persistence(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "llm.sqlite")
+        backend.set("k", "v")
+        backend.close()
+        assert SQLiteBackend(tmp_path / "llm.sqlite").get("k") == "v"
+
+    def test_ttl_expiry(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "llm.sqlite", ttl_seconds=-1)
+        backend.set("k", "v")
+        assert backend.get("k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "llm.sqlite", max_entries=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+        backend.set("c", "3")
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+
+
+class TestCachedInvoke:
+    def test_second_call_is_served_from_cache(self):
+        cache = LLMCache(MemoryBackend())
+        llm = _FakeLLM(['{"x": 1}'])
+        assert cached_invoke(llm, MESSAGES, cache=cache) == {"x": 1}
+        assert cached_invoke(llm, MESSAGES, cache=cache) == {"x": 1}
+        assert llm.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+
+    def test_unparseable_reply_is_not_cached(self):
+        cache = LLMCache(MemoryBackend())
+        llm = _FakeLLM(["not json", '{"x": 1}'])
+        with pytest.raises(json.JSONDecodeError):
+            cached_invoke(llm, MESSAGES, cache=cache)
+        assert cached_invoke(llm, MESSAGES, cache=cache) == {"x": 1}
+        assert llm.calls == 2
+
+    def test_readonly_never_writes(self):
+        backend = MemoryBackend()
+        cache = LLMCache(backend, mode="readonly")
+        llm = _FakeLLM(['{"x": 1}', '{"x": 2}'])
+        cached_invoke(llm, MESSAGES, cache=cache)
+        assert cached_invoke(llm, MESSAGES, cache=cache) == {"x": 2}
+        assert len(backend) == 0
+
+    def test_off_bypasses_backend(self):
+        cache = LLMCache(MemoryBackend(), mode="off")
+        llm = _FakeLLM(['{"x": 1}', '{"x": 1}'])
+        cached_invoke(llm, MESSAGES, cache=cache)
+        cached_invoke(llm, MESSAGES, cache=cache)
+        assert llm.calls == 2
+
+    def test_should_stop_cancels_before_the_call(self):
+        cache = LLMCache(MemoryBackend())
+        llm = _FakeLLM(['{"x": 1}'])
+        with pytest.raises(LLMCallCancelled):
+            cached_invoke(llm, MESSAGES, cache=cache, should_stop=lambda: True)
+        assert llm.calls == 0
+
+    def test_should_stop_closes_a_stream_mid_response(self):
+        received: list[str] = []
+        closed: list[bool] = []
+
+        class _Chunked(_FakeLLM):
+            def stream(self, _messages):
+                try:
+                    for part in ('{"x"', ": 1", "}"):
+                        yield _Reply(part)
+                finally:
+                    closed.append(True)
+
+        with pytest.raises(LLMCallCancelled):
+            stream_invoke(
+                _Chunked([]), MESSAGES, on_text=received.append,
+                cache=LLMCache(MemoryBackend()), should_stop=lambda: bool(received),
+            )
+        assert received == ['{"x"'] and closed == [True]
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            LLMCache(MemoryBackend(), mode="replay")
+
+
+def test_parse_strips_code_fences():
+    assert parse_json_response('```json\n[1, 2]\n```') == [1, 2]
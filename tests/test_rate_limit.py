@@ -0,0 +1,89 @@
+"""Tests for the header-aware X API rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils.rate_limit import RateLimiter, RateLimitExceeded
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+
+def _limiter(clock: _Clock, **kwargs) -> RateLimiter:
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestRateLimiter:
+    def test_burst_within_quota_does_not_wait(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=3)
+        assert [limiter.acquire("search") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_exhausted_bucket_waits_for_reset(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=2, window_seconds=900)
+        limiter.acquire("search")
+        limiter.acquire("search")
+        assert limiter.expected_wait("search") == 900.0
+        assert limiter.acquire("search") == 900.0
+        # A second waiter is queued for the same reset, not the next one
+        assert limiter.acquire("search") == 900.0
+        assert limiter.expected_wait("search") == 1800.0
+
+    def test_headers_override_default(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=100)
+        limiter.update("search", {
+            "x-rate-limit-limit": "450",
+            "x-rate-limit-remaining": "0",
+            "x-rate-limit-reset": "1120",
+        })
+        assert limiter.expected_wait("search") == 120.0
+        clock.now = 1120.0
+        assert limiter.expected_wait("search") == 0.0
+        assert limiter.acquire("search") == 0.0
+
+    def test_remaining_caps_local_estimate(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=100)
+        limiter.update("search", {"x-rate-limit-remaining": "1"})
+        limiter.acquire("search")
+        assert limiter.expected_wait("search") > 0
+
+    def test_exhausted_without_headers(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=100, window_seconds=900)
+        limiter.update("search", None, exhausted=True)
+        assert limiter.expected_wait("search") == 900.0
+
+    def test_endpoints_are_independent(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=1)
+        limiter.acquire("search")
+        assert limiter.acquire("users") == 0.0
+
+    def test_max_wait_raises_without_reserving(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=1, window_seconds=900, max_wait_seconds=60)
+        limiter.acquire("search")
+        with pytest.raises(RateLimitExceeded) as info:
+            limiter.acquire("search")
+        assert info.value.wait_seconds == 900.0
+        assert limiter.expected_wait("search") == 900.0
+
+    def test_malformed_headers_ignored(self):
+        clock = _Clock()
+        limiter = _limiter(clock, default_limit=5)
+        limiter.update("search", {"x-rate-limit-remaining": "lots"})
+        assert limiter.acquire("search") == 0.0
@@ -0,0 +1,111 @@
+"""Tests for best-of-N script candidates."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.models.script import FinalScript, QualityReport, ScriptOutline
+from src.nodes import script_candidates as candidates_module
+from src.utils.llm import LLMCallCancelled
+
+# temperature → (seconds to write, overall score, passed)
+Plan = dict[float, tuple[float, float, bool]]
+
+
+@pytest.fixture
+def run(monkeypatch):
+    checked: list[float] = []
+    running: set[float] = set()
+    lock = threading.Lock()
+
+    def configure(plan: Plan, n: int | None = None) -> dict:
+        temps = sorted(plan)
+        monkeypatch.setattr(candidates_module.settings, "script_candidates", n or len(temps))
+        monkeypatch.setattr(candidates_module, "candidate_temperatures", lambda _n: temps)
+
+        def write(_state, *, temperature, stream, should_stop):
+            assert stream is False
+            delay, _score, _passed = plan[temperature]
+            if delay < 0:
+                raise RuntimeError("model down")
+            with lock:
+                running.add(temperature)
+            try:
+                # A streamed reply: the stop check runs between chunks
+                deadline = time.perf_counter() + delay
+                while time.perf_counter() < deadline:
+                    if should_stop():
+                        raise LLMCallCancelled("cancelled")
+                    time.sleep(0.005)
+            finally:
+                with lock:
+                    running.discard(temperature)
+            return FinalScript(title=f"t={temperature}", thumbnail_text="", description="")
+
+        def check(state):
+            script = state["final_script"]
+            temperature = float(script.title[2:])
+            with lock:
+                checked.append(temperature)
+            _delay, score, passed = plan[temperature]
+            script.quality_report = QualityReport(
+                passed=passed, overall_score=score, retention_estimate=0.5, feedback=f"{score}",
+            )
+            return {"quality_passed": passed, "quality_feedback": f"{score}", "error": ""}
+
+        monkeypatch.setattr(candidates_module, "write_script", write)
+        monkeypatch.setattr(candidates_module, "quality_check_node", check)
+        outline = ScriptOutline(title="o", thumbnail_hook="h")
+        return candidates_module.script_candidates_node({"script_outline": outline})
+
+    configure.checked = checked
+    configure.running = running
+    return configure
+
+
+class TestCandidateTemperatures:
+    def test_spread_across_range(self):
+        temps = candidates_module.candidate_temperatures(3)
+        assert temps == [0.55, 0.75, 0.95]
+        assert candidates_module.candidate_temperatures(1) == [0.75]
+
+
+class TestScriptCandidates:
+    def test_first_to_pass_wins_and_rest_abandoned(self, run):
+        start = time.perf_counter()
+        result = run({0.5: (0.05, 80, True), 0.9: (0.5, 95, True)})
+        elapsed = time.perf_counter() - start
+
+        assert result["quality_passed"] is True
+        assert result["final_script"].title == "t=0.5"
+        assert elapsed < 0.3
+        # The slower candidate was stopped mid-write, not left running
+        assert run.running == set()
+        assert run.checked == [0.5]
+
+    def test_best_score_kept_when_none_pass(self, run):
+        result = run({0.5: (0.01, 40, False), 0.7: (0.02, 65, False), 0.9: (0.03, 55, False)})
+        assert result["quality_passed"] is False
+        assert result["final_script"].title == "t=0.7"
+        assert result["quality_feedback"] == "65"
+
+    def test_failed_candidates_skipped(self, run):
+        result = run({0.5: (-1, 0, False), 0.9: (0.01, 75, True)})
+        assert result["final_script"].title == "t=0.9"
+        assert result["error"] == ""
+
+    def test_all_candidates_failing_reports_error(self, run):
+        result = run({0.5: (-1, 0, False), 0.9: (-1, 0, False)})
+        assert result["final_script"] is None
+        assert "all 2 candidates failed (model down)" in result["error"]
+
+
+def test_graph_uses_candidates_node(monkeypatch):
+    from src.graph import build_graph
+
+    monkeypatch.setattr(candidates_module.settings, "script_candidates", 3)
+    nodes = set(build_graph().get_graph().nodes)
+    assert "script_generation" in nodes and "quality_check" not in nodes
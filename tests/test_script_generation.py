@@ -0,0 +1,308 @@
+"""Tests for the script generation node."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+from tenacity import wait_none
+
+from src.models.script import FinalScript, QualityReport, ScriptOutline, ScriptSection
+from src.nodes import script_generation as generation_module
+
+SCRIPT = {
+    "title": "Robbed in Detroit",
+    "thumbnail_text": "ROBBED",
+    "description": "d",
+    "tags": ["nfl"],
+    "estimated_duration_minutes": 10.0,
+    "sections": [
+        {"section_name": "Hook", "timestamp": "0:00-0:20", "content": "Hook text"},
+        {"section_name": "Build", "timestamp": "0:20-1:00", "content": "Build text"},
+        {"section_name": "CTA", "timestamp": "1:00-1:10", "content": "Subscribe"},
+    ],
+}
+
+
+class _Chunk:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _StreamingLLM:
+    model_name = "gpt-test"
+    temperature = 0.7
+    max_tokens = 100
+
+    def __init__(self, text: str, chunk_size: int = 9):
+        self.text = text
+        self.chunk_size = chunk_size
+
+    def stream(self, _messages):
+        for i in range(0, len(self.text), self.chunk_size):
+            yield _Chunk(self.text[i : i + self.chunk_size])
+
+
+def _state() -> dict:
+    outline = ScriptOutline(
+        title="Outline", thumbnail_hook="hook",
+        sections=[ScriptSection(section_name="Hook", timestamp="0:00", content="notes")],
+    )
+    return {"script_outline": outline, "dominant_narratives": [], "tweets_filtered": []}
+
+
+@pytest.fixture
+def streaming(monkeypatch, tmp_path):
+    monkeypatch.setattr(generation_module.settings, "script_streaming", True)
+    monkeypatch.setattr(generation_module.settings, "output_dir", str(tmp_path))
+    seen: list[ScriptSection] = []
+    monkeypatch.setattr(generation_module, "section_callbacks", [seen.append])
+    return seen
+
+
+class TestStreaming:
+    def test_sections_streamed_to_callback_and_draft(self, streaming, monkeypatch, tmp_path):
+        llm = _StreamingLLM(json.dumps(SCRIPT))
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: llm)
+        result = generation_module.script_generation_node(_state())
+
+        assert [s.section_name for s in streaming] == ["Hook", "Build", "CTA"]
+        script = result["final_script"]
+        assert script.title == "Robbed in Detroit"
+        assert [s.content for s in script.sections] == ["Hook text", "Build text", "Subscribe"]
+        draft = next(tmp_path.glob("*_draft.txt")).read_text(encoding="utf-8")
+        assert "## Build" in draft and "Subscribe" in draft
+
+    def test_truncated_response_keeps_completed_sections(self, streaming, monkeypatch):
+        text = json.dumps(SCRIPT)
+        llm = _StreamingLLM(text[: text.index('"CTA"') + 4])
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: llm)
+        result = generation_module.script_generation_node(_state())
+
+        script = result["final_script"]
+        assert result["error"] == ""
+        assert [s.section_name for s in script.sections] == ["Hook", "Build"]
+        assert script.full_text == "Hook text\n\nBuild text"
+
+
+class _SectionLLM:
+    """Answers section prompts after a delay and stitch prompts with bridges."""
+
+    model_name = "gpt-test"
+    max_tokens = 100
+
+    def __init__(self, temperature: float, delay: float = 0.2):
+        self.temperature = temperature
+        self.delay = delay
+
+    def invoke(self, messages):
+        user = messages[-1]["content"]
+        if "BOUNDARIES" in user:
+            return _Chunk(json.dumps({
+                "title": "Stitched title",
+                "tags": ["nfl"],
+                "transitions": [{"after_section": "Hook", "bridge": "But here's the thing."}],
+            }))
+        name = user.split('"', 2)[1]
+        time.sleep(self.delay)
+        return _Chunk(json.dumps({"section_name": name, "content": f"{name} script."}))
+
+
+def _outline(n: int) -> ScriptOutline:
+    names = ["Hook", "Build", "Big Take", "CTA", "Extra"][:n]
+    return ScriptOutline(
+        title="Outline", thumbnail_hook="hook", target_minutes=10,
+        sections=[
+            ScriptSection(section_name=name, timestamp=f"{i}:00-{i + 1}:00", content="notes")
+            for i, name in enumerate(names)
+        ],
+    )
+
+
+class TestSectionParallel:
+    @pytest.fixture(autouse=True)
+    def _mode(self, monkeypatch):
+        monkeypatch.setattr(generation_module.settings, "script_generation_mode", "sections")
+        monkeypatch.setattr(generation_module.settings, "script_streaming", False)
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: pytest.fail("single call"))
+        monkeypatch.setattr(generation_module, "_build_section_llm", lambda *_: _SectionLLM(0.7))
+        monkeypatch.setattr(generation_module, "_build_stitch_llm", lambda: _SectionLLM(0.3))
+
+    def test_sections_written_concurrently_and_stitched_in_order(self):
+        state = {**_state(), "script_outline": _outline(4)}
+        start = time.perf_counter()
+        result = generation_module.script_generation_node(state)
+        elapsed = time.perf_counter() - start
+
+        script = result["final_script"]
+        assert [s.section_name for s in script.sections] == ["Hook", "Build", "Big Take", "CTA"]
+        assert script.sections[0].content == "Hook script. But here's the thing."
+        assert script.sections[1].content == "Build script."
+        assert script.sections[2].timestamp == "2:00-3:00"
+        assert script.title == "Stitched title"
+        assert script.full_text.startswith("Hook script.")
+        # Four 0.2s sections in parallel, not 0.8s back to back
+        assert elapsed < 0.6
+
+    def test_stitch_failure_still_assembles(self, monkeypatch):
+        def broken(*_args, **_kwargs):
+            raise RuntimeError("stitch down")
+
+        monkeypatch.setattr(generation_module, "_stitch", broken)
+        state = {**_state(), "script_outline": _outline(3)}
+        result = generation_module.script_generation_node(state)
+        script = result["final_script"]
+        assert script.title == "Outline"
+        assert [s.content for s in script.sections] == [
+            "Hook script.", "Build script.", "Big Take script.",
+        ]
+
+
+    @pytest.mark.parametrize("reply", [["Build script."], "Build script.", None])
+    def test_non_object_reply_is_retried(self, reply, monkeypatch):
+        monkeypatch.setattr(generation_module._generate_section.retry, "wait", wait_none())
+        llm = _SectionLLM(0.7, delay=0)
+        replies = {"Build": [reply]}
+        invoke = llm.invoke
+
+        def flaky(messages):
+            name = messages[-1]["content"].split('"', 2)[1]
+            if replies.get(name):
+                return _Chunk(json.dumps(replies[name].pop()))
+            return invoke(messages)
+
+        llm.invoke = flaky
+        monkeypatch.setattr(generation_module, "_build_section_llm", lambda *_: llm)
+        state = {**_state(), "script_outline": _outline(3)}
+        script = generation_module.script_generation_node(state)["final_script"]
+        assert script.sections[1].content == "Build script."
+
+    def test_section_that_keeps_failing_is_left_out(self, monkeypatch):
+        monkeypatch.setattr(generation_module._generate_section.retry, "wait", wait_none())
+        llm = _SectionLLM(0.7, delay=0)
+        invoke = llm.invoke
+
+        def broken_build(messages):
+            if messages[-1]["content"].split('"', 2)[1] == "Build":
+                return _Chunk("[]")
+            return invoke(messages)
+
+        llm.invoke = broken_build
+        monkeypatch.setattr(generation_module, "_build_section_llm", lambda *_: llm)
+        state = {**_state(), "script_outline": _outline(3)}
+        result = generation_module.script_generation_node(state)
+        assert not result["error"]
+        assert [s.section_name for s in result["final_script"].sections] == ["Hook", "Big Take"]
+
+
+class _ReviseLLM:
+    model_name = "gpt-test"
+    temperature = 0.7
+    max_tokens = 100
+
+    def __init__(self):
+        self.prompts: list[str] = []
+
+    def invoke(self, messages):
+        user = messages[-1]["content"]
+        self.prompts.append(user)
+        name = user.split('"', 2)[1]
+        return _Chunk(json.dumps({"section_name": name, "content": f"Revised {name}."}))
+
+
+def _failed_script(issues: list[str]) -> FinalScript:
+    script = FinalScript(
+        title="Robbed in Detroit", thumbnail_text="ROBBED", description="d", tags=["nfl"],
+        sections=[ScriptSection(**s) for s in SCRIPT["sections"]],
+    )
+    script.quality_report = QualityReport(
+        passed=False, overall_score=55, retention_estimate=0.4,
+        feedback="The build-up never lands.", issues=issues,
+    )
+    return script
+
+
+class TestTargetedRetry:
+    @pytest.fixture
+    def llm(self, monkeypatch):
+        llm = _ReviseLLM()
+        monkeypatch.setattr(generation_module, "_build_section_llm", lambda *_: llm)
+        monkeypatch.setattr(generation_module.settings, "script_streaming", False)
+        return llm
+
+    def test_only_flagged_sections_rewritten(self, llm, monkeypatch):
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: pytest.fail("full rewrite"))
+        state = {
+            **_state(), "retry_count": 1,
+            "final_script": _failed_script(["[Build] no stats", "[General] flat pacing"]),
+        }
+        result = generation_module.script_generation_node(state)
+
+        script = result["final_script"]
+        assert [s.content for s in script.sections] == ["Hook text", "Revised Build.", "Subscribe"]
+        assert script.title == "Robbed in Detroit"
+        assert script.quality_report is None
+        assert script.full_text == "Hook text\n\nRevised Build.\n\nSubscribe"
+        assert len(llm.prompts) == 1
+        prompt = llm.prompts[0]
+        assert "- no stats" in prompt and "The build-up never lands." in prompt
+        assert "- flat pacing" in prompt
+        assert "Build text" in prompt and "Hook text" in prompt
+
+    def test_unmapped_issues_fall_back_to_full_rewrite(self, llm, monkeypatch):
+        calls = []
+
+        def full(*args):
+            calls.append(args)
+            return SCRIPT
+
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: None)
+        monkeypatch.setattr(generation_module, "_generate_script", full)
+        state = {
+            **_state(), "retry_count": 1,
+            "final_script": _failed_script(["[General] flat pacing"]),
+        }
+        generation_module.script_generation_node(state)
+        assert len(calls) == 1 and not llm.prompts
+
+    def test_missing_outline_section_written_from_outline(self, llm, monkeypatch):
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: pytest.fail("full rewrite"))
+        outline = ScriptOutline(
+            title="Outline", thumbnail_hook="hook", target_minutes=1,
+            sections=[
+                ScriptSection(**{**s, "content": "notes"}) for s in SCRIPT["sections"]
+            ],
+        )
+        # A cut-off stream: the CTA never arrived and the local gate failed it
+        failed = _failed_script([
+            "[CTA] section is missing from the script",
+            "[Build] no stats",
+            "[General] runs ~0.0 min at 150 wpm against a 1 min target",
+        ])
+        failed.sections = failed.sections[:2]
+        failed.quality_report.source = "local"
+        state = {**_state(), "script_outline": outline, "retry_count": 1, "final_script": failed}
+        result = generation_module.script_generation_node(state)
+
+        script = result["final_script"]
+        assert [s.section_name for s in script.sections] == ["Hook", "Build", "CTA"]
+        assert [s.content for s in script.sections] == [
+            "Hook text", "Revised Build.", "Revised CTA.",
+        ]
+        assert script.sections[2].timestamp == "1:00-1:10"
+        assert len(llm.prompts) == 2
+        revise = next(p for p in llm.prompts if p.startswith("A reviewer flagged"))
+        assert "- runs ~0.0 min" in revise and "missing" not in revise
+
+    def test_local_failure_without_missing_sections_rewrites_in_full(self, llm, monkeypatch):
+        calls = []
+        monkeypatch.setattr(generation_module, "_build_llm", lambda *_: None)
+        monkeypatch.setattr(
+            generation_module, "_generate_script", lambda *args: calls.append(args) or SCRIPT,
+        )
+        failed = _failed_script(["[Build] section has no content"])
+        failed.quality_report.source = "local"
+        state = {**_state(), "retry_count": 1, "final_script": failed}
+        generation_module.script_generation_node(state)
+        assert len(calls) == 1 and not llm.prompts
@@ -0,0 +1,145 @@
+"""Tests for the deterministic script quality checks."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.models.script import FinalScript, ScriptOutline, ScriptSection
+from src.nodes import quality_check as quality_module
+from src.scoring.script_quality import GENERAL, check_script, issues_by_section
+
+NAMES = ["Pattern Interrupt Hook", "Big Take", "CTA"]
+
+
+class TestIssuesBySection:
+    def test_bracket_prefix_maps_to_section(self):
+        mapped = issues_by_section(["[Big Take] no numbers behind the claim"], NAMES)
+        assert mapped == {"Big Take": ["no numbers behind the claim"]}
+
+    def test_prefix_is_case_insensitive(self):
+        mapped = issues_by_section(["[cta]: too long"], NAMES)
+        assert mapped == {"CTA": ["too long"]}
+
+    def test_unprefixed_issue_matched_by_mention(self):
+        mapped = issues_by_section(["The Pattern Interrupt Hook drags"], NAMES)
+        assert mapped == {"Pattern Interrupt Hook": ["The Pattern Interrupt Hook drags"]}
+
+    def test_general_and_unknown_issues(self):
+        mapped = issues_by_section(
+            ["[General] pacing is flat", "[Intro] not a section", "sounds robotic"], NAMES,
+        )
+        assert list(mapped) == [GENERAL]
+        assert mapped[GENERAL][0] == "pacing is flat"
+        assert len(mapped[GENERAL]) == 3
+
+
+def _script(sections: list[tuple[str, str, int]]) -> FinalScript:
+    """Build a script from ``(name, timestamp, word count)`` triples with varied words."""
+    counter = iter(range(1_000_000))
+    return FinalScript(
+        title="t", thumbnail_text="t", description="d",
+        sections=[
+            ScriptSection(
+                section_name=name, timestamp=ts,
+                content=" ".join(f"w{next(counter)}" for _ in range(words)) + "." * bool(words),
+            )
+            for name, ts, words in sections
+        ],
+    )
+
+
+def _outline(names: list[str]) -> ScriptOutline:
+    return ScriptOutline(
+        title="t", thumbnail_hook="h", target_minutes=2,
+        sections=[ScriptSection(section_name=n, timestamp="", content="") for n in names],
+    )
+
+
+GOOD = [("Hook", "0:00-0:20", 50), ("Build", "0:20-1:20", 150), ("CTA", "1:20-2:00", 100)]
+
+
+class TestCheckScript:
+    def test_clean_script_scores_full_marks(self):
+        result = check_script(_script(GOOD), _outline(["Hook", "Build", "CTA"]), target_minutes=2)
+        assert result.score == 100
+        assert result.issues == []
+        assert result.word_count == 300 and result.estimated_minutes == 2.0
+        assert not result.critical
+
+    def test_missing_and_empty_sections_are_critical(self):
+        sections = [("Hook", "0:00-0:20", 50), ("Build", "0:20-1:20", 0)]
+        outline = _outline(["Hook", "Build", "CTA"])
+        result = check_script(_script(sections), outline, target_minutes=2)
+        assert result.critical
+        assert "[CTA] section is missing from the script" in result.issues
+        assert "[Build] section has no content" in result.issues
+
+    def test_duration_far_off_target_is_critical(self):
+        result = check_script(_script(GOOD), target_minutes=10)
+        assert result.critical
+        assert result.components["duration"] == 0
+        assert any("~2.0 min" in issue for issue in result.issues)
+
+    def test_timestamp_overlap_and_gap(self):
+        sections = [
+            ("Hook", "0:00-0:20", 50), ("Build", "0:10-1:10", 150), ("CTA", "1:30-2:10", 100),
+        ]
+        result = check_script(_script(sections), target_minutes=2)
+        assert any(i.startswith("[Build]") and "overlaps" in i for i in result.issues)
+        assert any(i.startswith("[CTA]") and "gap" in i for i in result.issues)
+        assert result.components["timestamps"] < 1
+
+    def test_repeated_lines_flagged(self):
+        script = _script(GOOD)
+        line = "This team has no business being in the playoffs."
+        script.sections[0].content += " " + line
+        script.sections[2].content += " " + line
+        result = check_script(script, target_minutes=2)
+        assert any(i.startswith("[CTA] repeats a line from Hook") for i in result.issues)
+
+
+class TestQualityGate:
+    @pytest.fixture
+    def llm_calls(self, monkeypatch):
+        calls: list[str] = []
+
+        def evaluate(_llm, script_json):
+            calls.append(script_json)
+            return {
+                "passed": True, "overall_score": 80, "retention_estimate": 0.5,
+                "feedback": "ok", "issues": ["[Hook] slow open"],
+            }
+
+        monkeypatch.setattr(quality_module, "_build_llm", lambda: None)
+        monkeypatch.setattr(quality_module, "_evaluate_script", evaluate)
+        return calls
+
+    def _run(self, script: FinalScript) -> dict:
+        outline = _outline(["Hook", "Build", "CTA"])
+        state = {"final_script": script, "script_outline": outline}
+        return quality_module.quality_check_node(state)
+
+    def test_broken_script_fails_without_llm(self, llm_calls):
+        result = self._run(_script(GOOD[:1]))
+        assert result["quality_passed"] is False
+        assert result["final_script"].quality_report.source == "local"
+        assert llm_calls == []
+
+    def test_clean_script_skips_llm(self, llm_calls):
+        script = _script(GOOD)
+        script.estimated_duration_minutes = 9.0
+        result = self._run(script)
+        assert result["quality_passed"] is True
+        assert result["final_script"].estimated_duration_minutes == 2.0
+        assert llm_calls == []
+
+    def test_middling_script_goes_to_llm_with_local_issues(self, llm_calls):
+        sections = [
+            ("Hook", "0:00-0:20", 50), ("Build", "0:20-1:20", 150), ("CTA", "1:30-2:00", 100),
+        ]
+        result = self._run(_script(sections))
+        report = result["final_script"].quality_report
+        assert len(llm_calls) == 1
+        assert report.source == "llm"
+        assert report.issues[0].startswith("[CTA] timestamp")
+        assert report.issues[-1] == "[Hook] slow open"
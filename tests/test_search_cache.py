@@ -0,0 +1,77 @@
+"""Tests for the on-disk X API search cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.search_cache import SearchCache
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+END = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _params(query: str = "NFL", token: str | None = None) -> dict:
+    return {"query": query, "start_time": START, "end_time": END, "next_token": token,
+            "tweet_fields": ["created_at"]}
+
+
+class TestSearchCache:
+    def test_roundtrip(self, tmp_path):
+        cache = SearchCache(tmp_path)
+        cache.put(_params(), {"data": [{"id": "1"}]})
+        assert cache.get(_params()) == {"data": [{"id": "1"}]}
+        assert cache.get(_params(token="abc")) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_window_and_fields(self):
+        base = SearchCache.key(_params())
+        assert SearchCache.key({**_params(), "end_time": START}) != base
+        assert SearchCache.key({**_params(), "tweet_fields": ["id"]}) != base
+        assert SearchCache.key(dict(reversed(list(_params().items())))) == base
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = SearchCache(tmp_path, ttl_seconds=0.0)
+        cache.put(_params(), {"data": []})
+        time.sleep(0.01)
+        assert cache.get(_params()) is None
+
+    def test_replay_ignores_ttl_and_never_writes(self, tmp_path):
+        SearchCache(tmp_path, ttl_seconds=0.0).put(_params(), {"data": [{"id": "1"}]})
+        replay = SearchCache(tmp_path, mode="replay", ttl_seconds=0.0)
+        assert replay.get(_params()) == {"data": [{"id": "1"}]}
+        replay.put(_params("other"), {"data": []})
+        assert replay.get(_params("other")) is None
+
+    def test_size_bounded_eviction_is_lru(self, tmp_path):
+        cache = SearchCache(tmp_path, max_bytes=10**9)
+        payload = {"data": ["x" * 1000]}
+        for q in ("a", "b", "c"):
+            cache.put(_params(q), payload)
+        # Make "a" the most recently used, "b" the least
+        for i, q in enumerate(("b", "c", "a")):
+            path = tmp_path / f"{SearchCache.key(_params(q))}.json"
+            os.utime(path, (1000 + i, 1000 + i))
+        entry_size = (tmp_path / f"{SearchCache.key(_params('a'))}.json").stat().st_size
+        cache.max_bytes = int(entry_size * 2.5)
+        cache.put(_params("d"), payload)
+        assert cache.get(_params("b")) is None
+        assert cache.get(_params("c")) is None
+        assert cache.get(_params("a")) is not None
+        assert cache.get(_params("d")) is not None
+
+    def test_recorded_window(self, tmp_path):
+        cache = SearchCache(tmp_path)
+        assert cache.recorded_window() is None
+        cache.save_window(START, END)
+        assert cache.recorded_window() == (START, END)
+        data = json.loads((tmp_path / "window.json").read_text())
+        assert data["end_time"] == END.isoformat()
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            SearchCache(tmp_path, mode="sometimes")
@@ -0,0 +1,203 @@
+"""Tests for the sentiment clustering node."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.tweets import Tweet, TweetAuthor, TweetMetrics
+from src.nodes import sentiment_clustering as sentiment_module
+
+
+def _tweets(n: int) -> list[Tweet]:
+    return [
+        Tweet(
+            id=f"t{i}",
+            text=f"Game take number {i}",
+            created_at=datetime.now(timezone.utc),
+            author=TweetAuthor(id="a", username="u", name="n"),
+            metrics=TweetMetrics(likes=1),
+        )
+        for i in range(n)
+    ]
+
+
+class _FakeAnalyser:
+    """Stands in for ``_analyse_batch``; later batches finish first."""
+
+    def __init__(self, fail_on: frozenset[str] = frozenset()):
+        self.fail_on = fail_on
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, _llm, batch: list[dict]) -> list[dict]:
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02 * (5 - index % 5))
+        with self._lock:
+            self.in_flight -= 1
+        if batch[0]["tweet_id"] in self.fail_on:
+            raise RuntimeError("LLM unavailable")
+        return [
+            {"tweet_id": t["tweet_id"], "sentiment": "positive", "intensity": 0.5}
+            for t in batch
+        ]
+
+
+@pytest.fixture
+def analyser(monkeypatch):
+    fake = _FakeAnalyser()
+    monkeypatch.setattr(sentiment_module, "_build_llm", lambda: None)
+    monkeypatch.setattr(sentiment_module, "_analyse_batch", fake)
+    return fake
+
+
+class TestConcurrentBatches:
+    def test_results_merged_in_tweet_order(self, analyser, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_max_concurrency", 4)
+        tweets = _tweets(95)
+        result = sentiment_module.sentiment_clustering_node({"tweets_filtered": tweets})
+        assert [r["tweet_id"] for r in result["sentiment_clusters"]] == [t.id for t in tweets]
+        assert all(t.sentiment_label == "positive" for t in result["tweets_filtered"])
+        assert 1 < analyser.max_in_flight <= 4
+
+    def test_failed_batch_is_skipped(self, analyser, monkeypatch):
+        analyser.fail_on = frozenset({"t30"})
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_max_concurrency", 2)
+        # 30 tweets per batch from the output budget alone
+        monkeypatch.setattr(
+            sentiment_module.settings, "sentiment_batch_output_tokens",
+            30 * sentiment_module.OUTPUT_TOKENS_PER_TWEET,
+        )
+        tweets = _tweets(90)
+        result = sentiment_module.sentiment_clustering_node({"tweets_filtered": tweets})
+        analysed = {r["tweet_id"] for r in result["sentiment_clusters"]}
+        assert len(analysed) == 60
+        assert "t0" in analysed and "t89" in analysed
+        assert tweets[45].sentiment_label == ""
+
+
+class TestBatchPlanning:
+    def _data(self, texts: list[str]) -> list[dict]:
+        return [
+            {"tweet_id": str(i), "text": text, "engagement_score": 10.0}
+            for i, text in enumerate(texts)
+        ]
+
+    def test_output_budget_caps_batch_size(self, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_batch_output_tokens", 600)
+        batches = sentiment_module.plan_sentiment_batches(self._data(["short take"] * 25))
+        assert [len(b) for b in batches] == [10, 10, 5]
+
+    def test_long_tweets_get_smaller_batches(self, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_batch_input_tokens", 1500)
+        short = sentiment_module.plan_sentiment_batches(self._data(["short take"] * 40))
+        long = sentiment_module.plan_sentiment_batches(self._data(["word " * 200] * 40))
+        assert len(long) > len(short)
+        # Order is preserved and nothing is dropped
+        assert [t["tweet_id"] for b in long for t in b] == [str(i) for i in range(40)]
+
+    def test_prompt_is_compact(self):
+        assert sentiment_module._compact_json([{"a": 1, "b": "é"}]) == '[{"a":1,"b":"é"}]'
+
+
+class TestSentimentStore:
+    @pytest.fixture
+    def store_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "sentiment.sqlite"
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_store_path", str(path))
+        monkeypatch.setattr(sentiment_module, "_store", None)
+        yield path
+        if sentiment_module._store is not None:
+            sentiment_module._store.close()
+
+    def test_second_run_skips_llm(self, analyser, store_path):
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": _tweets(40)})
+        calls = analyser.calls
+        tweets = _tweets(40)
+        result = sentiment_module.sentiment_clustering_node({"tweets_filtered": tweets})
+        assert analyser.calls == calls
+        assert len(result["sentiment_clusters"]) == 40
+        assert all(t.sentiment_label == "positive" for t in tweets)
+
+    def test_only_misses_are_sent(self, analyser, store_path, monkeypatch):
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": _tweets(10)})
+        sent: list[str] = []
+        original = sentiment_module._analyse_batch
+
+        def recording(llm, batch):
+            sent.extend(t["tweet_id"] for t in batch)
+            return original(llm, batch)
+
+        monkeypatch.setattr(sentiment_module, "_analyse_batch", recording)
+        result = sentiment_module.sentiment_clustering_node({"tweets_filtered": _tweets(15)})
+        assert sent == [f"t{i}" for i in range(10, 15)]
+        assert [r["tweet_id"] for r in result["sentiment_clusters"]] == [
+            f"t{i}" for i in range(15)
+        ]
+
+    def test_prompt_change_invalidates(self, analyser, store_path, monkeypatch):
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": _tweets(5)})
+        calls = analyser.calls
+        monkeypatch.setattr(sentiment_module.settings, "openai_model", "another-model")
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": _tweets(5)})
+        assert analyser.calls > calls
+
+    def test_failed_batch_not_stored(self, analyser, store_path):
+        analyser.fail_on = frozenset({"t0"})
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": _tweets(5)})
+        assert len(sentiment_module.get_sentiment_store()) == 0
+
+
+class TestLexiconCascade:
+    def _mixed(self) -> list[Tweet]:
+        tweets = _tweets(4)
+        tweets[0].text = "Elite, clutch, the GOAT 🐐 what a masterclass"
+        tweets[2].text = "Pathetic, embarrassing, trash officiating. ROBBED."
+        return tweets
+
+    def test_confident_tweets_stay_local(self, analyser, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_mode", "cascade")
+        sent: list[str] = []
+        original = sentiment_module._analyse_batch
+
+        def recording(llm, batch):
+            sent.extend(t["tweet_id"] for t in batch)
+            return original(llm, batch)
+
+        monkeypatch.setattr(sentiment_module, "_analyse_batch", recording)
+        tweets = self._mixed()
+        result = sentiment_module.sentiment_clustering_node({"tweets_filtered": tweets})
+        assert sent == ["t1", "t3"]
+        assert tweets[0].sentiment_label == "positive"
+        assert tweets[2].sentiment_label == "negative"
+        assert [r["tweet_id"] for r in result["sentiment_clusters"]] == ["t0", "t1", "t2", "t3"]
+
+    def test_short_emphatic_tweets_stay_local(self, analyser, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_mode", "cascade")
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_lexicon_min_confidence", 0.6)
+        tweets = _tweets(3)
+        for tweet, text in zip(tweets, ["ROBBED", "SCARY good", "Refs ROBBED us!!!"]):
+            tweet.text = text
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": tweets})
+        assert analyser.calls == 0
+        assert [t.sentiment_label for t in tweets] == ["negative", "positive", "negative"]
+
+    def test_llm_mode_sends_everything(self, analyser, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_mode", "llm")
+        sentiment_module.sentiment_clustering_node({"tweets_filtered": self._mixed()})
+        assert analyser.calls == 1
+
+    def test_lexicon_mode_never_calls_llm(self, analyser, monkeypatch):
+        monkeypatch.setattr(sentiment_module.settings, "sentiment_mode", "lexicon")
+        result = sentiment_module.sentiment_clustering_node({"tweets_filtered": self._mixed()})
+        assert analyser.calls == 0
+        assert len(result["sentiment_clusters"]) == 4
@@ -0,0 +1,35 @@
+"""Tests for offline token estimation and batch packing."""
+
+from __future__ import annotations
+
+from src.utils.tokens import estimate_tokens, pack_batches
+
+
+class TestEstimateTokens:
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+    def test_plain_english_is_roughly_a_token_per_word(self):
+        text = "the refs blew that call late in the fourth quarter"
+        assert 10 <= estimate_tokens(text) <= 16
+
+    def test_emoji_and_punctuation_counted(self):
+        assert estimate_tokens("wow!!! 🔥🔥") > estimate_tokens("wow")
+
+    def test_longer_text_costs_more(self):
+        assert estimate_tokens("word " * 100) > estimate_tokens("word " * 10)
+
+
+class TestPackBatches:
+    def test_respects_budget_and_order(self):
+        batches = pack_batches([4, 4, 4, 4, 4], budget=10)
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_respects_max_items(self):
+        assert pack_batches([1] * 5, budget=100, max_items=2) == [[0, 1], [2, 3], [4]]
+
+    def test_oversized_item_gets_own_batch(self):
+        assert pack_batches([2, 50, 2], budget=10) == [[0], [1], [2]]
+
+    def test_empty(self):
+        assert pack_batches([], budget=10) == []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from src.utils.nfl import NFL_TEAMS, build_search_queries
+from src.utils.timestamps import parse_range, range_seconds
 
 
 class TestNFLUtils:
@@ -18,3 +19,14 @@ class TestNFLUtils:
     def test_build_queries_with_extras(self):
         queries = build_search_queries(extra_terms=["Mahomes", "Chiefs"])
         assert len(queries) >= 5  # base 3 + 2 extras
+
+
+class TestTimestamps:
+    def test_parse_range(self):
+        assert parse_range("1:00-3:00") == (60, 180)
+        assert parse_range("9:30–10:00") == (570, 600)
+        assert parse_range("soon") is None
+
+    def test_range_seconds(self):
+        assert range_seconds("0:00 - 0:20") == 20
+        assert range_seconds("3:00-1:00") is None